@@ -0,0 +1,252 @@
+# backend/app/core/cache.py
+"""
+여러 서비스(Gemini 응답, 날씨, 거리 등)에서 공통으로 쓰는 2단 캐시.
+
+- 1단: 프로세스 메모리 LRU (OrderedDict)
+- 2단: SQLite 파일 (서버 재시작 후에도 유지, 선택 사항)
+
+값은 JSON 직렬화 가능한 객체만 저장한다고 가정한다.
+stale_seconds > 0 이면 만료된 항목을 그만큼 더 보관해서 get_entry 로 꺼낼 수 있다.
+(stale-while-revalidate, app/core/swr.py) get 은 그대로 만료 전 값만 돌려준다.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TieredCache:
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        max_memory_entries: int = 256,
+        db_path: Optional[str] = None,
+        max_db_entries: int = 10000,
+        stale_seconds: float = 0.0,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.db_path = db_path or None
+        self.max_db_entries = max_db_entries
+        self.stale_seconds = stale_seconds
+
+        self._memory: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # 통계 카운터
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.sets = 0
+        self.evictions = 0
+
+        if self.db_path:
+            self._init_db()
+
+    # ─────────────────────────────
+    # SQLite 2단
+    # ─────────────────────────────
+    def _init_db(self) -> None:
+        try:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires "
+                "ON cache_entries (namespace, expires_at)"
+            )
+            self._conn.commit()
+        except Exception as e:
+            print(f"[TieredCache:{self.namespace}] SQLite 초기화 실패, 메모리만 사용: {e}")
+            self._conn = None
+
+    def _db_get(self, key: str, now: float) -> Optional[tuple[float, Any]]:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        except Exception as e:
+            print(f"[TieredCache:{self.namespace}] SQLite 조회 실패: {e}")
+            return None
+
+        if row is None:
+            return None
+        value_text, expires_at = row
+        if expires_at + self.stale_seconds <= now:
+            self._db_delete(key)
+            return None
+        return expires_at, json.loads(value_text)
+
+    def _db_set(self, key: str, value: Any, expires_at: float) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, ensure_ascii=False), expires_at),
+            )
+            self._prune_db()
+            self._conn.commit()
+        except Exception as e:
+            print(f"[TieredCache:{self.namespace}] SQLite 저장 실패: {e}")
+
+    def _db_delete(self, key: str) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+            self._conn.commit()
+        except Exception as e:
+            print(f"[TieredCache:{self.namespace}] SQLite 삭제 실패: {e}")
+
+    def _prune_db(self) -> None:
+        """
+        만료된 항목을 지우고, 최대 개수를 넘으면 만료가 가장 가까운 것부터 삭제.
+        """
+        self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, time.time() - self.stale_seconds),
+        )
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        overflow = count - self.max_db_entries
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                    SELECT key FROM cache_entries WHERE namespace = ?
+                    ORDER BY expires_at ASC LIMIT ?
+                )
+                """,
+                (self.namespace, self.namespace, overflow),
+            )
+            self.evictions += overflow
+
+    # ─────────────────────────────
+    # 메모리 1단
+    # ─────────────────────────────
+    def _memory_set(self, key: str, value: Any, expires_at: float) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # ─────────────────────────────
+    # 공개 API
+    # ─────────────────────────────
+    def _lookup(self, key: str, now: float) -> Optional[tuple[float, Any, bool]]:
+        """
+        (expires_at, value, 메모리에서 찾았는지). 보관 기간(만료 + stale_seconds)이 지난 항목은 지운다. 통계는 세지 않는다.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[0] + self.stale_seconds > now:
+                self._memory.move_to_end(key)
+                return entry[0], entry[1], True
+            del self._memory[key]
+
+        db_entry = self._db_get(key, now)
+        if db_entry is None:
+            return None
+        # 디스크에서 찾은 값은 메모리로 끌어올린다.
+        self._memory_set(key, db_entry[1], db_entry[0])
+        return db_entry[0], db_entry[1], False
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None and entry[0] > now:
+                if entry[2]:
+                    self.memory_hits += 1
+                else:
+                    self.db_hits += 1
+                return entry[1]
+
+            self.misses += 1
+            return None
+
+    def get_entry(self, key: str) -> Optional[tuple[Any, float]]:
+        """
+        (value, expires_at). 만료됐어도 stale_seconds 안이면 돌려준다. (expires_at <= now 면 stale)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value, in_memory = entry
+            if expires_at <= now:
+                self.stale_hits += 1
+            elif in_memory:
+                self.memory_hits += 1
+            else:
+                self.db_hits += 1
+            return value, expires_at
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._memory_set(key, value, expires_at)
+            self._db_set(key, value, expires_at)
+            self.sets += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+            self._db_delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+                )
+                self._conn.commit()
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.db_hits
+        total = hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "persistent": self._conn is not None,
+        }
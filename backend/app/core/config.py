@@ -9,6 +9,109 @@ class Settings(BaseSettings):
     # .env 에서 읽어올 값들
     database_url: str                    # DATABASE_URL=...
     google_api_key: str | None = None    # GOOGLE_API_KEY=...
+    gemini_model: str = "gemini-2.5-flash-lite"
+    # True: 일정 JSON을 response_schema(structured output)로 강제 / False: 프롬프트에 예시 스키마
+    gemini_structured_output: bool = True
+
+    # 일정 생성 방식: "single"(한 번에 전체) / "parallel"(뼈대 1회 + 날짜별 동시 생성)
+    itinerary_generation_mode: str = "single"
+    itinerary_parallel_min_days: int = 3     # 이 일수 이상일 때만 parallel 사용
+
+    # Gemini 응답 캐시 (같은 프롬프트 재요청 시 바로 반환)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 60 * 60 * 24          # 24시간
+    llm_cache_memory_size: int = 256                   # 메모리 LRU 최대 개수
+    llm_cache_db_path: str | None = "llm_cache.sqlite3"  # 비우면 메모리만 사용
+    llm_cache_db_max_entries: int = 10000
+
+    # 일정 생성 백그라운드 작업 큐
+    itinerary_job_workers: int = 4                     # 동시에 실행할 생성 작업 수
+    itinerary_job_max_pending: int = 1000              # 대기 작업이 이보다 많으면 503
+    itinerary_job_store: str = "db"                    # "db"(재시작 후 재개) / "memory"
+    itinerary_job_lease_seconds: int = 120             # 실행 중 작업 임대 시간 (1/3 마다 연장)
+
+    # 동일한 일정 생성 요청 동시 처리 합치기 (single-flight)
+    itinerary_singleflight_enabled: bool = True
+    # True: 동시에 들어온 동일 요청이 저장된 일정 1개를 공유
+    # False: Gemini 호출만 공유하고 요청마다 일정을 따로 저장
+    itinerary_singleflight_share_result: bool = False
+
+    # 검증된 일정 상세(ItineraryDetail) 메모리 캐시 (일정 id 기준, 일정은 생성 후 바뀌지 않음)
+    itinerary_detail_cache_memory_size: int = 1024
+    itinerary_detail_cache_ttl_seconds: int = 60 * 60 * 24
+    # True: detail(JSON) 컬럼과 함께 ai_summary 에도 JSON 문자열을 남긴다. (이전 버전 롤백 대비)
+    # 롤백 걱정이 없어지면 False 로 바꾸고 python -m app.db.migrations --drop-itinerary-text
+    itinerary_detail_keep_text: bool = True
+
+    # 미리 생성해 둔 일정 카탈로그 (선택 랜드마크 없는 요청에 사용)
+    itinerary_catalog_enabled: bool = True
+    catalog_days: list[int] = [1, 2, 3, 4, 5]
+    # "" = 테마 없는 요청 (가장 흔한 요청이라 기본 포함)
+    catalog_themes: list[str] = ["", "food", "activity", "museum", "shopping", "nature"]
+    catalog_warmer_requests_per_minute: float = 10.0
+
+    # 오프라인 거리/시간 행렬 (직선거리 × 우회 계수 / 이동수단별 평균 속도)
+    matrix_detour_factor: float = 1.3
+    matrix_speed_kmh: dict[str, float] = {"walking": 4.5, "transit": 18.0, "driving": 25.0}
+
+    # 생성 후 하루 방문 순서 최적화 (최근접 이웃 + 2-opt)
+    itinerary_route_optimization: bool = True
+
+    # 외부 API 공통 (app/core/http_client.py): 재시도 + 서킷 브레이커
+    http_retries: int = 2                      # 연결 오류/타임아웃/429/5xx 재시도 횟수
+    http_retry_backoff_seconds: float = 0.2    # 지수 백오프 기준 (full jitter)
+    http_breaker_failure_threshold: int = 5    # 연속 실패 몇 번이면 open
+    http_breaker_reset_seconds: float = 30.0   # open 유지 시간 (이후 시험 호출 1개)
+
+    # stale-while-revalidate (app/core/swr.py): 만료된 값은 바로 응답하고 뒤에서 갱신, hot 키는 만료 전에 갱신
+    swr_enabled: bool = True
+    swr_workers: int = 4                       # 백그라운드 갱신 스레드 수
+    swr_refresh_ahead_ratio: float = 0.1       # TTL 의 마지막 10% 구간에서 미리 갱신
+    swr_hot_min_hits: int = 3                  # 마지막 갱신 이후 이만큼 조회된 키만 미리 갱신
+    swr_max_tracked_keys: int = 10000
+
+    # Open-Meteo 날씨 조회 (공유 httpx 클라이언트 + 타임아웃 + 캐시)
+    weather_grid_deg: float = 0.1                      # 좌표를 이 간격으로 반올림 (모델 격자 수준)
+    weather_current_ttl_seconds: int = 60 * 15         # 현재 날씨: 15분 주기 갱신
+    weather_forecast_ttl_seconds: int = 60 * 60        # 일별 예보: 1시간 주기 갱신
+    weather_connect_timeout_seconds: float = 3.0
+    weather_read_timeout_seconds: float = 5.0
+    weather_pool_size: int = 20
+    weather_cache_memory_size: int = 2048
+    weather_cache_db_path: str | None = "weather_cache.sqlite3"  # 비우면 메모리만 사용
+    weather_cache_db_max_entries: int = 20000
+    weather_stale_seconds: int = 60 * 60               # 만료 후 이 시간까지는 stale 값을 주고 뒤에서 갱신
+    weather_window_days: int = 16                      # 예보 창: 오늘부터 며칠 뒤까지 한 번에 받아 캐시 (Open-Meteo 최대 16)
+    weather_batch_size: int = 50                       # 요청 1번에 묶는 좌표 수
+    weather_batch_max_locations: int = 500             # /weather/forecast/batch 요청당 최대 좌표 수
+    weather_prewarm_enabled: bool = True               # 지역 예보 백그라운드 갱신
+    weather_prewarm_interval_seconds: int = 60 * 30    # 예보 TTL보다 짧게 → 만료 전에 갱신
+    weather_prewarm_landmarks: bool = False            # 랜드마크 좌표(격자)까지 갱신
+
+    # 일정 생성 직후 이동 거리/시간 미리 계산: "off" / "estimate"(오프라인 행렬) / "route"(DistanceService, 실패 시 estimate)
+    itinerary_travel_source: str = "estimate"
+    itinerary_travel_mode: str = "transit"     # estimate 에서 쓰는 이동수단 (matrix_speed_kmh 키)
+
+    # 리포트에 날씨 예보 포함(include_weather=true) 시 기다리는 최대 시간. 넘기면 weather 없이 응답하고
+    # 조회는 뒤에서 계속돼서 캐시를 채운다.
+    report_weather_deadline_seconds: float = 1.5
+
+    # 거리 계산 백엔드: "osrm"(외부 OSRM) / "local"(data/roads 도로 그래프) / "auto"(local 우선, 없으면 osrm)
+    distance_backend: str = "osrm"
+
+    # OSRM 거리 조회 (공유 httpx 클라이언트 + 타임아웃 + 캐시)
+    osrm_base_url: str = "http://router.project-osrm.org"   # 로컬 OSRM/테스트 서버로 교체 가능
+    osrm_profile: str = "driving"
+    osrm_max_waypoints: int = 100
+    distance_connect_timeout_seconds: float = 3.0
+    distance_read_timeout_seconds: float = 5.0
+    distance_pool_size: int = 20
+    distance_cache_ttl_seconds: int = 60 * 60 * 24 * 7        # 7일
+    distance_negative_ttl_seconds: int = 60                    # 실패 결과는 1분만 기억
+    distance_cache_memory_size: int = 4096
+    distance_cache_db_path: str | None = "distance_cache.sqlite3"  # 비우면 메모리만 사용
+    distance_cache_db_max_entries: int = 100000
+    distance_stale_seconds: int = 60 * 60 * 24 * 7             # 만료 후 7일까지는 stale 값을 주고 뒤에서 갱신
 
     class Config:
         env_file = ".env"
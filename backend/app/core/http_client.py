@@ -0,0 +1,305 @@
+# backend/app/core/http_client.py
+"""
+외부 API(Open-Meteo, OSRM 등) 호출용 공유 HTTP 클라이언트 풀.
+
+upstream 하나당 UpstreamClient 하나:
+- httpx 클라이언트(async + 동기) 를 프로세스 전체에서 재사용 (keep-alive, 호스트별 연결 수 제한)
+- connect/read 타임아웃
+- 연결 오류/타임아웃/429/5xx 는 지수 백오프 + 지터로 재시도
+- 연속 실패가 쌓이면 서킷 브레이커가 열려서 일정 시간 동안 바로 실패 (느린 upstream 이 워커를 붙잡지 않게)
+
+async 클라이언트는 lifespan 에서 start/stop 한다. (시작 전 호출되면 그 자리에서 만든다)
+동기 클라이언트는 스레드에서 도는 기존 동기 코드(일정 저장 후 이동 정보 계산 등)용.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+UPSTREAM_REQUESTS = registry.counter(
+    "upstream_requests_total",
+    "외부 API 호출 수 (result: ok/retry/error/client_error/circuit_open/cancelled)",
+    ("upstream", "result"),
+)
+
+
+class UpstreamError(Exception):
+    """
+    재시도 후에도 실패한 외부 API 호출.
+    """
+
+
+class CircuitOpenError(UpstreamError):
+    """
+    서킷 브레이커가 열려 있어서 호출하지 않고 바로 실패.
+    """
+
+
+class CircuitBreaker:
+    """
+    연속 실패 failure_threshold 번 → open (reset_seconds 동안 바로 실패)
+    → half-open (시험 호출 1개만 통과) → 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half_open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """
+        시험 호출이 결과 없이 끝난 경우 (호출한 쪽이 취소). 실패로 세지 않고 다음 시험 호출만 허용한다.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class UpstreamClient:
+    def __init__(
+        self,
+        name: str,
+        max_connections: int,
+        connect_timeout: float,
+        read_timeout: float,
+        retries: int,
+        backoff_seconds: float,
+        breaker: CircuitBreaker,
+    ):
+        self.name = name
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.breaker = breaker
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._async: Optional[httpx.AsyncClient] = None
+        self._sync: Optional[httpx.Client] = None
+        self._sync_lock = threading.Lock()
+
+    # ─────────────────────────────
+    # 수명 관리
+    # ─────────────────────────────
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async is None:
+            self._async = httpx.AsyncClient(limits=self._limits, timeout=self._timeout)
+        return self._async
+
+    def sync_client(self) -> httpx.Client:
+        if self._sync is None:
+            with self._sync_lock:
+                if self._sync is None:
+                    self._sync = httpx.Client(limits=self._limits, timeout=self._timeout)
+        return self._sync
+
+    async def start(self) -> None:
+        self.async_client()
+
+    async def stop(self) -> None:
+        if self._async is not None:
+            await self._async.aclose()
+            self._async = None
+        if self._sync is not None:
+            self._sync.close()
+            self._sync = None
+
+    # ─────────────────────────────
+    # 재시도 / 브레이커
+    # ─────────────────────────────
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ backoff * 2^attempt
+        return random.uniform(0, self.backoff_seconds * (2 ** attempt))
+
+    def _before(self) -> None:
+        if not self.breaker.allow():
+            UPSTREAM_REQUESTS.inc(upstream=self.name, result="circuit_open")
+            raise CircuitOpenError(f"{self.name} 서킷 브레이커 open")
+
+    def _check(self, response: httpx.Response) -> Optional[Exception]:
+        """
+        재시도할 오류면 예외 객체, 정상이면 None. 4xx(429 제외)는 바로 올린다.
+        """
+        if response.status_code in RETRY_STATUS:
+            return UpstreamError(f"{self.name} HTTP {response.status_code}")
+        if response.is_client_error:
+            # 요청 쪽 문제라 upstream 장애로 세지 않는다.
+            self.breaker.record_success()
+            UPSTREAM_REQUESTS.inc(upstream=self.name, result="client_error")
+            raise UpstreamError(f"{self.name} HTTP {response.status_code}")
+        return None
+
+    def _fail(self, error: Exception) -> UpstreamError:
+        self.breaker.record_failure()
+        UPSTREAM_REQUESTS.inc(upstream=self.name, result="error")
+        return UpstreamError(f"{self.name} 호출 실패: {error}")
+
+    def _abort(self, error: BaseException) -> None:
+        """
+        재시도 루프가 결과 기록 없이 끝난 경우.
+        - 취소(CancelledError, GeneratorExit 등 Exception 이 아닌 것): 호출한 쪽 사정이라 실패로 세지 않고
+          half-open 시험 호출 표시(_probing)만 푼다.
+        - 그 밖의 예외(httpx.HTTPError 가 아닌 예외, JSON 디코드 실패 등): 실패로 센다.
+        """
+        if not isinstance(error, Exception):
+            self.breaker.release_probe()
+            UPSTREAM_REQUESTS.inc(upstream=self.name, result="cancelled")
+            return
+        self.breaker.record_failure()
+        UPSTREAM_REQUESTS.inc(upstream=self.name, result="error")
+        print(f"[UpstreamClient:{self.name}] 호출 중단: {error!r}")
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self._before()
+        error: Exception = UpstreamError(self.name)
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, result="retry")
+                    time.sleep(self._backoff(attempt - 1))
+                try:
+                    response = self.sync_client().get(url, params=params)
+                except httpx.HTTPError as e:
+                    error = e
+                    continue
+                error = self._check(response)
+                if error is None:
+                    data = response.json()
+                    self.breaker.record_success()
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, result="ok")
+                    return data
+        except UpstreamError:
+            # _check 의 4xx: 이미 기록됨
+            raise
+        except BaseException as e:
+            self._abort(e)
+            raise
+        raise self._fail(error)
+
+    async def aget_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self._before()
+        error: Exception = UpstreamError(self.name)
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, result="retry")
+                    await asyncio.sleep(self._backoff(attempt - 1))
+                try:
+                    response = await self.async_client().get(url, params=params)
+                except httpx.HTTPError as e:
+                    error = e
+                    continue
+                error = self._check(response)
+                if error is None:
+                    data = response.json()
+                    self.breaker.record_success()
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, result="ok")
+                    return data
+        except UpstreamError:
+            # _check 의 4xx: 이미 기록됨
+            raise
+        except BaseException as e:
+            self._abort(e)
+            raise
+        raise self._fail(error)
+
+
+class HttpClientPool:
+    """
+    upstream 이름 → UpstreamClient. lifespan 에서 start_all / stop_all.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, UpstreamClient] = {}
+
+    def register(
+        self,
+        name: str,
+        max_connections: int,
+        connect_timeout: float,
+        read_timeout: float,
+    ) -> UpstreamClient:
+        client = UpstreamClient(
+            name=name,
+            max_connections=max_connections,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries=settings.http_retries,
+            backoff_seconds=settings.http_retry_backoff_seconds,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.http_breaker_failure_threshold,
+                reset_seconds=settings.http_breaker_reset_seconds,
+            ),
+        )
+        self._clients[name] = client
+        return client
+
+    def get(self, name: str) -> UpstreamClient:
+        return self._clients[name]
+
+    def names(self) -> List[str]:
+        return list(self._clients)
+
+    async def start_all(self) -> None:
+        for client in self._clients.values():
+            await client.start()
+
+    async def stop_all(self) -> None:
+        for client in self._clients.values():
+            await client.stop()
+
+
+http_clients = HttpClientPool()
+
+
+def _breaker_metrics():
+    return [
+        ("upstream_circuit_open", "서킷 브레이커 상태 (0: closed, 0.5: half_open, 1: open)", {
+            f'{{upstream="{name}"}}': {"closed": 0, "half_open": 0.5, "open": 1}[http_clients.get(name).breaker.state]
+            for name in http_clients.names()
+        }),
+    ]
+
+
+registry.register_collector(_breaker_metrics)
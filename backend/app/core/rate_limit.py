@@ -0,0 +1,32 @@
+# backend/app/core/rate_limit.py
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    async 토큰 버킷 속도 제한기.
+
+    - rate_per_sec 만큼 초당 토큰이 채워지고, 최대 capacity 개까지 쌓인다.
+    - acquire()는 토큰이 생길 때까지 기다린 뒤 1개를 소비한다.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+                self._refill()
+            self._tokens -= 1
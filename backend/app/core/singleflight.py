@@ -0,0 +1,47 @@
+# backend/app/core/singleflight.py
+"""
+같은 키로 동시에 들어온 async 작업을 하나로 합치는 single-flight.
+
+먼저 온 호출(leader)만 실제로 실행하고, 실행 중에 같은 키로 들어온 호출들은
+그 결과(또는 예외)를 그대로 공유한다. 작업이 끝나면 키는 바로 비워지므로
+결과를 오래 보관하는 캐시와는 다르다.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # 통계 카운터
+        self.leaders = 0      # 실제로 실행된 호출 수
+        self.followers = 0    # 다른 호출 결과를 공유받은 호출 수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+            self.leaders += 1
+        else:
+            self.followers += 1
+
+        # 한 호출자가 끊겨도(cancel) 나머지 대기자들의 작업은 계속 진행되도록 shield
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "inflight": len(self._inflight),
+            "leaders": self.leaders,
+            "followers": self.followers,
+        }
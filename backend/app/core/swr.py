@@ -0,0 +1,138 @@
+# backend/app/core/swr.py
+"""
+stale-while-revalidate 갱신 스케줄러.
+
+TieredCache(stale_seconds > 0).get_entry 로 꺼낸 항목을 observe 에 넘기면:
+- 만료(stale)된 값 → 호출자는 그 값을 바로 쓰고, 갱신은 백그라운드 스레드에서
+- 아직 신선하지만 자주 조회되는(hot) 키 → 만료 직전(TTL 의 refresh_ahead_ratio 구간)에 미리 갱신
+- 같은 키의 갱신은 동시에 하나만 (진행 중이면 건너뜀)
+
+갱신 함수는 동기 함수(서비스의 동기 fetch + 캐시 저장)이고 공유 스레드 풀에서 돈다.
+async 경로에서 불러도 submit 만 하므로 이벤트 루프를 막지 않는다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+SWR_STALE_SERVED = registry.counter(
+    "swr_stale_served_total", "만료된 캐시 값을 그대로 응답한 수", ("namespace",)
+)
+SWR_REFRESHES = registry.counter(
+    "swr_refresh_total",
+    "백그라운드 갱신 수 (reason: stale/ahead, result: ok/error/deduped)",
+    ("namespace", "reason", "result"),
+)
+SWR_REFRESH_LATENCY = registry.histogram(
+    "swr_refresh_latency_seconds", "백그라운드 갱신 소요 시간", ("namespace",)
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.swr_workers, thread_name_prefix="swr-refresh"
+                )
+    return _executor
+
+
+def shutdown() -> None:
+    """
+    lifespan(shutdown)에서 호출. 대기 중인 갱신은 버린다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+class Revalidator:
+    """
+    캐시 namespace 하나(날씨, 거리 등)의 갱신 예약 + 키별 조회 수 추적.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._inflight: Set[str] = set()
+        # 키 → 마지막 갱신 이후 조회 수 (최근 조회 순, 최대 swr_max_tracked_keys 개)
+        self._hits: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _touch(self, key: str) -> int:
+        with self._lock:
+            hits = self._hits.pop(key, 0) + 1
+            self._hits[key] = hits
+            while len(self._hits) > settings.swr_max_tracked_keys:
+                self._hits.popitem(last=False)
+            return hits
+
+    def observe(self, key: str, expires_at: float, ttl_seconds: float, refresh: Callable[[], None]) -> bool:
+        """
+        캐시에서 꺼낸 항목의 만료 시각을 보고 필요하면 refresh 를 예약한다. stale 이면 True.
+        """
+        if not settings.swr_enabled:
+            return False
+
+        hits = self._touch(key)
+        remaining = expires_at - time.time()
+
+        if remaining <= 0:
+            SWR_STALE_SERVED.inc(namespace=self.namespace)
+            self.schedule(key, refresh, reason="stale")
+            return True
+
+        if (
+            hits >= settings.swr_hot_min_hits
+            and remaining < ttl_seconds * settings.swr_refresh_ahead_ratio
+        ):
+            self.schedule(key, refresh, reason="ahead")
+        return False
+
+    def schedule(self, key: str, refresh: Callable[[], None], reason: str) -> None:
+        with self._lock:
+            if key in self._inflight:
+                SWR_REFRESHES.inc(namespace=self.namespace, reason=reason, result="deduped")
+                return
+            self._inflight.add(key)
+
+        try:
+            _get_executor().submit(self._run, key, refresh, reason)
+        except RuntimeError:
+            # 종료 중
+            with self._lock:
+                self._inflight.discard(key)
+
+    def _run(self, key: str, refresh: Callable[[], None], reason: str) -> None:
+        started = time.perf_counter()
+        try:
+            refresh()
+            SWR_REFRESHES.inc(namespace=self.namespace, reason=reason, result="ok")
+        except Exception as e:
+            print(f"[Revalidator:{self.namespace}] 갱신 실패 ({key}): {e}")
+            SWR_REFRESHES.inc(namespace=self.namespace, reason=reason, result="error")
+        finally:
+            SWR_REFRESH_LATENCY.observe(time.perf_counter() - started, namespace=self.namespace)
+            with self._lock:
+                self._inflight.discard(key)
+                self._hits.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "namespace": self.namespace,
+                "inflight": len(self._inflight),
+                "tracked_keys": len(self._hits),
+            }
@@ -4,14 +4,26 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app import models
+from app.regions import country_code_for, region_codes_for
 from app.schemas import LandmarkCreate, LandmarkUpdate, ItineraryCreate
+from app.services.itinerary_detail_service import ItineraryDetailService
 
 
 # ─────────────────────────────
 # Landmark
 # ─────────────────────────────
+def fill_region_codes(landmark: models.Landmark) -> None:
+    """
+    한글 country/region 이름으로 조회용 코드 컬럼을 채운다.
+    """
+    country_code, region_code = region_codes_for(landmark.region)
+    landmark.country_code = country_code or country_code_for(landmark.country)
+    landmark.region_code = region_code
+
+
 def create_landmark(db: Session, landmark_in: LandmarkCreate) -> models.Landmark:
     landmark = models.Landmark(**landmark_in.dict())
+    fill_region_codes(landmark)
     db.add(landmark)
     db.commit()
     db.refresh(landmark)
@@ -22,46 +34,28 @@ def get_landmark(db: Session, landmark_id: int) -> Optional[models.Landmark]:
     return db.query(models.Landmark).filter(models.Landmark.id == landmark_id).first()
 
 
+def get_landmarks_by_ids(db: Session, landmark_ids: List[int]) -> List[models.Landmark]:
+    if not landmark_ids:
+        return []
+    return db.query(models.Landmark).filter(models.Landmark.id.in_(landmark_ids)).all()
+
+
 def get_landmarks(
     db: Session,
     country_code: Optional[str] = None,
     region_code: Optional[str] = None,
 ) -> List[models.Landmark]:
     """
-    country_code(JP/TH/UK), region_code(tokyo/bangkok/london)를
-    실제 DB에 저장된 한글 country/region으로 매핑해서 필터링.
+    country_code(JP/TH/UK), region_code(tokyo/bangkok/london) 컬럼으로 필터링.
+    ((country_code, region_code) 복합 인덱스)
     """
     q = db.query(models.Landmark)
 
-    # 코드 → 한글 국가명 매핑
-    country_map = {
-        "JP": "일본",
-        "TH": "태국",
-        "UK": "영국",
-    }
-    region_map = {
-        # 일본
-        "tokyo": "도쿄",
-        "osaka": "오사카",
-        "fukuoka": "후쿠오카",
-        # 태국
-        "bangkok": "방콕",
-        "phuket": "푸켓",
-        "chiangmai": "치앙마이",
-        # 영국
-        "london": "런던",
-        "edinburgh": "에든버러",
-        "manchester": "맨체스터",
-        "liverpool": "리버풀",
-    }
-
     if country_code:
-        country_name = country_map.get(country_code, country_code)
-        q = q.filter(models.Landmark.country == country_name)
+        q = q.filter(models.Landmark.country_code == country_code)
 
     if region_code:
-        region_name = region_map.get(region_code, region_code)
-        q = q.filter(models.Landmark.region == region_name)
+        q = q.filter(models.Landmark.region_code == region_code)
 
     return q.all()
 
@@ -73,6 +67,7 @@ def update_landmark(
 ) -> models.Landmark:
     for field, value in landmark_in.dict(exclude_unset=True).items():
         setattr(landmark, field, value)
+    fill_region_codes(landmark)
     db.add(landmark)
     db.commit()
     db.refresh(landmark)
@@ -92,10 +87,14 @@ def create_itinerary(
     itinerary_in: ItineraryCreate,
     ai_title: str,
     ai_summary: str,
+    commit: bool = True,
 ) -> models.Itinerary:
     """
     ai_summary 에는 Gemini가 만들어준 JSON 문자열(= ItineraryDetail 구조)이 들어간다고 보면 됨.
+    검증되면 detail(JSON) 컬럼에 저장하고, 안 되면 원문 그대로 ai_summary 에 남긴다.
+    commit=False 면 flush 만 한다. (호출하는 쪽에서 다른 변경과 한 트랜잭션으로 commit)
     """
+    detail, detail_version, ai_summary = ItineraryDetailService.encode(ai_summary)
     selected_ids_str = ",".join(str(i) for i in itinerary_in.selected_landmark_ids)
 
     itinerary = models.Itinerary(
@@ -107,13 +106,88 @@ def create_itinerary(
         selected_landmark_ids=selected_ids_str,
         title=ai_title,
         ai_summary=ai_summary,
+        detail=detail,
+        detail_version=detail_version,
     )
     db.add(itinerary)
+    if not commit:
+        db.flush()
+        return itinerary
     db.commit()
     db.refresh(itinerary)
     return itinerary
 
 
+def get_itinerary_travel(db: Session, itinerary_id: int) -> Optional[models.ItineraryTravel]:
+    return (
+        db.query(models.ItineraryTravel)
+        .filter(models.ItineraryTravel.itinerary_id == itinerary_id)
+        .first()
+    )
+
+
+def save_itinerary_travel(
+    db: Session,
+    itinerary_id: int,
+    source: str,
+    summary: str,
+) -> models.ItineraryTravel:
+    row = get_itinerary_travel(db, itinerary_id)
+    if row is None:
+        row = models.ItineraryTravel(itinerary_id=itinerary_id, source=source, summary=summary)
+        db.add(row)
+    else:
+        row.source = source
+        row.summary = summary
+    db.commit()
+    db.refresh(row)
+    return row
+
+
+def get_catalog_entry(
+    db: Session,
+    country_code: str,
+    region_code: str,
+    days: int,
+    theme: str,
+) -> Optional[models.ItineraryCatalog]:
+    return (
+        db.query(models.ItineraryCatalog)
+        .filter(models.ItineraryCatalog.country_code == country_code)
+        .filter(models.ItineraryCatalog.region_code == region_code)
+        .filter(models.ItineraryCatalog.days == days)
+        .filter(models.ItineraryCatalog.theme == theme)
+        .first()
+    )
+
+
+def list_catalog_entries(db: Session) -> List[models.ItineraryCatalog]:
+    return db.query(models.ItineraryCatalog).all()
+
+
+def create_catalog_entry(
+    db: Session,
+    country_code: str,
+    region_code: str,
+    days: int,
+    theme: str,
+    ai_title: str,
+    ai_summary: str,
+) -> models.ItineraryCatalog:
+    entry = models.ItineraryCatalog(
+        country_code=country_code,
+        region_code=region_code,
+        days=days,
+        theme=theme,
+        title=ai_title,
+        ai_summary=ai_summary,
+    )
+    db.add(entry)
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
 def get_itinerary(db: Session, itinerary_id: int) -> Optional[models.Itinerary]:
     return db.query(models.Itinerary).filter(models.Itinerary.id == itinerary_id).first()
 
@@ -142,19 +216,14 @@ def get_japan_restaurants_by_region(
     region_code: str,
 ) -> List[models.JapanRestaurant]:
     """
-    region_code (tokyo/osaka/fukuoka) -> CSV에 들어간 실제 '지역' 이름 매핑
+    region_code (tokyo/osaka/fukuoka) 로 조회 ((country_code, region_code) 인덱스)
     """
-    region_map = {
-        "tokyo": "도쿄",
-        "osaka": "오사카",
-        "fukuoka": "후쿠오카",
-    }
-    region_name = region_map.get(region_code)
-
-    q = db.query(models.JapanRestaurant)
-    if region_name:
-        q = q.filter(models.JapanRestaurant.region == region_name)
-    return q.all()
+    return (
+        db.query(models.JapanRestaurant)
+        .filter(models.JapanRestaurant.country_code == "JP")
+        .filter(models.JapanRestaurant.region_code == region_code)
+        .all()
+    )
 
 
 def get_thailand_activities_by_region(
@@ -162,19 +231,14 @@ def get_thailand_activities_by_region(
     region_code: str,
 ) -> List[models.ThailandActivity]:
     """
-    region_code (bangkok/phuket/chiangmai) -> CSV의 지역 이름 매핑
+    region_code (bangkok/phuket/chiangmai) 로 조회
     """
-    region_map = {
-        "bangkok": "방콕",
-        "phuket": "푸켓",
-        "chiangmai": "치앙마이",
-    }
-    region_name = region_map.get(region_code)
-
-    q = db.query(models.ThailandActivity)
-    if region_name:
-        q = q.filter(models.ThailandActivity.region == region_name)
-    return q.all()
+    return (
+        db.query(models.ThailandActivity)
+        .filter(models.ThailandActivity.country_code == "TH")
+        .filter(models.ThailandActivity.region_code == region_code)
+        .all()
+    )
 
 
 def get_uk_museums_by_region(
@@ -182,16 +246,11 @@ def get_uk_museums_by_region(
     region_code: str,
 ) -> List[models.UkMuseum]:
     """
-    region_code (london/manchester/liverpool) -> CSV의 지역 이름 매핑
+    region_code (london/manchester/liverpool) 로 조회
     """
-    region_map = {
-        "london": "런던",
-        "manchester": "맨체스터",
-        "liverpool": "리버풀",
-    }
-    region_name = region_map.get(region_code)
-
-    q = db.query(models.UkMuseum)
-    if region_name:
-        q = q.filter(models.UkMuseum.region == region_name)
-    return q.all()
+    return (
+        db.query(models.UkMuseum)
+        .filter(models.UkMuseum.country_code == "UK")
+        .filter(models.UkMuseum.region_code == region_code)
+        .all()
+    )
@@ -0,0 +1,145 @@
+# backend/app/db/migrations.py
+"""
+create_all 로는 기존 테이블에 컬럼이 추가되지 않아서, 스키마 변경분을 여기서 맞춘다.
+
+- 앱 시작 때(create_all 직후) 매번 호출해도 되도록 모두 멱등
+- 수동 실행: python -m app.db.migrations
+- 되돌릴 수 없는 정리 작업은 수동 실행 옵션으로만:
+  python -m app.db.migrations --drop-itinerary-text  (detail 로 옮긴 일정의 ai_summary 비우기)
+"""
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Engine
+
+from app import models
+from app.regions import COUNTRY_CODE_TO_NAME, REGION_CODE_TO_NAME
+from app.services.itinerary_detail_service import ItineraryDetailService
+
+# 국가/지역 코드 컬럼이 있는 테이블 (landmarks 만 country 한글 컬럼이 있다)
+REGION_CODE_TABLES = [
+    models.Landmark,
+    models.JapanRestaurant,
+    models.ThailandActivity,
+    models.UkMuseum,
+]
+
+
+def _add_region_code_columns(engine: Engine) -> None:
+    """
+    country_code / region_code 컬럼 + (country_code, region_code) 인덱스 추가 후,
+    비어 있는 행을 한글 region 이름으로 채운다.
+    """
+    inspector = inspect(engine)
+    for model in REGION_CODE_TABLES:
+        table = model.__table__
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+
+        with engine.begin() as conn:
+            for name in ("country_code", "region_code"):
+                if name not in existing:
+                    column_type = table.c[name].type.compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+                    print(f"[migrations] {table.name}.{name} 컬럼 추가")
+
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+            # 지역 이름은 국가끼리 겹치지 않아서 region 만으로 두 코드를 정한다.
+            for country_code, regions in REGION_CODE_TO_NAME.items():
+                for region_code, region_name in regions.items():
+                    conn.execute(
+                        text(
+                            f"UPDATE {table.name} SET country_code = :cc, region_code = :rc "
+                            f"WHERE region_code IS NULL AND region = :region"
+                        ),
+                        {"cc": country_code, "rc": region_code, "region": region_name},
+                    )
+
+            # 지역을 모르는 랜드마크도 국가 코드는 채운다.
+            if "country" in table.c:
+                for country_code, country_name in COUNTRY_CODE_TO_NAME.items():
+                    conn.execute(
+                        text(
+                            f"UPDATE {table.name} SET country_code = :cc "
+                            f"WHERE country_code IS NULL AND country = :country"
+                        ),
+                        {"cc": country_code, "country": country_name},
+                    )
+
+
+def _add_job_lease_columns(engine: Engine) -> None:
+    """
+    itinerary_jobs.owner / lease_expires_at 컬럼 추가. (비어 있는 running 작업은 임대가 끝난 것으로 보고 재개)
+    """
+    table = models.ItineraryJob.__table__
+    existing = {col["name"] for col in inspect(engine).get_columns(table.name)}
+
+    with engine.begin() as conn:
+        for name in ("owner", "lease_expires_at"):
+            if name not in existing:
+                column_type = table.c[name].type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+                print(f"[migrations] {table.name}.{name} 컬럼 추가")
+
+
+def _move_itinerary_detail(engine: Engine) -> None:
+    """
+    itineraries.detail / detail_version 컬럼 추가 후, ai_summary(JSON 문자열)로만 저장된 일정을 detail 로 복사한다.
+    ai_summary 는 건드리지 않는다. (이전 버전으로 롤백해도 리포트/CSV 가 그대로 동작)
+    검증에 실패한 일정은 detail_version = 0 (텍스트만 보관) 이라 다음 실행 때 다시 보지 않는다.
+    """
+    table = models.Itinerary.__table__
+    existing = {col["name"] for col in inspect(engine).get_columns(table.name)}
+
+    with engine.begin() as conn:
+        for name in ("detail", "detail_version"):
+            if name not in existing:
+                column_type = table.c[name].type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+                print(f"[migrations] {table.name}.{name} 컬럼 추가")
+
+        rows = conn.execute(
+            select(table.c.id, table.c.ai_summary).where(table.c.detail_version.is_(None))
+        ).all()
+        moved = 0
+        for itinerary_id, ai_summary in rows:
+            detail, detail_version, _ = ItineraryDetailService.encode(ai_summary or "")
+            conn.execute(
+                table.update()
+                .where(table.c.id == itinerary_id)
+                .values(detail=detail, detail_version=detail_version)
+            )
+            moved += detail is not None
+        if rows:
+            print(f"[migrations] {table.name}.detail 로 옮긴 일정 {moved}/{len(rows)}개")
+
+
+def drop_itinerary_text(engine: Engine) -> None:
+    """
+    (수동 전용) detail 로 옮긴 일정의 ai_summary 를 비운다.
+    이후에는 이전 버전으로 롤백하면 해당 일정의 리포트/CSV 가 동작하지 않으므로
+    itinerary_detail_keep_text=False 로 배포를 마친 뒤에 실행한다.
+    """
+    table = models.Itinerary.__table__
+    with engine.begin() as conn:
+        result = conn.execute(
+            table.update()
+            .where(table.c.detail.is_not(None), table.c.ai_summary != "")
+            .values(ai_summary="")
+        )
+    print(f"[migrations] {table.name}.ai_summary 비운 일정 {result.rowcount}개")
+
+
+def run_migrations(engine: Engine) -> None:
+    _add_region_code_columns(engine)
+    _move_itinerary_detail(engine)
+    _add_job_lease_columns(engine)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from app.db.session import engine
+
+    run_migrations(engine)
+    if "--drop-itinerary-text" in sys.argv[1:]:
+        drop_itinerary_text(engine)
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
 from app import models
+from app.regions import country_code_for, region_codes_for
 
 # backend/ 기준 경로
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -24,9 +25,12 @@ def load_landmarks(db: Session):
     with open(csv_path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            country_code, region_code = region_codes_for(row["지역"])
             landmark = models.Landmark(
                 country=row["국가"],
                 region=row["지역"],
+                country_code=country_code or country_code_for(row["국가"]),
+                region_code=region_code,
                 name=row["랜드마크 이름"],
                 description=row["설명"],
                 lng=float(row["경도 (Lng)"]),
@@ -47,8 +51,11 @@ def load_japan_restaurants(db: Session):
     with open(csv_path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            country_code, region_code = region_codes_for(row["지역"])
             restaurant = models.JapanRestaurant(
                 region=row["지역"],
+                country_code=country_code,
+                region_code=region_code,
                 name=row["식당"],
                 rating=float(row["평점"]) if row["평점"] else None,
                 lng=float(row["경도"]) if row["경도"] else None,
@@ -71,8 +78,11 @@ def load_thailand_activities(db: Session):
     with open(csv_path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            country_code, region_code = region_codes_for(row["지역"])
             activity = models.ThailandActivity(
                 region=row["지역"],
+                country_code=country_code,
+                region_code=region_code,
                 name=row["액티비티 이름"],
                 description=row["설명"],
             )
@@ -91,8 +101,11 @@ def load_uk_museums(db: Session):
     with open(csv_path, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            country_code, region_code = region_codes_for(row["지역"])
             museum = models.UkMuseum(
                 region=row["지역"],
+                country_code=country_code,
+                region_code=region_code,
                 name=row["박물관 이름"],
                 opening_info=row["운영시간 & 휴무일"],
                 description=row["설명"],
@@ -1,16 +1,48 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings  # 있으면
+from .core import swr
+from .core.http_client import http_clients
 from .db.session import engine
 from .db.base import Base
+from .db.migrations import run_migrations
 from .routers import api_router
+from .routers.metrics_router import router as metrics_router
+from .services.gemini_service import GeminiService
+from .services.job_service import itinerary_jobs
+from .services.weather_prewarmer import weather_prewarmer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 앱 시작 시 한 번만: Gemini SDK 설정 + 모델 인스턴스 생성
+    if not GeminiService.configure():
+        print("[startup] GOOGLE_API_KEY가 없어 Gemini 모델을 초기화하지 않았습니다.")
+
+    # 외부 API(Open-Meteo, OSRM) 공유 HTTP 클라이언트
+    await http_clients.start_all()
+
+    # 일정 생성 백그라운드 워커
+    await itinerary_jobs.start()
+
+    # 지역 날씨 예보 캐시 미리 채우기
+    if settings.weather_prewarm_enabled:
+        await weather_prewarmer.start()
+    yield
+    await weather_prewarmer.stop()
+    await itinerary_jobs.stop()
+    swr.shutdown()
+    await http_clients.stop_all()
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="CloudYCC Project",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # CORS 설정 (프론트 React랑 통신)
@@ -24,10 +56,15 @@ def create_app() -> FastAPI:
 
     # DB 초기화 (필요하면)
     Base.metadata.create_all(bind=engine)
+    # 기존 테이블에 추가된 컬럼/인덱스 반영 (멱등)
+    run_migrations(engine)
 
     # 라우터 등록
     app.include_router(api_router, prefix="/api")
 
+    # 메트릭은 Prometheus 관례대로 /metrics (prefix 없음)
+    app.include_router(metrics_router, tags=["metrics"])
+
     return app
 
 
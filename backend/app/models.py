@@ -8,17 +8,27 @@ from sqlalchemy import (
     Float,
     Text,
     DateTime,
-    Date
+    Date,
+    Index,
+    JSON,
+    UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from app.db.base import Base
 
 
 class Landmark(Base):
     __tablename__ = "landmarks"
+    __table_args__ = (
+        Index("ix_landmarks_country_region", "country_code", "region_code"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country = Column(String, nullable=False)
     region = Column(String, nullable=False)
+    # country/region(한글 이름)에서 채우는 조회용 코드 (app/regions.py, JP/tokyo ...)
+    country_code = Column(String(8), nullable=True)
+    region_code = Column(String(32), nullable=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     lng = Column(Float, nullable=False)
@@ -43,14 +53,77 @@ class Itinerary(Base):
     theme = Column(String, nullable=True)
     selected_landmark_ids = Column(String, nullable=True)  # "121,123,130"
     title = Column(String, nullable=True)
-    ai_summary = Column(Text, nullable=False)      # 여기 안에 ItineraryDetail JSON 문자열
+    # ItineraryDetail JSON 문자열 (이전 버전 롤백 대비로 detail 과 함께 유지, itinerary_detail_keep_text)
+    # 검증 실패한 응답은 원문만 여기에. detail 이 있는 일정의 텍스트는
+    # python -m app.db.migrations --drop-itinerary-text 로 비울 수 있다. (그 뒤로는 "")
+    ai_summary = Column(Text, nullable=False)
+    detail = Column(JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"), nullable=True)  # 검증된 ItineraryDetail
+    detail_version = Column(Integer, nullable=True)  # detail 구조 버전 (ItineraryDetailService)
     created_at = Column(DateTime, server_default=func.now())
 
+
+class ItineraryCatalog(Base):
+    """
+    자주 쓰이는 (지역, 일수, 테마) 조합에 대해 미리 생성해 둔 ItineraryDetail JSON.
+    선택 랜드마크가 없는 요청은 여기서 바로 꺼내 쓴다. (catalog_warmer.py 로 채움)
+    """
+    __tablename__ = "itinerary_catalog"
+    __table_args__ = (
+        UniqueConstraint("country_code", "region_code", "days", "theme", name="uq_itinerary_catalog_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    country_code = Column(String, nullable=False)
+    region_code = Column(String, nullable=False)
+    days = Column(Integer, nullable=False)
+    theme = Column(String, nullable=False, default="")   # 테마 없음 = ""
+    title = Column(String, nullable=True)
+    ai_summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class ItineraryTravel(Base):
+    """
+    일정 생성 직후 미리 계산해 둔 구간별/일자별 이동 거리·시간 (ItineraryTravelOut JSON).
+    리포트 조회 때 거리 API를 다시 부르지 않기 위해 저장한다.
+    """
+    __tablename__ = "itinerary_travel"
+
+    itinerary_id = Column(Integer, primary_key=True)     # itineraries.id
+    source = Column(String(20), nullable=False)          # route(DistanceService) / estimate(오프라인 행렬)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class ItineraryJob(Base):
+    """
+    일정 생성 백그라운드 작업 (POST /itineraries/jobs).
+    서버가 재시작돼도 queued/running 작업을 다시 큐에 넣을 수 있도록 DB에 보관.
+    running 작업은 owner(실행 중인 프로세스)가 lease_expires_at 까지 임대하고 주기적으로 연장한다.
+    """
+    __tablename__ = "itinerary_jobs"
+
+    id = Column(String(32), primary_key=True)       # uuid hex
+    status = Column(String(20), nullable=False, index=True)  # queued/running/done/failed
+    payload = Column(Text, nullable=False)          # ItineraryCreate JSON
+    itinerary_id = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    owner = Column(String(64), nullable=True)       # 실행 중인 프로세스 (job_service.WORKER_ID)
+    lease_expires_at = Column(DateTime, nullable=True)  # 이 시각이 지나면 다른 프로세스가 가져갈 수 있음
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
 class JapanRestaurant(Base):
     __tablename__ = "japan_restaurants"
+    __table_args__ = (
+        Index("ix_japan_restaurants_country_region", "country_code", "region_code"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     region = Column(String(20), index=True)
+    country_code = Column(String(8), nullable=True)
+    region_code = Column(String(32), nullable=True)
     name = Column(String(200), nullable=False)
     rating = Column(Float, nullable=True)
     lng = Column(Float, nullable=True)
@@ -61,18 +134,28 @@ class JapanRestaurant(Base):
 
 class ThailandActivity(Base):
     __tablename__ = "thailand_activities"
+    __table_args__ = (
+        Index("ix_thailand_activities_country_region", "country_code", "region_code"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     region = Column(String(20), index=True)
+    country_code = Column(String(8), nullable=True)
+    region_code = Column(String(32), nullable=True)
     name = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
 
 
 class UkMuseum(Base):
     __tablename__ = "uk_museums"
+    __table_args__ = (
+        Index("ix_uk_museums_country_region", "country_code", "region_code"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     region = Column(String(20), index=True)
+    country_code = Column(String(8), nullable=True)
+    region_code = Column(String(32), nullable=True)
     name = Column(String(200), nullable=False)
     opening_info = Column(String(200), nullable=True)
     description = Column(Text, nullable=True)
@@ -0,0 +1,59 @@
+# backend/app/regions.py
+"""
+국가/지역 코드 ↔ CSV·DB에 들어가는 한글 이름.
+
+랜드마크/POI 테이블은 적재할 때 한글 이름에서 country_code / region_code 를 채워두고,
+조회는 코드 컬럼((country_code, region_code) 복합 인덱스)으로만 한다.
+"""
+from typing import Dict, Optional
+
+COUNTRY_CODE_TO_NAME: Dict[str, str] = {
+    "JP": "일본",
+    "TH": "태국",
+    "UK": "영국",
+}
+
+REGION_CODE_TO_NAME: Dict[str, Dict[str, str]] = {
+    "JP": {
+        "tokyo": "도쿄",
+        "osaka": "오사카",
+        "fukuoka": "후쿠오카",
+    },
+    "TH": {
+        "bangkok": "방콕",
+        "phuket": "푸켓",
+        "chiangmai": "치앙마이",
+    },
+    "UK": {
+        "london": "런던",
+        "edinburgh": "에든버러",
+        "manchester": "맨체스터",
+        "liverpool": "리버풀",
+    },
+}
+
+# 한글 이름 → 코드 (지역 이름은 국가끼리 겹치지 않는다)
+COUNTRY_NAME_TO_CODE: Dict[str, str] = {name: code for code, name in COUNTRY_CODE_TO_NAME.items()}
+REGION_NAME_TO_CODES: Dict[str, tuple[str, str]] = {
+    name: (country_code, region_code)
+    for country_code, regions in REGION_CODE_TO_NAME.items()
+    for region_code, name in regions.items()
+}
+
+
+def country_code_for(country_name: Optional[str]) -> Optional[str]:
+    return COUNTRY_NAME_TO_CODE.get((country_name or "").strip())
+
+
+def region_codes_for(region_name: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    지역 한글 이름 → (country_code, region_code). 모르는 이름이면 (None, None).
+    """
+    return REGION_NAME_TO_CODES.get((region_name or "").strip(), (None, None))
+
+
+def is_supported(country_code: str, region_code: Optional[str] = None) -> bool:
+    regions = REGION_CODE_TO_NAME.get(country_code)
+    if regions is None:
+        return False
+    return region_code is None or region_code in regions
@@ -1,13 +1,22 @@
 from fastapi import APIRouter
-from app.services.gemini_service import GeminiService
+from app.services.gemini_service import GeminiService, llm_cache
 from app.schemas import GeminiRequest, GeminiResponse
 
 router = APIRouter()
 
 # 주소: POST /api/v1/gemini/chat
 @router.post("/chat", response_model=GeminiResponse)
-def chat_with_gemini(request: GeminiRequest):
+async def chat_with_gemini(request: GeminiRequest):
     """
     Gemini에게 질문을 보내고 답변을 받습니다.
     """
-    return GeminiService.get_chat_response(request.prompt)
\ No newline at end of file
+    return await GeminiService.get_chat_response_async(request.prompt, caller="chat")
+
+
+# 캐시 상태 확인: GET /api/v1/gemini/cache/stats
+@router.get("/cache/stats")
+def get_cache_stats():
+    """
+    Gemini 응답 캐시의 hit/miss 카운터.
+    """
+    return llm_cache.stats()
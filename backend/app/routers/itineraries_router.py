@@ -1,27 +1,42 @@
 # backend/app/routers/itineraries_router.py
 
-from typing import List
+from typing import Awaitable, List, Optional, Set
+import asyncio
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.db.session import get_db, SessionLocal
 from app import crud, models
 from app.schemas import (
     ItineraryCreate,
     ItineraryOut,
-    ItineraryDetail,
     ItineraryReportResponse,
+    ItineraryJobOut,
     JapanRestaurantOut,
     ThailandActivityOut,
     UkMuseumOut,
+    WeatherForecastResponse,
 )
 from app.services.planner_service import PlannerService
 from app.services.csv_service import CSVService
+from app.services.itinerary_detail_service import ItineraryDetailService
+from app.services.catalog_service import CatalogService
+from app.services.job_service import itinerary_jobs, JobQueueFullError
+from app.services.travel_service import TravelService
+from app.services.weather_service import WeatherService
+from app.routers.region_router import REGION_DATA
 
 router = APIRouter()
 
+# itinerary_singleflight_share_result=True 일 때 "생성 + 저장" 전체를 합치는 용도
+itinerary_result_flight = SingleFlight("itinerary_result")
+
 
 def _parse_selected_ids(selected_ids_str: str) -> List[int]:
     if not selected_ids_str:
@@ -30,46 +45,138 @@ def _parse_selected_ids(selected_ids_str: str) -> List[int]:
 
 
 @router.post("/generate", response_model=ItineraryOut)
-def generate_itinerary(
+async def generate_itinerary(
     body: ItineraryCreate,
     db: Session = Depends(get_db),
 ):
     """
     일정 생성하기 버튼 → 호출되는 엔드포인트.
 
+    0. (선택 랜드마크가 없으면) 카탈로그에 미리 만든 일정이 있는지 확인
     1. 선택된 랜드마크들을 DB에서 조회
-    2. PlannerService로 프롬프트 생성 후 Gemini 호출
+    2. PlannerService로 프롬프트 생성 후 Gemini 호출 (async)
        - Gemini는 ItineraryDetail 구조(JSON)로 응답 (문자열)
     3. 결과(JSON 문자열)를 Itinerary 테이블에 저장
     4. 저장된 일정 메타 정보(ItineraryOut)를 반환
+
+    LLM 호출은 await로 기다리고, 동기 DB 작업만 스레드풀에서 실행한다.
+    같은 조건의 요청이 동시에 오면 Gemini 호출은 1번만 한다. (single-flight)
     """
-    landmarks: List[models.Landmark] = []
-    if body.selected_landmark_ids:
-        landmarks = (
-            db.query(models.Landmark)
-            .filter(models.Landmark.id.in_(body.selected_landmark_ids))
-            .all()
-        )
+    # 미리 생성해 둔 카탈로그에 정확히 일치하는 일정이 있으면 Gemini 호출 없이 사용
+    catalog_hit = await run_in_threadpool(CatalogService.lookup, db, body)
+    if catalog_hit is not None:
+        title, full_text = catalog_hit
+        return await run_in_threadpool(_store_itinerary, body, title, full_text)
+
+    landmarks = await run_in_threadpool(crud.get_landmarks_by_ids, db, body.selected_landmark_ids)
     print("[ItinerariesRouter] selected_landmark_ids:", body.selected_landmark_ids)
     print("[ItinerariesRouter] loaded_landmarks:", [(lm.id, lm.name) for lm in landmarks])
-    # 여기서 full_text 는 "ItineraryDetail JSON 문자열" 이라고 가정
-    title, full_text = PlannerService.generate_itinerary_text(body, landmarks)
-    itinerary = crud.create_itinerary(db, body, ai_title=title, ai_summary=full_text)
 
-    return ItineraryOut(
-        id=itinerary.id,
-        country_code=itinerary.country_code,
-        region_code=itinerary.region_code,
-        days=itinerary.days,
-        start_date=itinerary.start_date,   # 🔹 추가
-        theme=itinerary.theme,
-        title=itinerary.title,
-        ai_summary=itinerary.ai_summary,
-        selected_landmark_ids=_parse_selected_ids(itinerary.selected_landmark_ids or ""),
-        created_at=itinerary.created_at.isoformat(),
+    async def _generate_and_store() -> ItineraryOut:
+        # 여기서 full_text 는 "ItineraryDetail JSON 문자열" 이라고 가정
+        title, full_text = await PlannerService.generate_itinerary_text_async(body, landmarks)
+        return await run_in_threadpool(_store_itinerary, body, title, full_text)
+
+    # 공유 모드: 동시에 들어온 동일 요청(start_date 포함)은 저장된 일정 1개를 같이 받는다.
+    if settings.itinerary_singleflight_enabled and settings.itinerary_singleflight_share_result:
+        key = PlannerService.request_key(body, include_start_date=True)
+        return await itinerary_result_flight.do(key, _generate_and_store)
+
+    return await _generate_and_store()
+
+
+def _sse(event: str, data) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _store_itinerary(body: ItineraryCreate, title: str, full_text: str) -> ItineraryOut:
+    """
+    /generate, /generate/stream 공용 저장 함수 (스레드풀에서 실행).
+    (스트리밍에서는 요청 스코프 세션이 응답 스트리밍 중에 닫힐 수 있으므로 별도 세션 사용)
+
+    이동 정보는 estimate 모드면 여기서 같이 계산하고,
+    route 모드는 OSRM 지연이 생성 응답에 붙지 않도록 리포트 첫 조회 때 계산한다.
+    """
+    db = SessionLocal()
+    try:
+        itinerary = crud.create_itinerary(db, body, ai_title=title, ai_summary=full_text)
+        TravelService.annotate_on_create(db, itinerary)
+        return ItineraryOut(
+            id=itinerary.id,
+            country_code=itinerary.country_code,
+            region_code=itinerary.region_code,
+            days=itinerary.days,
+            start_date=itinerary.start_date,
+            theme=itinerary.theme,
+            title=itinerary.title,
+            ai_summary=ItineraryDetailService.summary_text(itinerary),
+            selected_landmark_ids=_parse_selected_ids(itinerary.selected_landmark_ids or ""),
+            created_at=itinerary.created_at.isoformat(),
+        )
+    finally:
+        db.close()
+
+
+@router.post("/generate/stream")
+async def generate_itinerary_stream(
+    body: ItineraryCreate,
+    db: Session = Depends(get_db),
+):
+    """
+    일정 생성 스트리밍 버전 (Server-Sent Events).
+
+    이벤트 순서:
+    - overview : overview 객체가 완성되는 즉시
+    - day      : daily_plan 의 각 날짜가 완성되는 즉시 (Day 1, Day 2 ...)
+    - done     : 선택 랜드마크 보정 + 저장까지 끝난 최종 일정(ItineraryOut, id 포함)
+    - error    : 생성/저장 실패 시
+    """
+    landmarks = await run_in_threadpool(crud.get_landmarks_by_ids, db, body.selected_landmark_ids)
+
+    async def event_stream():
+        try:
+            async for event, payload in PlannerService.stream_itinerary_events_async(body, landmarks):
+                if event == "complete":
+                    title, full_text = payload
+                    itinerary_out = await run_in_threadpool(_store_itinerary, body, title, full_text)
+                    yield _sse("done", itinerary_out.model_dump())
+                else:
+                    yield _sse(event, payload)
+        except Exception as e:
+            print(f"[ItinerariesRouter] 스트리밍 생성 실패: {e}")
+            yield _sse("error", {"detail": "일정 생성 중 오류가 발생했습니다."})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@router.post("/jobs", response_model=ItineraryJobOut, status_code=202)
+async def create_itinerary_job(body: ItineraryCreate):
+    """
+    일정 생성을 백그라운드 작업으로 등록하고 job_id를 바로 반환.
+    결과는 GET /itineraries/jobs/{job_id} 로 조회 (done 이면 itinerary_id 포함).
+    """
+    try:
+        return await itinerary_jobs.submit(body)
+    except JobQueueFullError:
+        raise HTTPException(status_code=503, detail="대기 중인 일정 생성 작업이 너무 많습니다. 잠시 후 다시 시도해 주세요.")
+
+
+@router.get("/jobs/{job_id}", response_model=ItineraryJobOut)
+async def get_itinerary_job(job_id: str):
+    """
+    일정 생성 작업 상태 조회: queued / running / done / failed
+    """
+    job = await itinerary_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
 @router.get("/{itinerary_id}", response_model=ItineraryOut)
 def get_itinerary(
     itinerary_id: int,
@@ -90,7 +197,7 @@ def get_itinerary(
         start_date=itinerary.start_date,   # 🔹 추가
         theme=itinerary.theme,
         title=itinerary.title,
-        ai_summary=itinerary.ai_summary,
+        ai_summary=ItineraryDetailService.summary_text(itinerary),
         selected_landmark_ids=_parse_selected_ids(itinerary.selected_landmark_ids or ""),
         created_at=itinerary.created_at.isoformat(),
     )
@@ -113,13 +220,12 @@ def download_itinerary_csv(
     if not itinerary:
         raise HTTPException(status_code=404, detail="일정을 찾을 수 없습니다.")
 
-    if not itinerary.ai_summary:
+    if not ItineraryDetailService.has_detail(itinerary):
         raise HTTPException(status_code=400, detail="이 일정에는 AI 요약 데이터가 없습니다.")
 
-    # 1) ai_summary(JSON 문자열) -> ItineraryDetail 파싱
+    # 1) 검증된 ItineraryDetail (일정 id 캐시 hit 이면 파싱/검증 없음)
     try:
-        detail_raw = json.loads(itinerary.ai_summary)
-        detail = ItineraryDetail(**detail_raw)
+        detail = ItineraryDetailService.load(itinerary)
     except Exception as e:
         print(f"[Itinerary CSV] ItineraryDetail 파싱 오류: {e}")
         raise HTTPException(status_code=500, detail="AI 일정 데이터 파싱에 실패했습니다.")
@@ -162,33 +268,49 @@ def download_itinerary_csv(
     )
 
 
-@router.get("/{itinerary_id}/report", response_model=ItineraryReportResponse)
-def get_itinerary_report(
-    itinerary_id: int,
-    db: Session = Depends(get_db),
-):
+def _region_forecast(itinerary: models.Itinerary) -> Optional[Awaitable[WeatherForecastResponse]]:
     """
-    리포트 페이지 전용 엔드포인트.
-
-    내려주는 내용:
-    - itinerary: 기본 일정 메타 정보(ItineraryOut)
-    - detail: Gemini가 만든 상세 일정(ItineraryDetail)
-    - restaurants / activities / museums:
-        - 일본(JP): 해당 region의 맛집 리스트
-        - 태국(TH): 액티비티 리스트
-        - 영국(UK): 박물관 리스트
+    일정 지역 중심 좌표 + 여행 기간의 예보 조회 코루틴. (시작일/지역을 모르면 None)
     """
-    itinerary = crud.get_itinerary(db, itinerary_id)
-    if not itinerary:
-        raise HTTPException(status_code=404, detail="일정을 찾을 수 없습니다.")
+    if itinerary.start_date is None or not itinerary.days:
+        return None
+    region = next(
+        (r for r in REGION_DATA.get(itinerary.country_code, []) if r.code == itinerary.region_code),
+        None,
+    )
+    if region is None:
+        return None
+    return WeatherService.get_forecast_async(region.lat, region.lon, itinerary.start_date, itinerary.days)
+
 
-    if not itinerary.ai_summary:
+# 마감 시간을 넘긴 예보 조회 (끝까지 돌면서 캐시를 채우도록 참조만 잡아둔다)
+_pending_forecasts: Set[asyncio.Task] = set()
+
+
+async def _await_forecast(task: asyncio.Task, started_at: float) -> Optional[WeatherForecastResponse]:
+    """
+    started_at(loop.time(), 예보 조회 시작 시각)부터 report_weather_deadline_seconds 까지 남은 시간만 기다린다.
+    """
+    elapsed = asyncio.get_running_loop().time() - started_at
+    remaining = max(0.0, settings.report_weather_deadline_seconds - elapsed)
+    done, _ = await asyncio.wait({task}, timeout=remaining)
+    if not done:
+        print(f"[ItineraryReport] 날씨 예보가 {settings.report_weather_deadline_seconds}s 안에 오지 않아 생략")
+        _pending_forecasts.add(task)
+        task.add_done_callback(_pending_forecasts.discard)
+        return None
+    forecast = task.result()
+    # 조회 실패 시 WeatherService 는 빈 예보를 돌려준다.
+    return forecast if forecast.daily else None
+
+
+def _build_report(db: Session, itinerary: models.Itinerary) -> ItineraryReportResponse:
+    if not ItineraryDetailService.has_detail(itinerary):
         raise HTTPException(status_code=400, detail="이 일정에는 AI 요약 데이터가 없습니다.")
 
-    # 1) ai_summary(JSON 문자열) -> ItineraryDetail 파싱
+    # 1) 검증된 ItineraryDetail (일정 id 캐시 hit 이면 파싱/검증 없음)
     try:
-        detail_raw = json.loads(itinerary.ai_summary)
-        detail = ItineraryDetail(**detail_raw)
+        detail = ItineraryDetailService.load(itinerary)
     except Exception as e:
         print(f"[ItineraryReport] ItineraryDetail 파싱 오류: {e}")
         raise HTTPException(status_code=500, detail="AI 일정 데이터 파싱에 실패했습니다.")
@@ -219,7 +341,7 @@ def get_itinerary_report(
         start_date=itinerary.start_date,
         theme=itinerary.theme,
         title=itinerary.title,
-        ai_summary=itinerary.ai_summary,
+        ai_summary=ItineraryDetailService.summary_text(itinerary),
         selected_landmark_ids=_parse_selected_ids(itinerary.selected_landmark_ids or ""),
         created_at=itinerary.created_at.isoformat(),
     )
@@ -227,7 +349,48 @@ def get_itinerary_report(
     return ItineraryReportResponse(
         itinerary=itinerary_out,
         detail=detail,
+        travel=TravelService.load(db, itinerary),
         restaurants=restaurants,
         activities=activities,
         museums=museums,
     )
+
+
+@router.get("/{itinerary_id}/report", response_model=ItineraryReportResponse)
+async def get_itinerary_report(
+    itinerary_id: int,
+    include_weather: bool = Query(False, description="지역 날씨 예보(여행 기간)도 함께 내려주기"),
+    db: Session = Depends(get_db),
+):
+    """
+    리포트 페이지 전용 엔드포인트.
+
+    내려주는 내용:
+    - itinerary: 기본 일정 메타 정보(ItineraryOut)
+    - detail: Gemini가 만든 상세 일정(ItineraryDetail)
+    - restaurants / activities / museums:
+        - 일본(JP): 해당 region의 맛집 리스트
+        - 태국(TH): 액티비티 리스트
+        - 영국(UK): 박물관 리스트
+    - weather (include_weather=true): 지역 중심 좌표의 여행 기간 예보
+        - 나머지 DB 조회와 동시에 진행, 캐시에 있으면 바로 사용
+        - 조회 시작부터 settings.report_weather_deadline_seconds 안에 못 받으면 weather 없이 응답
+          (DB 조회 시간도 마감 시간에 포함)
+    """
+    itinerary = await run_in_threadpool(crud.get_itinerary, db, itinerary_id)
+    if not itinerary:
+        raise HTTPException(status_code=404, detail="일정을 찾을 수 없습니다.")
+
+    forecast = _region_forecast(itinerary) if include_weather else None
+    if forecast is None:
+        return await run_in_threadpool(_build_report, db, itinerary)
+
+    started_at = asyncio.get_running_loop().time()
+    forecast_task = asyncio.ensure_future(forecast)
+    try:
+        report = await run_in_threadpool(_build_report, db, itinerary)
+    except BaseException:
+        forecast_task.cancel()
+        raise
+    report.weather = await _await_forecast(forecast_task, started_at)
+    return report
@@ -5,35 +5,21 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app import models
-from app.schemas import LandmarkOut, LandmarkCreate, LandmarkUpdate
+from app import crud, models
+from app.regions import is_supported
+from app.schemas import (
+    LandmarkOut,
+    LandmarkCreate,
+    LandmarkUpdate,
+    NearbyLandmarkOut,
+    NearbyRestaurantOut,
+    JapanRestaurantOut,
+)
+from app.services.matrix_service import DistanceMatrixService
+from app.services.spatial_service import SpatialService
 
 router = APIRouter()
 
-COUNTRY_CODE_TO_NAME = {
-    "JP": "일본",
-    "TH": "태국",
-    "UK": "영국",
-}
-
-REGION_CODE_TO_NAME = {
-    "JP": {
-        "tokyo": "도쿄",
-        "osaka": "오사카",
-        "fukuoka": "후쿠오카",
-    },
-    "TH": {
-        "bangkok": "방콕",
-        "phuket": "푸켓",
-        "chiangmai": "치앙마이",
-    },
-    "UK": {
-        "london": "런던",
-        "manchester": "맨체스터",
-        "liverpool": "리버풀",
-    },
-}
-
 
 @router.get("/", response_model=List[LandmarkOut])
 def list_landmarks(
@@ -47,22 +33,15 @@ def list_landmarks(
     - country_code + region_code: 해당 지역만
     - 둘 다 없으면 전체 반환 (개발용)
     """
-    query = db.query(models.Landmark)
-
     if country_code:
-        country_name = COUNTRY_CODE_TO_NAME.get(country_code)
-        if not country_name:
+        if not is_supported(country_code):
             raise HTTPException(status_code=400, detail="지원하지 않는 country_code 입니다.")
-        query = query.filter(models.Landmark.country == country_name)
-
-        if region_code:
-            region_map = REGION_CODE_TO_NAME.get(country_code, {})
-            region_name = region_map.get(region_code)
-            if not region_name:
-                raise HTTPException(status_code=400, detail="지원하지 않는 region_code 입니다.")
-            query = query.filter(models.Landmark.region == region_name)
+        if region_code and not is_supported(country_code, region_code):
+            raise HTTPException(status_code=400, detail="지원하지 않는 region_code 입니다.")
+    else:
+        region_code = None
 
-    landmarks = query.all()
+    landmarks = crud.get_landmarks(db, country_code=country_code, region_code=region_code)
     return [
         LandmarkOut(
             id=lm.id,
@@ -83,6 +62,67 @@ def list_landmarks(
     ]
 
 
+@router.get("/nearby", response_model=List[NearbyLandmarkOut], summary="주변 랜드마크 검색")
+def nearby_landmarks(
+    lat: float = Query(..., description="기준 위도"),
+    lon: float = Query(..., description="기준 경도"),
+    radius_km: float = Query(2.0, gt=0, le=50, description="검색 반경 (km)"),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    """
+    (lat, lon) 반경 radius_km 안의 랜드마크를 가까운 순으로 반환.
+    """
+    return [
+        NearbyLandmarkOut(landmark=LandmarkOut.model_validate(lm, from_attributes=True), distance_km=round(d, 3))
+        for lm, d in SpatialService.nearby_landmarks(db, lat, lon, radius_km, limit)
+    ]
+
+
+@router.get(
+    "/{landmark_id}/nearby/restaurants",
+    response_model=List[NearbyRestaurantOut],
+    summary="랜드마크 주변 맛집",
+)
+def restaurants_near_landmark(
+    landmark_id: int,
+    radius_km: float = Query(1.0, gt=0, le=50, description="검색 반경 (km)"),
+    limit: int = Query(10, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    lm = db.query(models.Landmark).filter(models.Landmark.id == landmark_id).first()
+    if not lm:
+        raise HTTPException(status_code=404, detail="랜드마크를 찾을 수 없습니다.")
+
+    return [
+        NearbyRestaurantOut(restaurant=JapanRestaurantOut.model_validate(r), distance_km=round(d, 3))
+        for r, d in SpatialService.nearby_restaurants(db, lm.lat, lm.lng, radius_km, limit)
+    ]
+
+
+@router.get(
+    "/{landmark_id}/nearby/landmarks",
+    response_model=List[NearbyLandmarkOut],
+    summary="랜드마크 주변 다른 랜드마크",
+)
+def landmarks_near_landmark(
+    landmark_id: int,
+    radius_km: float = Query(2.0, gt=0, le=50, description="검색 반경 (km)"),
+    limit: int = Query(10, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    lm = db.query(models.Landmark).filter(models.Landmark.id == landmark_id).first()
+    if not lm:
+        raise HTTPException(status_code=404, detail="랜드마크를 찾을 수 없습니다.")
+
+    return [
+        NearbyLandmarkOut(landmark=LandmarkOut.model_validate(other, from_attributes=True), distance_km=round(d, 3))
+        for other, d in SpatialService.nearby_landmarks(
+            db, lm.lat, lm.lng, radius_km, limit, exclude_id=lm.id
+        )
+    ]
+
+
 # 이하 CRUD는 필요하면 유지(관리용)
 
 @router.post("/", response_model=LandmarkOut)
@@ -98,9 +138,12 @@ def create_landmark(
         lng=body.lng,
         lat=body.lat,
     )
+    crud.fill_region_codes(lm)
     db.add(lm)
     db.commit()
     db.refresh(lm)
+    DistanceMatrixService.invalidate()
+    SpatialService.upsert_landmark(lm)
     return lm
 
 
@@ -116,9 +159,12 @@ def update_landmark(
 
     for field, value in body.model_dump(exclude_unset=True).items():
         setattr(lm, field, value)
+    crud.fill_region_codes(lm)
 
     db.commit()
     db.refresh(lm)
+    DistanceMatrixService.invalidate()
+    SpatialService.upsert_landmark(lm)
     return lm
 
 
@@ -133,4 +179,6 @@ def delete_landmark(
 
     db.delete(lm)
     db.commit()
+    DistanceMatrixService.invalidate()
+    SpatialService.remove_landmark(landmark_id)
     return {"ok": True}
@@ -0,0 +1,22 @@
+# backend/app/routers/metrics_router.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+
+router = APIRouter()
+
+
+# Prometheus 스크레이프용: GET /metrics
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def prometheus_metrics():
+    return PlainTextResponse(
+        registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+# 사람이 보거나 벤치마크 스크립트에서 쓰는 JSON 버전: GET /metrics/json
+@router.get("/metrics/json")
+def metrics_snapshot():
+    return registry.snapshot()
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.db.session import get_db
-from app import models
+from app import crud
 from app.schemas import (
     TravelOverview,
     LandmarkOut,
@@ -12,10 +12,7 @@ from app.schemas import (
     ThailandActivityOut,
     UkMuseumOut,
 )
-from .landmark_router import (
-    COUNTRY_CODE_TO_NAME,
-    REGION_CODE_TO_NAME,
-)
+from app.regions import COUNTRY_CODE_TO_NAME, REGION_CODE_TO_NAME
 
 router = APIRouter()
 
@@ -45,12 +42,7 @@ def get_travel_overview(
         raise HTTPException(status_code=400, detail="지원하지 않는 region_code 입니다.")
 
     # 랜드마크
-    lm_q = (
-        db.query(models.Landmark)
-        .filter(models.Landmark.country == country_name)
-        .filter(models.Landmark.region == region_name)
-        .all()
-    )
+    lm_q = crud.get_landmarks(db, country_code=country_code, region_code=region_code)
     landmarks = [
         LandmarkOut(
             id=lm.id,
@@ -75,27 +67,15 @@ def get_travel_overview(
     museums: List[UkMuseumOut] = []
 
     if country_code == "JP":
-        rs_q = (
-            db.query(models.JapanRestaurant)
-            .filter(models.JapanRestaurant.region == region_name)
-            .all()
-        )
+        rs_q = crud.get_japan_restaurants_by_region(db, region_code)
         restaurants = [JapanRestaurantOut.model_validate(r) for r in rs_q]
 
     elif country_code == "TH":
-        ac_q = (
-            db.query(models.ThailandActivity)
-            .filter(models.ThailandActivity.region == region_name)
-            .all()
-        )
+        ac_q = crud.get_thailand_activities_by_region(db, region_code)
         activities = [ThailandActivityOut.model_validate(a) for a in ac_q]
 
     elif country_code == "UK":
-        mu_q = (
-            db.query(models.UkMuseum)
-            .filter(models.UkMuseum.region == region_name)
-            .all()
-        )
+        mu_q = crud.get_uk_museums_by_region(db, region_code)
         museums = [UkMuseumOut.model_validate(m) for m in mu_q]
 
     return TravelOverview(
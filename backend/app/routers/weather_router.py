@@ -1,23 +1,42 @@
-from fastapi import APIRouter, Query, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from datetime import date
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.db.session import get_db
 from app.services.weather_service import WeatherService
-from app.services.distance_service import DistanceService
+from app.services.distance_service import DistanceService, DistanceServiceError
+from app.services.matrix_service import DistanceMatrixService
+from app.services.route_service import RouteService
 
-from app.schemas import WeatherResponse, DistanceResponse, WeatherForecastResponse
+from app.schemas import (
+    WeatherResponse,
+    DistanceResponse,
+    DistanceMatrixResponse,
+    RouteRequest,
+    RouteResponse,
+    WeatherForecastResponse,
+    WeatherForecastBatchRequest,
+    WeatherForecastBatchResponse,
+)
 
 router = APIRouter()
 
 # 날씨 확인: /api/v1/weather/check
 @router.get("/check", response_model=WeatherResponse)
-def check_weather(lat: float, lon: float):
+async def check_weather(lat: float, lon: float):
     """
     단순 현재 날씨 (지금 시점)
     """
-    return WeatherService.get_current_weather(lat, lon)
+    return await WeatherService.get_current_weather_async(lat, lon)
 
 # 일정 기반 일별 예보: /api/v1/weather/forecast
 @router.get("/forecast", response_model=WeatherForecastResponse, summary="여행 기간 날씨 예보 조회")
-def get_weather_forecast(
+async def get_weather_forecast(
     lat: float = Query(..., description="지역 중심 위도"),
     lon: float = Query(..., description="지역 중심 경도"),
     start_date: date = Query(..., description="여행 시작일 (YYYY-MM-DD)"),
@@ -28,7 +47,7 @@ def get_weather_forecast(
 
     days = (end_date - start_date).days + 1
 
-    return WeatherService.get_forecast(
+    return await WeatherService.get_forecast_async(
         lat=lat,
         lon=lon,
         start_date=start_date,
@@ -36,12 +55,101 @@ def get_weather_forecast(
     )
 
 
+# 여러 좌표 예보 한 번에: /api/weather/forecast/batch
+@router.post("/forecast/batch", response_model=WeatherForecastBatchResponse, summary="여러 좌표 날씨 예보 일괄 조회")
+async def get_weather_forecast_batch(body: WeatherForecastBatchRequest):
+    """
+    같은 기간의 여러 좌표 예보. 캐시에 없는 좌표만 모아서 Open-Meteo 요청 1번(좌표 묶음)으로 처리한다.
+    """
+    if body.end_date < body.start_date:
+        raise HTTPException(status_code=400, detail="end_date는 start_date 이후여야 합니다.")
+    if len(body.locations) > settings.weather_batch_max_locations:
+        raise HTTPException(
+            status_code=400,
+            detail=f"좌표는 최대 {settings.weather_batch_max_locations}개까지 가능합니다.",
+        )
+
+    days = (body.end_date - body.start_date).days + 1
+
+    return WeatherForecastBatchResponse(
+        forecasts=await WeatherService.get_forecast_batch_async(
+            [(loc.lat, loc.lon) for loc in body.locations],
+            start_date=body.start_date,
+            days=days,
+        )
+    )
+
+
 # 거리 확인: /api/v1/weather/distance
 @router.get("/distance", response_model=DistanceResponse)
-def check_distance(
+async def check_distance(
     slat: float = Query(..., description="출발 위도"),
     slon: float = Query(..., description="출발 경도"),
     elat: float = Query(..., description="도착 위도"),
     elon: float = Query(..., description="도착 경도")
 ):
-    return DistanceService.get_distance(slat, slon, elat, elon)
\ No newline at end of file
+    try:
+        return await DistanceService.get_distance_async(slat, slon, elat, elon)
+    except DistanceServiceError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+# 여러 지점 경로 한 번에: /api/weather/distance/route
+@router.post("/distance/route", response_model=RouteResponse, summary="경유지 순서대로 구간별/전체 거리")
+async def get_route(body: RouteRequest, db: Session = Depends(get_db)):
+    """
+    - waypoints: 방문 순서대로 좌표 목록
+    - 또는 itinerary_id + day: 저장된 일정의 그날 방문 순서 (좌표를 아는 랜드마크만)
+
+    구간마다 /distance 를 따로 부르는 대신 OSRM 요청 1번으로 처리한다.
+    """
+    if body.waypoints is not None:
+        waypoints = body.waypoints
+    elif body.itinerary_id is not None and body.day is not None:
+        itinerary = await run_in_threadpool(crud.get_itinerary, db, body.itinerary_id)
+        if not itinerary:
+            raise HTTPException(status_code=404, detail="일정을 찾을 수 없습니다.")
+        try:
+            waypoints = await run_in_threadpool(RouteService.day_waypoints, db, itinerary, body.day)
+        except Exception:
+            raise HTTPException(status_code=500, detail="AI 일정 데이터 파싱에 실패했습니다.")
+    else:
+        raise HTTPException(status_code=400, detail="waypoints 또는 itinerary_id + day 가 필요합니다.")
+
+    # 요청 쪽 문제라 upstream 실패(502)가 아니라 400 으로 돌려준다.
+    if len(waypoints) > settings.osrm_max_waypoints:
+        raise HTTPException(
+            status_code=400,
+            detail=f"경유지는 최대 {settings.osrm_max_waypoints}개까지 가능합니다.",
+        )
+
+    try:
+        return await DistanceService.get_route_async(waypoints)
+    except DistanceServiceError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+# 지역 랜드마크 거리/시간 행렬 (외부 API 호출 없음): /api/v1/weather/distance/matrix
+@router.get("/distance/matrix", response_model=DistanceMatrixResponse, summary="지역 랜드마크 거리/시간 행렬")
+def get_distance_matrix(
+    country_code: str = Query(..., description="JP/TH/UK"),
+    region_code: str = Query(..., description="tokyo / bangkok / london ..."),
+    mode: str = Query("walking", description="walking / transit / driving"),
+    landmark_ids: Optional[List[int]] = Query(None, description="일부 랜드마크만 (생략 시 지역 전체)"),
+    db: Session = Depends(get_db),
+):
+    try:
+        ids, distance, duration = DistanceMatrixService.region_matrix(
+            db, country_code, region_code, mode=mode, landmark_ids=landmark_ids
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return DistanceMatrixResponse(
+        country_code=country_code,
+        region_code=region_code,
+        mode=mode,
+        landmark_ids=ids,
+        distance_km=distance.round(3).tolist(),
+        duration_min=duration.round(1).tolist(),
+    )
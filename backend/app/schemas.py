@@ -1,7 +1,7 @@
 # backend/app/schemas.py
 from typing import List, Optional
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # ─────────────────────────────
@@ -12,6 +12,45 @@ class DistanceResponse(BaseModel):
     duration_min: float     # 소요 시간 (분)
 
 
+class RouteWaypoint(BaseModel):
+    lat: float
+    lon: float
+    name: Optional[str] = None
+    landmark_id: Optional[int] = None
+
+
+class RouteRequest(BaseModel):
+    """
+    waypoints(순서대로) 또는 itinerary_id + day 중 하나.
+    """
+    waypoints: Optional[List[RouteWaypoint]] = None
+    itinerary_id: Optional[int] = None
+    day: Optional[int] = None
+
+
+class RouteLeg(BaseModel):
+    from_index: int         # waypoints 인덱스
+    to_index: int
+    distance_km: float
+    duration_min: float
+
+
+class RouteResponse(BaseModel):
+    waypoints: List[RouteWaypoint]
+    legs: List[RouteLeg]
+    total_distance_km: float
+    total_duration_min: float
+
+
+class DistanceMatrixResponse(BaseModel):
+    country_code: str
+    region_code: str
+    mode: str                          # walking / transit / driving
+    landmark_ids: List[int]            # 행/열 순서
+    distance_km: List[List[float]]     # [i][j] = i → j 추정 거리 (km)
+    duration_min: List[List[float]]    # [i][j] = i → j 추정 소요 시간 (분)
+
+
 # ─────────────────────────────
 # 날씨
 # ─────────────────────────────
@@ -40,6 +79,21 @@ class WeatherForecastResponse(BaseModel):
     daily: List[WeatherDaily]
 
 
+class WeatherLocation(BaseModel):
+    lat: float
+    lon: float
+
+
+class WeatherForecastBatchRequest(BaseModel):
+    locations: List[WeatherLocation]
+    start_date: date
+    end_date: date
+
+
+class WeatherForecastBatchResponse(BaseModel):
+    forecasts: List[WeatherForecastResponse]   # locations 와 같은 순서
+
+
 # ─────────────────────────────
 # Gemini(AI) 관련 스키마
 # ─────────────────────────────
@@ -115,6 +169,11 @@ class LandmarkOut(BaseModel):
         orm_mode = True
 
 
+class NearbyLandmarkOut(BaseModel):
+    landmark: LandmarkOut
+    distance_km: float      # 기준 지점으로부터의 직선거리 (km)
+
+
 # ─────────────────────────────
 # 일정(Itinerary)
 # ─────────────────────────────
@@ -143,6 +202,16 @@ class ItineraryOut(BaseModel):
         from_attributes = True
 
 
+class ItineraryJobOut(BaseModel):
+    """
+    일정 생성 백그라운드 작업 상태 (POST /itineraries/jobs, GET /itineraries/jobs/{job_id})
+    """
+    job_id: str
+    status: str                          # queued / running / done / failed
+    itinerary_id: Optional[int] = None   # done 일 때 생성된 일정 id
+    error: Optional[str] = None          # failed 일 때 사유
+
+
 # ─────────────────────────────
 # 일정 상세(JSON 구조) - Gemini 응답 형식
 # ─────────────────────────────
@@ -165,6 +234,8 @@ class ItineraryDayPlan(BaseModel):
     title: str
     reason: str
     landmarks: List[ItineraryDayLandmark]
+    # 동선 최적화 후 서버가 채우는 값 (Gemini 응답 스키마에서는 제외)
+    travel_distance_km: Optional[float] = Field(None, json_schema_extra={"readOnly": True})
 
 
 class ItineraryTips(BaseModel):
@@ -178,6 +249,42 @@ class ItineraryDetail(BaseModel):
     tips: ItineraryTips
 
 
+# 일자별 병렬 생성 모드에서 먼저 받는 뼈대 (overview + tips + 날짜별 주제)
+class ItinerarySkeletonDay(BaseModel):
+    day: int
+    title: str
+    focus: str          # 그날 돌아볼 동네/주제 (일자별 프롬프트에 전달)
+
+
+class ItinerarySkeleton(BaseModel):
+    overview: ItineraryOverview
+    days: List[ItinerarySkeletonDay]
+    tips: ItineraryTips
+
+
+# 일정 생성 시 미리 계산해 두는 이동 거리/시간
+class TravelLeg(BaseModel):
+    from_name: str
+    to_name: str
+    from_landmark_id: Optional[int] = None
+    to_landmark_id: Optional[int] = None
+    distance_km: float
+    duration_min: float
+
+
+class DayTravel(BaseModel):
+    day: int
+    legs: List[TravelLeg] = []
+    total_distance_km: float = 0.0
+    total_duration_min: float = 0.0
+
+
+class ItineraryTravelOut(BaseModel):
+    source: str                 # route(DistanceService) / estimate(오프라인 행렬)
+    mode: str                   # walking / transit / driving
+    days: List[DayTravel]
+
+
 # ─────────────────────────────
 # 체크리스트 (간단 버전)
 # ─────────────────────────────
@@ -204,6 +311,11 @@ class JapanRestaurantOut(BaseModel):
         from_attributes = True
 
 
+class NearbyRestaurantOut(BaseModel):
+    restaurant: JapanRestaurantOut
+    distance_km: float      # 기준 지점으로부터의 직선거리 (km)
+
+
 class ThailandActivityOut(BaseModel):
     id: int
     region: str
@@ -251,6 +363,9 @@ class ItineraryReportResponse(BaseModel):
     travel_overview: Optional[TravelOverview] = None
     weather: Optional[WeatherForecastResponse] = None
 
+    # 일정 생성 때 계산해 둔 구간별/일자별 이동 거리·시간
+    travel: Optional[ItineraryTravelOut] = None
+
     # 아래 세 개는 travel_overview 안에도 있지만,
     # 프론트에서 편하게 쓰라고 최상단에도 남겨둔 구조 (원하는 대로 유지/삭제 가능)
     restaurants: List[JapanRestaurantOut] = []
@@ -0,0 +1,50 @@
+# backend/app/services/catalog_service.py
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.schemas import ItineraryCreate
+
+
+class CatalogService:
+    """
+    미리 생성해 둔 일정 카탈로그(itinerary_catalog) 조회.
+
+    - 선택 랜드마크가 없는 요청만 대상 (랜드마크가 있으면 요청마다 내용이 달라짐)
+    - (country_code, region_code, days, theme)이 정확히 일치할 때만 사용
+      (PlannerService.request_key 와 같이 국가 대문자 / 지역 소문자 / 테마 casefold 로 맞춰서 비교)
+    """
+
+    @staticmethod
+    def normalize_codes(country_code: str, region_code: str) -> tuple[str, str]:
+        return country_code.strip().upper(), region_code.strip().lower()
+
+    @staticmethod
+    def normalize_theme(theme: Optional[str]) -> str:
+        # 코드와 마찬가지로 대소문자 차이는 같은 요청으로 본다. (None / "" = 테마 없음)
+        return (theme or "").strip().casefold()
+
+    @staticmethod
+    def lookup(db: Session, itinerary_in: ItineraryCreate) -> Optional[tuple[str, str]]:
+        """
+        카탈로그에 있으면 (제목, ItineraryDetail JSON 문자열), 없으면 None.
+        """
+        if not settings.itinerary_catalog_enabled or itinerary_in.selected_landmark_ids:
+            return None
+
+        country_code, region_code = CatalogService.normalize_codes(
+            itinerary_in.country_code, itinerary_in.region_code
+        )
+        entry = crud.get_catalog_entry(
+            db,
+            country_code=country_code,
+            region_code=region_code,
+            days=itinerary_in.days,
+            theme=CatalogService.normalize_theme(itinerary_in.theme),
+        )
+        if entry is None:
+            return None
+        return entry.title or "여행 일정", entry.ai_summary
@@ -0,0 +1,141 @@
+# backend/app/services/catalog_warmer.py
+"""
+일정 카탈로그 미리 채우기 스크립트.
+
+REGION_DATA의 모든 지역 × settings.catalog_days × settings.catalog_themes 조합에 대해
+선택 랜드마크 없는 일정을 생성해서 itinerary_catalog 테이블에 저장한다.
+
+- 이미 저장된 조합은 건너뛰므로 중간에 끊겨도 다시 실행하면 이어서 진행
+- settings.catalog_warmer_requests_per_minute 로 Gemini 호출 속도 제한
+- 파싱/검증에 실패한 결과는 저장하지 않음 (다음 실행 때 다시 시도)
+
+사용법:
+    python -m app.services.catalog_warmer             # 채우기
+    python -m app.services.catalog_warmer --report    # 커버리지만 출력
+    python -m app.services.catalog_warmer --limit 20  # 이번 실행에서 최대 20개만 생성
+"""
+import argparse
+import time
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.routers.region_router import REGION_DATA
+from app.schemas import ItineraryCreate, ItineraryDetail
+from app.services.catalog_service import CatalogService
+from app.services.planner_service import PlannerService
+
+CatalogKey = Tuple[str, str, int, str]
+
+
+def build_grid(days: List[int], themes: List[str]) -> List[CatalogKey]:
+    grid: List[CatalogKey] = []
+    for country_code, regions in REGION_DATA.items():
+        for region in regions:
+            for d in days:
+                for theme in themes:
+                    grid.append((country_code, region.code, d, CatalogService.normalize_theme(theme)))
+    return grid
+
+
+def existing_keys(db: Session) -> set:
+    return {
+        (e.country_code, e.region_code, e.days, e.theme)
+        for e in crud.list_catalog_entries(db)
+    }
+
+
+def print_coverage(grid: List[CatalogKey], done: set) -> None:
+    total = len(grid)
+    covered = sum(1 for key in grid if key in done)
+    pct = (covered / total * 100) if total else 0.0
+    print(f"[catalog] 전체 커버리지: {covered}/{total} ({pct:.1f}%)")
+
+    for country_code, regions in REGION_DATA.items():
+        for region in regions:
+            keys = [k for k in grid if k[0] == country_code and k[1] == region.code]
+            hit = sum(1 for k in keys if k in done)
+            print(f"  - {country_code}/{region.code}: {hit}/{len(keys)}")
+
+
+def generate_entry(db: Session, key: CatalogKey) -> bool:
+    country_code, region_code, days, theme = key
+    itinerary_in = ItineraryCreate(
+        country_code=country_code,
+        region_code=region_code,
+        days=days,
+        start_date=date.today(),
+        theme=theme or None,
+        selected_landmark_ids=[],
+    )
+    title, json_text = PlannerService.generate_itinerary_text(itinerary_in, [])
+
+    # 형식이 맞는 결과만 카탈로그에 넣는다.
+    try:
+        ItineraryDetail.model_validate_json(json_text)
+    except Exception as e:
+        print(f"[catalog] 검증 실패, 건너뜀 {key}: {e}")
+        return False
+
+    crud.create_catalog_entry(
+        db,
+        country_code=country_code,
+        region_code=region_code,
+        days=days,
+        theme=theme,
+        ai_title=title,
+        ai_summary=json_text,
+    )
+    return True
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="일정 카탈로그 미리 생성")
+    parser.add_argument("--report", action="store_true", help="커버리지만 출력하고 종료")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 생성할 최대 개수")
+    args = parser.parse_args(argv)
+
+    grid = build_grid(settings.catalog_days, settings.catalog_themes)
+    db: Session = SessionLocal()
+
+    try:
+        done = existing_keys(db)
+        if args.report:
+            print_coverage(grid, done)
+            return
+
+        todo = [key for key in grid if key not in done]
+        if args.limit is not None:
+            todo = todo[: args.limit]
+        print(f"[catalog] 생성 대상 {len(todo)}개 (이미 있음 {len(grid) - len(todo)}개)")
+
+        interval = 60.0 / settings.catalog_warmer_requests_per_minute
+        ok = failed = 0
+        last_call = 0.0
+
+        for key in todo:
+            # 속도 제한: 직전 호출로부터 interval 초가 지나야 다음 호출
+            wait = last_call + interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            last_call = time.monotonic()
+
+            if generate_entry(db, key):
+                ok += 1
+                done.add(key)
+                print(f"[OK] {key}")
+            else:
+                failed += 1
+
+        print(f"[catalog] 완료: 성공 {ok}, 실패 {failed}")
+        print_coverage(grid, done)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# backend/app/services/cluster_service.py
+
+import math
+from typing import Dict, List
+
+import numpy as np
+
+from app.models import Landmark
+
+
+class ClusterService:
+    """
+    선택 랜드마크를 여행 일수만큼의 "가까운 것끼리" 묶음으로 나눈다.
+
+    - 용량 제한 k-means: 하루 최대 ceil(N / days)개가 되도록 균형을 맞춘다.
+    - 초기 중심은 farthest-point 방식으로 골라 랜덤 요소가 없다. (같은 입력 → 같은 결과)
+    - 묶음(day) 번호는 중심 경도 → 위도 순으로 매겨 서→동 흐름이 되게 한다.
+    """
+
+    MAX_ITERATIONS = 20
+
+    @staticmethod
+    def _initial_centers(points: np.ndarray, k: int) -> np.ndarray:
+        centroid = points.mean(axis=0)
+        first = int(np.argmax(((points - centroid) ** 2).sum(axis=1)))
+        chosen = [first]
+        min_dist = ((points - points[first]) ** 2).sum(axis=1)
+        while len(chosen) < k:
+            nxt = int(np.argmax(min_dist))
+            chosen.append(nxt)
+            min_dist = np.minimum(min_dist, ((points - points[nxt]) ** 2).sum(axis=1))
+        return points[chosen].copy()
+
+    @staticmethod
+    def _balanced_assign(dist: np.ndarray, capacity: int) -> np.ndarray:
+        """
+        (점, 중심) 쌍을 거리 순으로 훑으면서 자리가 남은 중심에 배정.
+        """
+        n, k = dist.shape
+        labels = np.full(n, -1, dtype=int)
+        counts = np.zeros(k, dtype=int)
+        for flat in np.argsort(dist, axis=None, kind="stable"):
+            i, c = divmod(int(flat), k)
+            if labels[i] != -1 or counts[c] >= capacity:
+                continue
+            labels[i] = c
+            counts[c] += 1
+        return labels
+
+    @staticmethod
+    def cluster(landmarks: List[Landmark], days: int) -> Dict[int, int]:
+        """
+        landmark_id → 0부터 시작하는 day 인덱스.
+        """
+        if not landmarks or days <= 0:
+            return {}
+
+        ordered = sorted(landmarks, key=lambda lm: lm.id)
+        if days == 1:
+            return {lm.id: 0 for lm in ordered}
+
+        # 위경도를 평면 좌표(km)로 근사 (도시 하나 범위라 충분)
+        lat0 = math.radians(float(np.mean([lm.lat for lm in ordered])))
+        points = np.array(
+            [[lm.lng * math.cos(lat0) * 111.32, lm.lat * 110.57] for lm in ordered],
+            dtype=np.float64,
+        )
+
+        k = min(days, len(ordered))
+        capacity = math.ceil(len(ordered) / k)
+        centers = ClusterService._initial_centers(points, k)
+        labels = np.full(len(ordered), -1, dtype=int)
+
+        for _ in range(ClusterService.MAX_ITERATIONS):
+            dist = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+            new_labels = ClusterService._balanced_assign(dist, capacity)
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            # 빈 묶음은 이전 중심을 그대로 둔다.
+            centers = np.array([
+                points[labels == c].mean(axis=0) if (labels == c).any() else centers[c]
+                for c in range(k)
+            ])
+
+        # 묶음 순서: 중심 경도(서→동), 같으면 위도
+        rank = sorted(range(k), key=lambda c: (centers[c][0], centers[c][1]))
+        day_of_cluster = {c: day for day, c in enumerate(rank)}
+        return {lm.id: day_of_cluster[int(labels[i])] for i, lm in enumerate(ordered)}
@@ -6,6 +6,7 @@ import csv
 from typing import List
 
 from app import models
+from app.services.itinerary_detail_service import ItineraryDetailService
 from app.schemas import (
     ItineraryDetail,
     JapanRestaurantOut,
@@ -25,7 +26,7 @@ class CSVService:
         writer = csv.writer(output)
 
         writer.writerow(["line_no", "text"])
-        text = (itinerary.ai_summary or "").replace("\r\n", "\n")
+        text = ItineraryDetailService.summary_text(itinerary).replace("\r\n", "\n")
         for idx, line in enumerate(text.split("\n"), start=1):
             writer.writerow([idx, line])
 
@@ -1,19 +1,187 @@
 # backend/app/services/distance_service.py
 
-import requests
-from app.schemas import DistanceResponse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.cache import TieredCache
+from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.metrics import registry
+from app.core.swr import Revalidator
+from app.schemas import DistanceResponse, RouteLeg, RouteResponse, RouteWaypoint
+from app.services.road_graph import LocalRouter
+
+
+# 좌표(약 10m 단위로 반올림) → 거리/시간 캐시 (메모리 LRU + SQLite)
+distance_cache = TieredCache(
+    namespace="distance",
+    ttl_seconds=settings.distance_cache_ttl_seconds,
+    max_memory_entries=settings.distance_cache_memory_size,
+    db_path=settings.distance_cache_db_path,
+    max_db_entries=settings.distance_cache_db_max_entries,
+    stale_seconds=settings.distance_stale_seconds if settings.swr_enabled else 0,
+)
+
+# 만료된 거리는 바로 응답하고 뒤에서 갱신, 자주 보는 구간은 만료 전에 갱신
+distance_revalidator = Revalidator("distance")
+
+DISTANCE_REQUESTS = registry.counter(
+    "distance_requests_total", "거리 조회 수 (result: ok/error/cache_hit/stale_hit/negative_hit)", ("result",)
+)
+
+
+def _cache_metrics():
+    stats = distance_cache.stats()
+    labels = '{namespace="distance"}'
+    return [
+        ("distance_cache_hits", "거리 캐시 hit 수 (메모리+SQLite)",
+         {labels: stats["memory_hits"] + stats["db_hits"]}),
+        ("distance_cache_misses", "거리 캐시 miss 수", {labels: stats["misses"]}),
+    ]
+
+
+registry.register_collector(_cache_metrics)
+
+
+class DistanceServiceError(Exception):
+    """
+    OSRM 조회 실패 (타임아웃, 비정상 응답 등). 라우터에서 502로 변환한다.
+    """
+
+
+# 공유 HTTP 클라이언트 (재시도 + 서킷 브레이커, lifespan 에서 start/stop)
+distance_client = http_clients.register(
+    "osrm",
+    max_connections=settings.distance_pool_size,
+    connect_timeout=settings.distance_connect_timeout_seconds,
+    read_timeout=settings.distance_read_timeout_seconds,
+)
 
 
 class DistanceService:
     """
     OSRM 기반 거리/시간 계산 서비스.
 
-    - 현재는 두 지점 (start_lat, start_lon) → (end_lat, end_lon) 사이의
-      자동차 주행 기준 거리/시간만 계산.
-    - 추후에 '랜드마크 리스트'를 받아서 연속 구간 거리 합산 등으로 확장 가능.
+    - get_distance: 두 지점 사이 거리/시간
+    - get_route: 순서 있는 여러 지점을 OSRM route 요청 1번으로 구간별/전체 거리/시간 계산
+    - upstream 주소/프로필은 settings.osrm_base_url / osrm_profile (로컬 OSRM 사용 가능)
+    - settings.distance_backend 가 local/auto 면 data/roads 도로 그래프로 직접 계산 (LocalRouter)
+    - 호출은 공유 클라이언트(distance_client): 타임아웃 + 재시도 + 서킷 브레이커
+    - 라우터는 *_async 를 쓰고, 스레드에서 도는 동기 코드(TravelService 등)는 동기 버전을 쓴다.
+    - 결과는 좌표를 소수점 4자리(약 10m)로 반올림한 키로 캐시한다.
+      실패도 짧게(negative cache) 기억해서 죽은 서버를 연달아 두드리지 않는다.
+    - 만료 후 distance_stale_seconds 동안은 stale 값을 바로 주고 뒤에서 갱신 (app/core/swr.py)
     """
 
-    BASE_URL = "http://router.project-osrm.org/route/v1/driving"
+    @staticmethod
+    def _url(points: List[Tuple[float, float]]) -> str:
+        # OSRM API 요구사항: {경도},{위도} 순서
+        coords = ";".join(f"{lon},{lat}" for lat, lon in points)
+        base = settings.osrm_base_url.rstrip("/")
+        return f"{base}/route/v1/{settings.osrm_profile}/{coords}?overview=false"
+
+    @staticmethod
+    def _local_route(points: List[Tuple[float, float]]) -> Optional[Dict[str, Any]]:
+        """
+        local/auto 백엔드면 도로 그래프로 계산. None 이면 OSRM 으로 넘어간다.
+        """
+        backend = settings.distance_backend
+        if backend not in ("local", "auto"):
+            return None
+        route = LocalRouter.route(points)
+        if route is None and backend == "local":
+            raise DistanceServiceError("로컬 도로 그래프로 경로를 찾지 못했습니다.")
+        return route
+
+    @staticmethod
+    def _parse_osrm(data: Dict[str, Any]) -> Dict[str, Any]:
+        # OSRM 응답이 비정상인 경우
+        if data.get("code") != "Ok" or not data.get("routes"):
+            print(f"Distance Error: OSRM code={data.get('code')}")
+            raise DistanceServiceError(f"OSRM code={data.get('code')}")
+        return data["routes"][0]
+
+    @staticmethod
+    def _upstream_error(e: Exception) -> DistanceServiceError:
+        print(f"Distance Error: {e}")
+        return DistanceServiceError(f"거리 조회 실패: {type(e).__name__}")
+
+    @staticmethod
+    def _fetch_route(points: List[Tuple[float, float]]) -> Dict[str, Any]:
+        """
+        (lat, lon) 목록 → {"distance", "duration", "legs"} (m / 초). 실패는 DistanceServiceError.
+        """
+        route = DistanceService._local_route(points)
+        if route is not None:
+            return route
+        try:
+            data = distance_client.get_json(DistanceService._url(points))
+        except Exception as e:
+            raise DistanceService._upstream_error(e) from e
+        return DistanceService._parse_osrm(data)
+
+    @staticmethod
+    async def _fetch_route_async(points: List[Tuple[float, float]]) -> Dict[str, Any]:
+        # 도로 그래프 탐색은 CPU 작업이라 스레드에서
+        route = await asyncio.to_thread(DistanceService._local_route, points)
+        if route is not None:
+            return route
+        try:
+            data = await distance_client.aget_json(DistanceService._url(points))
+        except Exception as e:
+            raise DistanceService._upstream_error(e) from e
+        return DistanceService._parse_osrm(data)
+
+    @staticmethod
+    def _to_response(distance_m: float, duration_s: float) -> DistanceResponse:
+        return DistanceResponse(
+            distance_km=round(distance_m / 1000, 2),  # m -> km
+            duration_min=round(duration_s / 60, 1),   # sec -> min
+        )
+
+    @staticmethod
+    def cache_key(start_lat: float, start_lon: float, end_lat: float, end_lon: float) -> str:
+        return f"{start_lat:.4f},{start_lon:.4f};{end_lat:.4f},{end_lon:.4f}"
+
+    # ─────────────────────────────
+    # 두 지점
+    # ─────────────────────────────
+    @staticmethod
+    def _refresh_distance(key: str, points: List[Tuple[float, float]]) -> None:
+        DistanceService._store_distance(key, DistanceService._fetch_route(points))
+
+    @staticmethod
+    def _cached_distance(key: str, points: List[Tuple[float, float]]) -> Optional[DistanceResponse]:
+        entry = distance_cache.get_entry(key)
+        if entry is None:
+            return None
+        cached, expires_at = entry
+        if "error" in cached:
+            if expires_at <= time.time():
+                # 만료된 실패 기록은 쓰지 않는다.
+                return None
+            DISTANCE_REQUESTS.inc(result="negative_hit")
+            raise DistanceServiceError(cached["error"])
+
+        stale = distance_revalidator.observe(
+            key, expires_at, settings.distance_cache_ttl_seconds,
+            lambda: DistanceService._refresh_distance(key, points),
+        )
+        DISTANCE_REQUESTS.inc(result="stale_hit" if stale else "cache_hit")
+        return DistanceResponse(**cached)
+
+    @staticmethod
+    def _distance_failed(key: str, e: DistanceServiceError) -> None:
+        distance_cache.set(key, {"error": str(e)}, ttl_seconds=settings.distance_negative_ttl_seconds)
+        DISTANCE_REQUESTS.inc(result="error")
+
+    @staticmethod
+    def _store_distance(key: str, route: Dict[str, Any]) -> DistanceResponse:
+        result = DistanceService._to_response(route["distance"], route["duration"])
+        distance_cache.set(key, result.model_dump())
+        DISTANCE_REQUESTS.inc(result="ok")
+        return result
 
     @staticmethod
     def get_distance(
@@ -22,25 +190,142 @@ class DistanceService:
         end_lat: float,
         end_lon: float
     ) -> DistanceResponse:
-        # OSRM API 요구사항: {경도},{위도} 순서
-        coords = f"{start_lon},{start_lat};{end_lon},{end_lat}"
-        url = f"{DistanceService.BASE_URL}/{coords}?overview=false"
+        key = DistanceService.cache_key(start_lat, start_lon, end_lat, end_lon)
+        points = [(start_lat, start_lon), (end_lat, end_lon)]
+        cached = DistanceService._cached_distance(key, points)
+        if cached is not None:
+            return cached
 
         try:
-            res = requests.get(url)
-            res.raise_for_status()
-            data = res.json()
+            route = DistanceService._fetch_route(points)
+        except DistanceServiceError as e:
+            DistanceService._distance_failed(key, e)
+            raise
+        return DistanceService._store_distance(key, route)
 
-            if data.get("code") == "Ok":
-                route = data["routes"][0]
-                return DistanceResponse(
-                    distance_km=round(route["distance"] / 1000, 2),  # m -> km
-                    duration_min=round(route["duration"] / 60, 1),   # sec -> min
-                )
+    @staticmethod
+    async def get_distance_async(
+        start_lat: float,
+        start_lon: float,
+        end_lat: float,
+        end_lon: float
+    ) -> DistanceResponse:
+        key = DistanceService.cache_key(start_lat, start_lon, end_lat, end_lon)
+        points = [(start_lat, start_lon), (end_lat, end_lon)]
+        # 캐시(SQLite 단 + 락)는 스레드에서 (이벤트 루프를 막지 않게)
+        cached = await asyncio.to_thread(DistanceService._cached_distance, key, points)
+        if cached is not None:
+            return cached
 
-            # OSRM 응답이 비정상인 경우
-            return DistanceResponse(distance_km=0.0, duration_min=0.0)
+        try:
+            route = await DistanceService._fetch_route_async(points)
+        except DistanceServiceError as e:
+            await asyncio.to_thread(DistanceService._distance_failed, key, e)
+            raise
+        return await asyncio.to_thread(DistanceService._store_distance, key, route)
 
-        except Exception as e:
-            print(f"Distance Error: {e}")
-            return DistanceResponse(distance_km=0.0, duration_min=0.0)
+    # ─────────────────────────────
+    # 여러 지점 (경유지 순서대로)
+    # ─────────────────────────────
+    @staticmethod
+    def _route_keys(waypoints: List[RouteWaypoint]) -> List[str]:
+        # 라우터는 미리 400 으로 거른다. 여기서는 내부 호출(TravelService 등)이 estimate 로 대체하도록 DistanceServiceError.
+        if len(waypoints) > settings.osrm_max_waypoints:
+            raise DistanceServiceError(f"경유지는 최대 {settings.osrm_max_waypoints}개까지 가능합니다.")
+        return [DistanceService.cache_key(a.lat, a.lon, b.lat, b.lon) for a, b in zip(waypoints, waypoints[1:])]
+
+    @staticmethod
+    def _refresh_route(keys: List[str], points: List[Tuple[float, float]]) -> None:
+        DistanceService._store_legs(keys, DistanceService._fetch_route(points))
+
+    @staticmethod
+    def _cached_legs(keys: List[str], points: List[Tuple[float, float]]) -> Optional[List[DistanceResponse]]:
+        """
+        모든 구간이 캐시에 있으면 구간 목록, 아니면 None. 같은 경로가 최근 실패했으면 DistanceServiceError.
+        stale 구간이 섞여 있으면 그대로 쓰고 경로 전체를 뒤에서 갱신한다.
+        """
+        entries = [distance_cache.get_entry(k) for k in keys]
+        if all(e is not None and "error" not in e[0] for e in entries):
+            stale = distance_revalidator.observe(
+                "route:" + "|".join(keys),
+                min(expires_at for _, expires_at in entries),
+                settings.distance_cache_ttl_seconds,
+                lambda: DistanceService._refresh_route(keys, points),
+            )
+            DISTANCE_REQUESTS.inc(result="stale_hit" if stale else "cache_hit")
+            return [DistanceResponse(**value) for value, _ in entries]
+
+        failed = distance_cache.get("route:" + "|".join(keys))
+        if failed is not None:
+            DISTANCE_REQUESTS.inc(result="negative_hit")
+            raise DistanceServiceError(failed["error"])
+        return None
+
+    @staticmethod
+    def _route_failed(keys: List[str], e: DistanceServiceError) -> None:
+        distance_cache.set(
+            "route:" + "|".join(keys), {"error": str(e)}, ttl_seconds=settings.distance_negative_ttl_seconds
+        )
+        DISTANCE_REQUESTS.inc(result="error")
+
+    @staticmethod
+    def _store_legs(keys: List[str], route: Dict[str, Any]) -> List[DistanceResponse]:
+        legs = [DistanceService._to_response(leg["distance"], leg["duration"]) for leg in route.get("legs", [])]
+        if len(legs) != len(keys):
+            raise DistanceServiceError("OSRM 응답의 구간 수가 경유지와 맞지 않습니다.")
+        for key, leg in zip(keys, legs):
+            distance_cache.set(key, leg.model_dump())
+        DISTANCE_REQUESTS.inc(result="ok")
+        return legs
+
+    @staticmethod
+    def _route_response(waypoints: List[RouteWaypoint], legs: List[DistanceResponse]) -> RouteResponse:
+        return RouteResponse(
+            waypoints=waypoints,
+            legs=[
+                RouteLeg(from_index=i, to_index=i + 1, distance_km=leg.distance_km, duration_min=leg.duration_min)
+                for i, leg in enumerate(legs)
+            ],
+            total_distance_km=round(sum(leg.distance_km for leg in legs), 2),
+            total_duration_min=round(sum(leg.duration_min for leg in legs), 1),
+        )
+
+    @staticmethod
+    def get_route(waypoints: List[RouteWaypoint]) -> RouteResponse:
+        """
+        순서대로 방문하는 waypoints의 구간별(leg) + 전체 거리/시간.
+
+        - 모든 구간이 캐시에 있으면 upstream 호출 없이 바로 반환
+        - 아니면 OSRM route 요청 1번(다중 경유지)으로 전체를 받고, 구간별 결과를 캐시에 채운다.
+        """
+        keys = DistanceService._route_keys(waypoints)
+        if not keys:
+            return DistanceService._route_response(waypoints, [])
+
+        points = [(w.lat, w.lon) for w in waypoints]
+        legs = DistanceService._cached_legs(keys, points)
+        if legs is None:
+            try:
+                route = DistanceService._fetch_route(points)
+            except DistanceServiceError as e:
+                DistanceService._route_failed(keys, e)
+                raise
+            legs = DistanceService._store_legs(keys, route)
+        return DistanceService._route_response(waypoints, legs)
+
+    @staticmethod
+    async def get_route_async(waypoints: List[RouteWaypoint]) -> RouteResponse:
+        keys = DistanceService._route_keys(waypoints)
+        if not keys:
+            return DistanceService._route_response(waypoints, [])
+
+        points = [(w.lat, w.lon) for w in waypoints]
+        legs = await asyncio.to_thread(DistanceService._cached_legs, keys, points)
+        if legs is None:
+            try:
+                route = await DistanceService._fetch_route_async(points)
+            except DistanceServiceError as e:
+                await asyncio.to_thread(DistanceService._route_failed, keys, e)
+                raise
+            legs = await asyncio.to_thread(DistanceService._store_legs, keys, route)
+        return DistanceService._route_response(waypoints, legs)
@@ -1,11 +1,29 @@
 # backend/app/scripts/enrich_landmarks.py
+"""
+랜드마크 상세 정보(description_long 등) 일괄 생성 스크립트.
+
+- 여러 Gemini 호출을 동시에 진행 (--concurrency)
+- 토큰 버킷으로 분당 호출 수 제한 (--rpm)
+- --batch-size > 1 이면 여러 랜드마크를 한 프롬프트에 묶어 JSON 배열로 받음
+- --commit-every 개마다 한 번에 커밋. 커밋된 행은 description_long이 채워지므로
+  중간에 죽어도 다시 실행하면 남은 랜드마크부터 이어서 진행된다.
 
+사용법:
+    python -m app.services.enrich_landmarks --concurrency 8 --rpm 60 --batch-size 5
+"""
+
+import argparse
+import asyncio
 import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
 from sqlalchemy.orm import Session
 
+from app.core.rate_limit import TokenBucket
 from app.db.session import SessionLocal
 from app.models import Landmark
-from app.services.gemini_service import GeminiService
+from app.services.gemini_service import GeminiService, LLM_PARSE_FAILURES
 from app.services.planner_service import PlannerService   # 🔥 추가
 
 
@@ -39,6 +57,32 @@ PROMPT_TEMPLATE = """
 - JSON 바깥에 다른 텍스트(설명, 마크다운, ```json 등)를 절대 넣지 말 것.
 """
 
+BATCH_PROMPT_TEMPLATE = """
+너는 여행 가이드를 작성하는 역할이야.
+아래 여러 랜드마크 각각에 대해 한국어로 상세 설명을 만들어줘.
+
+[입력 정보 - 랜드마크 목록]
+{items}
+
+[출력 형식 - 반드시 JSON 배열 하나로만]
+[
+  {{
+    "id": 입력의 id 값 그대로 (정수),
+    "description_long": "문장 3~5개로, 이곳의 역사, 분위기, 뷰 포인트, 어떤 여행자에게 어울리는지 등을 포함해서 자세히.",
+    "highlight_points": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"],
+    "best_time": "방문하기 좋은 시간대 또는 계절",
+    "recommended_duration": "평균 체류 시간 (예: '1~2시간')",
+    "local_tip": "현지인/여행자에게 유용한 팁 1~3문장"
+  }}
+]
+
+규칙:
+- 입력 랜드마크마다 배열 원소 1개씩, 빠짐없이 작성한다.
+- 한국어 존댓말로 작성한다.
+- 기존 설명을 그대로 반복하지 말고, 그것을 확장/보완하는 느낌으로 쓴다.
+- JSON 바깥에 다른 텍스트(설명, 마크다운, ```json 등)를 절대 넣지 말 것.
+"""
+
 
 def build_prompt(lm: Landmark) -> str:
     return PROMPT_TEMPLATE.format(
@@ -49,52 +93,144 @@ def build_prompt(lm: Landmark) -> str:
     )
 
 
-def main():
+def build_batch_prompt(landmarks: List[Landmark]) -> str:
+    items = "\n".join(
+        f'- id: {lm.id}, 국가: {lm.country}, 지역: {lm.region}, '
+        f'이름: "{lm.name}", 기존 한 줄 설명: "{lm.description or ""}"'
+        for lm in landmarks
+    )
+    return BATCH_PROMPT_TEMPLATE.format(items=items)
+
+
+def apply_enrichment(lm: Landmark, data: Dict[str, Any]) -> None:
+    lm.description_long = data.get("description_long")
+    hp_list = data.get("highlight_points") or []
+    if isinstance(hp_list, list):
+        lm.highlight_points = "\n".join(hp_list)
+    else:
+        lm.highlight_points = None
+
+    lm.best_time = data.get("best_time")
+    lm.recommended_duration = data.get("recommended_duration")
+    lm.local_tip = data.get("local_tip")
+
+
+async def enrich_chunk(
+    chunk: List[Landmark],
+    limiter: TokenBucket,
+    semaphore: asyncio.Semaphore,
+) -> List[Tuple[Landmark, Optional[Dict[str, Any]]]]:
+    """
+    랜드마크 묶음 1개를 Gemini 1회 호출로 처리.
+    반환: [(랜드마크, 파싱된 데이터 또는 실패 시 None), ...]
+    """
+    async with semaphore:
+        await limiter.acquire()
+        prompt = build_prompt(chunk[0]) if len(chunk) == 1 else build_batch_prompt(chunk)
+        res = await GeminiService.get_chat_response_async(prompt, caller="enrich_landmarks")
+
+    raw = (res.answer or "").strip()
+    # 🔥 코드블럭 처리
+    json_text = PlannerService._extract_json_text(raw)
+
+    try:
+        data = json.loads(json_text)
+    except Exception as e:
+        names = ", ".join(f"{lm.id}:{lm.name}" for lm in chunk)
+        print(f"[ERROR] JSON 파싱 실패: [{names}], err={e}")
+        print("raw snippet:", raw[:200])
+        LLM_PARSE_FAILURES.inc(caller="enrich_landmarks")
+        return [(lm, None) for lm in chunk]
+
+    if len(chunk) == 1:
+        return [(chunk[0], data if isinstance(data, dict) else None)]
+
+    by_id: Dict[int, Dict[str, Any]] = {}
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get("id"), int):
+                by_id[item["id"]] = item
+    return [(lm, by_id.get(lm.id)) for lm in chunk]
+
+
+async def run(
+    concurrency: int,
+    rpm: float,
+    batch_size: int,
+    commit_every: int,
+    limit: Optional[int] = None,
+) -> None:
     db: Session = SessionLocal()
 
-    # 아직 description_long이 비어있는 랜드마크만 대상
-    landmarks = (
-        db.query(Landmark)
-        .filter(Landmark.description_long.is_(None))
-        .all()
-    )
+    try:
+        # 아직 description_long이 비어있는 랜드마크만 대상 (= 재실행 시 이어하기)
+        q = (
+            db.query(Landmark)
+            .filter(Landmark.description_long.is_(None))
+            .order_by(Landmark.id)
+        )
+        if limit is not None:
+            q = q.limit(limit)
+        landmarks = q.all()
+
+        print(
+            f"총 {len(landmarks)}개 랜드마크 상세 정보 생성 시작 "
+            f"(concurrency={concurrency}, rpm={rpm}, batch_size={batch_size})"
+        )
+
+        limiter = TokenBucket(rate_per_sec=rpm / 60.0, capacity=max(1, concurrency))
+        semaphore = asyncio.Semaphore(concurrency)
+        chunks = [landmarks[i:i + batch_size] for i in range(0, len(landmarks), batch_size)]
+        tasks = [asyncio.ensure_future(enrich_chunk(c, limiter, semaphore)) for c in chunks]
+
+        started = time.monotonic()
+        ok = failed = pending = 0
+
+        for finished in asyncio.as_completed(tasks):
+            for lm, data in await finished:
+                if data is None:
+                    failed += 1
+                    continue
+                apply_enrichment(lm, data)
+                ok += 1
+                pending += 1
+                print(f"[OK] {lm.id} - {lm.name}")
+
+            # 일정 개수마다 한 번에 커밋 (= 체크포인트)
+            if pending >= commit_every:
+                db.commit()
+                pending = 0
 
-    print(f"총 {len(landmarks)}개 랜드마크 상세 정보 생성 시작")
-
-    for lm in landmarks:
-        prompt = build_prompt(lm)
-        res = GeminiService.get_chat_response(prompt)
-
-        raw = (res.answer or "").strip()
-        # 🔥 코드블럭 처리
-        json_text = PlannerService._extract_json_text(raw)
-
-        try:
-            data = json.loads(json_text)
-        except Exception as e:
-            print(
-                f"[ERROR] JSON 파싱 실패: id={lm.id}, name={lm.name}, err={e}"
-            )
-            print("raw snippet:", raw[:200])
-            continue
-
-        lm.description_long = data.get("description_long")
-        hp_list = data.get("highlight_points") or []
-        if isinstance(hp_list, list):
-            lm.highlight_points = "\n".join(hp_list)
-        else:
-            lm.highlight_points = None
-
-        lm.best_time = data.get("best_time")
-        lm.recommended_duration = data.get("recommended_duration")
-        lm.local_tip = data.get("local_tip")
-
-        db.add(lm)
         db.commit()
 
-        print(f"[OK] {lm.id} - {lm.name}")
-
-    db.close()
+        elapsed = time.monotonic() - started
+        per_min = ok / elapsed * 60 if elapsed > 0 else 0.0
+        print(
+            f"완료: 성공 {ok}개, 실패 {failed}개, "
+            f"소요 {elapsed:.1f}초, 처리량 {per_min:.1f} landmarks/min"
+        )
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="랜드마크 상세 정보 일괄 생성")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 Gemini 호출 수")
+    parser.add_argument("--rpm", type=float, default=60.0, help="분당 최대 Gemini 호출 수")
+    parser.add_argument("--batch-size", type=int, default=1, help="한 프롬프트에 묶을 랜드마크 수")
+    parser.add_argument("--commit-every", type=int, default=20, help="몇 개마다 커밋할지")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 개수")
+    args = parser.parse_args(argv)
+
+    asyncio.run(
+        run(
+            concurrency=args.concurrency,
+            rpm=args.rpm,
+            batch_size=max(1, args.batch_size),
+            commit_every=max(1, args.commit_every),
+            limit=args.limit,
+        )
+    )
 
 
 if __name__ == "__main__":
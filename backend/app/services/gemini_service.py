@@ -1,41 +1,327 @@
 # backend/app/services/gemini_service.py
 
+import asyncio
+import hashlib
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Type
+
 import google.generativeai as genai
+from pydantic import BaseModel
 
 from app.schemas import GeminiResponse
 from app.core.config import settings
+from app.core.cache import TieredCache
+from app.core.metrics import registry
+
+
+# 프롬프트 → 응답 캐시 (메모리 LRU + SQLite)
+llm_cache = TieredCache(
+    namespace="gemini",
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    max_memory_entries=settings.llm_cache_memory_size,
+    db_path=settings.llm_cache_db_path,
+    max_db_entries=settings.llm_cache_db_max_entries,
+)
+
+# ─────────────────────────────
+# 메트릭 (GET /metrics)
+# ─────────────────────────────
+LLM_REQUESTS = registry.counter(
+    "llm_requests_total", "Gemini 호출 수 (result: ok/error/cache_hit/no_api_key)", ("caller", "result")
+)
+LLM_LATENCY = registry.histogram(
+    "llm_request_latency_seconds", "Gemini 호출 지연 시간(초, 캐시 hit 제외)", ("caller",)
+)
+LLM_PROMPT_CHARS = registry.histogram(
+    "llm_prompt_chars", "프롬프트 길이(문자 수)", ("caller",),
+    buckets=(500, 1000, 2000, 4000, 8000, 16000, 32000),
+)
+LLM_PROMPT_TOKENS = registry.counter(
+    "llm_prompt_tokens_total", "Gemini usage_metadata 기준 프롬프트 토큰 수", ("caller",)
+)
+LLM_RESPONSE_TOKENS = registry.counter(
+    "llm_response_tokens_total", "Gemini usage_metadata 기준 응답 토큰 수", ("caller",)
+)
+LLM_PARSE_FAILURES = registry.counter(
+    "llm_parse_failures_total", "LLM 응답 JSON 파싱/검증 실패 수", ("caller",)
+)
+
+
+def _cache_metrics():
+    stats = llm_cache.stats()
+    labels = '{namespace="gemini"}'
+    return [
+        ("llm_cache_hits", "Gemini 응답 캐시 hit 수 (메모리+SQLite)",
+         {labels: stats["memory_hits"] + stats["db_hits"]}),
+        ("llm_cache_misses", "Gemini 응답 캐시 miss 수", {labels: stats["misses"]}),
+        ("llm_cache_hit_ratio", "Gemini 응답 캐시 hit 비율", {labels: stats["hit_ratio"]}),
+    ]
+
+
+registry.register_collector(_cache_metrics)
+
+NO_API_KEY_MESSAGE = "서버에 GOOGLE_API_KEY가 설정되어 있지 않아 AI 응답을 생성할 수 없습니다."
+ERROR_MESSAGE = "죄송합니다. AI가 답변을 생성하는 중 오류가 발생했습니다."
 
 
 class GeminiService:
+    MODEL_NAME = settings.gemini_model
+
+    # 앱 시작 시 한 번 만들어서 재사용하는 모델 인스턴스
+    _model: Optional[genai.GenerativeModel] = None
+
+    # pydantic 모델 → Gemini response_schema 변환 결과 캐시
+    _schema_cache: Dict[Type[BaseModel], dict] = {}
+
+    @staticmethod
+    def configure() -> bool:
+        """
+        SDK 설정 + 모델 생성을 프로세스당 한 번만 수행한다.
+        main.py lifespan(startup)에서 호출하고,
+        스크립트(enrich_landmarks 등)처럼 lifespan이 없으면 첫 호출 때 지연 초기화된다.
+
+        반환값: 모델 사용 가능 여부 (API 키가 없으면 False)
+        """
+        if GeminiService._model is not None:
+            return True
+        if not settings.google_api_key:
+            return False
+
+        genai.configure(api_key=settings.google_api_key)
+        GeminiService._model = genai.GenerativeModel(GeminiService.MODEL_NAME)
+        return True
+
+    @staticmethod
+    def schema_from_model(model_cls: Type[BaseModel]) -> dict:
+        """
+        pydantic 모델의 JSON Schema를 Gemini response_schema가 받는 형태
+        (type / properties / items / required / nullable / enum)로 변환한다.
+        $ref는 펼치고, default/title 같은 지원하지 않는 키는 버린다. (readOnly 필드는 제외)
+        """
+        cached = GeminiService._schema_cache.get(model_cls)
+        if cached is not None:
+            return cached
+
+        raw = model_cls.model_json_schema()
+        defs = raw.get("$defs", {})
+
+        def convert(node: Dict[str, Any]) -> Dict[str, Any]:
+            if "$ref" in node:
+                return convert(defs[node["$ref"].split("/")[-1]])
+            if "anyOf" in node:
+                options = [o for o in node["anyOf"] if o.get("type") != "null"]
+                out = convert(options[0])
+                if len(options) < len(node["anyOf"]):
+                    out["nullable"] = True
+                return out
+
+            out: Dict[str, Any] = {"type": node["type"]}
+            if "enum" in node:
+                out["enum"] = node["enum"]
+            if node["type"] == "object":
+                # readOnly 필드는 서버가 채우는 값이므로 모델에게 요구하지 않는다.
+                out["properties"] = {
+                    k: convert(v) for k, v in node["properties"].items() if not v.get("readOnly")
+                }
+                if node.get("required"):
+                    out["required"] = node["required"]
+            elif node["type"] == "array":
+                out["items"] = convert(node["items"])
+            return out
+
+        schema = convert(raw)
+        GeminiService._schema_cache[model_cls] = schema
+        return schema
+
+    @staticmethod
+    def _generation_config(response_model: Optional[Type[BaseModel]]) -> Optional[dict]:
+        """
+        response_model이 주어지면 JSON 모드 + 스키마 강제(structured output) 설정을 만든다.
+        """
+        if response_model is None:
+            return None
+        return {
+            "response_mime_type": "application/json",
+            "response_schema": GeminiService.schema_from_model(response_model),
+        }
+
+    @staticmethod
+    def _cache_key(prompt: str, model_name: str, response_model: Optional[Type[BaseModel]] = None) -> str:
+        """
+        공백을 정규화한 프롬프트 + 모델명(+ 응답 스키마 이름)으로 캐시 키(sha256)를 만든다.
+        들여쓰기/줄바꿈만 다른 프롬프트는 같은 키가 된다.
+        """
+        normalized = " ".join(prompt.split())
+        schema_name = response_model.__name__ if response_model else ""
+        raw = f"{model_name}\n{schema_name}\n{normalized}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _cache_lookup(
+        prompt: str,
+        response_model: Optional[Type[BaseModel]] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        (cache_key, 캐시된 답변) 반환. 캐시를 끄면 둘 다 None.
+        """
+        if not settings.llm_cache_enabled:
+            return None, None
+        cache_key = GeminiService._cache_key(prompt, GeminiService.MODEL_NAME, response_model)
+        return cache_key, llm_cache.get(cache_key)
+
     @staticmethod
-    def get_chat_response(prompt: str) -> GeminiResponse:
+    def _record(caller: str, result: str, started: Optional[float] = None, usage=None) -> None:
+        """
+        호출 1건의 결과/지연 시간/토큰 수를 메트릭에 기록.
+        """
+        LLM_REQUESTS.inc(caller=caller, result=result)
+        if started is not None:
+            LLM_LATENCY.observe(time.perf_counter() - started, caller=caller)
+        if usage is not None:
+            LLM_PROMPT_TOKENS.inc(getattr(usage, "prompt_token_count", 0) or 0, caller=caller)
+            LLM_RESPONSE_TOKENS.inc(getattr(usage, "candidates_token_count", 0) or 0, caller=caller)
+
+    @staticmethod
+    def get_chat_response(
+        prompt: str,
+        response_model: Optional[Type[BaseModel]] = None,
+        caller: str = "default",
+    ) -> GeminiResponse:
         """
         단일 프롬프트를 보내고 텍스트(또는 JSON 문자열)를 받아오는 기본 함수.
 
         👉 PlannerService에서는 이 함수를 이용해서
            '반드시 JSON 형식으로만 답하라'는 프롬프트를 넣어서
            일정 상세(JSON)를 받아간다.
+
+        👉 같은 프롬프트는 캐시에서 바로 반환한다. (성공한 응답만 저장)
+
+        👉 response_model(pydantic)을 넘기면 그 스키마를 따르는 JSON만 생성하도록 강제한다.
         """
-        try:
-            # 1. API 키 설정 (.env의 GOOGLE_API_KEY 사용)
-            if not settings.google_api_key:
-                return GeminiResponse(
-                    answer="서버에 GOOGLE_API_KEY가 설정되어 있지 않아 AI 응답을 생성할 수 없습니다."
-                )
+        LLM_PROMPT_CHARS.observe(len(prompt), caller=caller)
+        cache_key, cached = GeminiService._cache_lookup(prompt, response_model)
+        if cached is not None:
+            GeminiService._record(caller, "cache_hit")
+            return GeminiResponse(answer=cached)
 
-            genai.configure(api_key=settings.google_api_key)
+        started = time.perf_counter()
+        try:
+            # 1. 모델 준비 (API 키 없으면 안내 메시지)
+            if not GeminiService.configure():
+                GeminiService._record(caller, "no_api_key")
+                return GeminiResponse(answer=NO_API_KEY_MESSAGE)
 
-            # 2. 모델 설정 (필요 시 버전 변경 가능)
-            model = genai.GenerativeModel("gemini-2.5-flash-lite")
+            # 2. 질문 보내기
+            response = GeminiService._model.generate_content(
+                prompt,
+                generation_config=GeminiService._generation_config(response_model),
+            )
+            answer = response.text
+            GeminiService._record(caller, "ok", started, getattr(response, "usage_metadata", None))
 
-            # 3. 질문 보내기
-            response = model.generate_content(prompt)
+            # 3. 성공한 응답만 캐시에 저장
+            if cache_key is not None and answer:
+                llm_cache.set(cache_key, answer)
 
             # 4. 답변 텍스트만 추출해서 반환
-            return GeminiResponse(answer=response.text)
+            return GeminiResponse(answer=answer)
 
         except Exception as e:
             print(f"Gemini Error: {e}")
-            return GeminiResponse(
-                answer="죄송합니다. AI가 답변을 생성하는 중 오류가 발생했습니다."
+            GeminiService._record(caller, "error", started)
+            return GeminiResponse(answer=ERROR_MESSAGE)
+
+    @staticmethod
+    async def get_chat_response_async(
+        prompt: str,
+        response_model: Optional[Type[BaseModel]] = None,
+        caller: str = "default",
+    ) -> GeminiResponse:
+        """
+        get_chat_response의 async 버전.
+        SDK의 generate_content_async를 써서 워커 스레드를 점유하지 않는다.
+        (async def 핸들러에서 사용)
+        """
+        LLM_PROMPT_CHARS.observe(len(prompt), caller=caller)
+        # 캐시(SQLite 단 + 락)는 스레드에서 (이벤트 루프를 막지 않게)
+        cache_key, cached = await asyncio.to_thread(GeminiService._cache_lookup, prompt, response_model)
+        if cached is not None:
+            GeminiService._record(caller, "cache_hit")
+            return GeminiResponse(answer=cached)
+
+        started = time.perf_counter()
+        try:
+            if not GeminiService.configure():
+                GeminiService._record(caller, "no_api_key")
+                return GeminiResponse(answer=NO_API_KEY_MESSAGE)
+
+            response = await GeminiService._model.generate_content_async(
+                prompt,
+                generation_config=GeminiService._generation_config(response_model),
             )
+            answer = response.text
+            GeminiService._record(caller, "ok", started, getattr(response, "usage_metadata", None))
+
+            if cache_key is not None and answer:
+                await asyncio.to_thread(llm_cache.set, cache_key, answer)
+
+            return GeminiResponse(answer=answer)
+
+        except Exception as e:
+            print(f"Gemini Error: {e}")
+            GeminiService._record(caller, "error", started)
+            return GeminiResponse(answer=ERROR_MESSAGE)
+
+    @staticmethod
+    async def stream_chat_response_async(
+        prompt: str,
+        response_model: Optional[Type[BaseModel]] = None,
+        caller: str = "default",
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 버전: 모델이 만들어내는 텍스트 조각(chunk)을 순서대로 yield 한다.
+
+        - 캐시에 있으면 전체 답변을 한 번에 yield
+        - 스트림이 끝까지 성공하면 합친 전체 답변을 캐시에 저장
+        - 실패 시 예외를 그대로 올린다 (호출 측에서 error 이벤트로 변환)
+        """
+        LLM_PROMPT_CHARS.observe(len(prompt), caller=caller)
+        cache_key, cached = await asyncio.to_thread(GeminiService._cache_lookup, prompt, response_model)
+        if cached is not None:
+            GeminiService._record(caller, "cache_hit")
+            yield cached
+            return
+
+        if not GeminiService.configure():
+            GeminiService._record(caller, "no_api_key")
+            raise RuntimeError(NO_API_KEY_MESSAGE)
+
+        started = time.perf_counter()
+        parts: list[str] = []
+        usage = None
+        try:
+            response = await GeminiService._model.generate_content_async(
+                prompt,
+                generation_config=GeminiService._generation_config(response_model),
+                stream=True,
+            )
+
+            async for chunk in response:
+                # 토큰 사용량은 마지막 chunk에 들어 있다.
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # 안전 필터 등으로 텍스트가 없는 chunk
+                    continue
+                if text:
+                    parts.append(text)
+                    yield text
+        except Exception:
+            GeminiService._record(caller, "error", started)
+            raise
+
+        GeminiService._record(caller, "ok", started, usage)
+        answer = "".join(parts)
+        if cache_key is not None and answer:
+            await asyncio.to_thread(llm_cache.set, cache_key, answer)
@@ -0,0 +1,109 @@
+# backend/app/services/itinerary_detail_service.py
+"""
+저장된 일정 상세(ItineraryDetail) 읽기/쓰기.
+
+- 저장: 검증된 상세는 Itinerary.detail(JSON, PostgreSQL 에서는 JSONB) + detail_version 에 넣는다.
+  ai_summary 는 itinerary_detail_keep_text 면 compact JSON 문자열(이전 버전 롤백 대비), 아니면 비운다.
+  검증에 실패한 응답(원문 텍스트)은 예전처럼 ai_summary 에만 남긴다.
+- 조회: 일정은 생성 후 바뀌지 않으므로 검증까지 끝난 ItineraryDetail 객체를 일정 id 로 메모리 캐시
+  → 리포트/CSV/이동 정보/경로 조회는 캐시 hit 이면 JSON 파싱도 검증도 하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Tuple
+
+from app.core.cache import TieredCache
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models import Itinerary
+from app.schemas import ItineraryDetail
+
+# detail 컬럼 구조 버전. ItineraryDetail 구조가 바뀌면 올리고 _upgrade 에 변환을 추가한다.
+DETAIL_SCHEMA_VERSION = 1
+
+# 검증된 객체를 그대로 두므로 메모리 단만 사용 (SQLite 단은 JSON 직렬화라 의미 없음)
+detail_cache = TieredCache(
+    namespace="itinerary_detail",
+    ttl_seconds=settings.itinerary_detail_cache_ttl_seconds,
+    max_memory_entries=settings.itinerary_detail_cache_memory_size,
+)
+
+DETAIL_LOADS = registry.counter(
+    "itinerary_detail_loads_total",
+    "일정 상세 조회 수 (source: cache/json/text)",
+    ("source",),
+)
+
+
+def _cache_metrics():
+    stats = detail_cache.stats()
+    labels = '{namespace="itinerary_detail"}'
+    return [
+        ("itinerary_detail_cache_entries", "검증된 일정 상세 캐시 항목 수", {labels: stats["memory_entries"]}),
+    ]
+
+
+registry.register_collector(_cache_metrics)
+
+
+def _upgrade(detail: Any, version: int) -> Any:
+    """
+    예전 버전으로 저장된 detail 을 현재 구조로 변환. (지금은 버전 1 뿐)
+    """
+    if version != DETAIL_SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 일정 상세 버전: {version}")
+    return detail
+
+
+class ItineraryDetailService:
+    @staticmethod
+    def encode(ai_summary: str) -> Tuple[Optional[dict], int, str]:
+        """
+        Gemini 응답 텍스트 → (detail, detail_version, ai_summary) 저장 값.
+        검증에 실패하면 (None, 0, 원문) 으로 예전처럼 텍스트만 저장한다.
+        """
+        try:
+            detail = ItineraryDetail.model_validate_json(ai_summary)
+        except Exception:
+            return None, 0, ai_summary
+        text = detail.model_dump_json(exclude_none=True) if settings.itinerary_detail_keep_text else ""
+        return detail.model_dump(mode="json", exclude_none=True), DETAIL_SCHEMA_VERSION, text
+
+    @staticmethod
+    def has_detail(itinerary: Itinerary) -> bool:
+        return itinerary.detail is not None or bool(itinerary.ai_summary)
+
+    @staticmethod
+    def load(itinerary: Itinerary) -> ItineraryDetail:
+        """
+        검증된 ItineraryDetail. 파싱/검증 실패 시 예외는 그대로 올린다. (호출하는 쪽에서 처리)
+        """
+        key = str(itinerary.id)
+        cached = detail_cache.get(key)
+        if cached is not None:
+            DETAIL_LOADS.inc(source="cache")
+            return cached
+
+        if itinerary.detail is not None:
+            detail = ItineraryDetail.model_validate(
+                _upgrade(itinerary.detail, itinerary.detail_version or DETAIL_SCHEMA_VERSION)
+            )
+            DETAIL_LOADS.inc(source="json")
+        else:
+            # 마이그레이션 전 / 검증 실패로 텍스트만 남은 일정
+            detail = ItineraryDetail.model_validate_json(itinerary.ai_summary)
+            DETAIL_LOADS.inc(source="text")
+
+        detail_cache.set(key, detail)
+        return detail
+
+    @staticmethod
+    def summary_text(itinerary: Itinerary) -> str:
+        """
+        사람이 읽는 출력(ItineraryOut.ai_summary, 구 버전 CSV)용 문자열.
+        저장은 compact JSON 이라 detail 이 있으면 들여쓰기한 여러 줄 JSON 으로 되돌린다.
+        """
+        if itinerary.detail is None:
+            return itinerary.ai_summary or ""
+        return json.dumps(itinerary.detail, ensure_ascii=False, indent=2)
@@ -0,0 +1,466 @@
+# backend/app/services/job_service.py
+"""
+일정 생성 백그라운드 작업 큐.
+
+POST /itineraries/jobs 는 작업을 저장소에 기록하고 job_id만 바로 돌려준다.
+실제 생성(PlannerService → crud.create_itinerary)은
+앱 lifespan 동안 떠 있는 asyncio 워커 N개가 순서대로 처리한다.
+
+저장소(JobStore)는 교체 가능:
+- DatabaseJobStore : itinerary_jobs 테이블 (기본값, 서버 재시작 시 미완료 작업 재개)
+                     실행은 owner + lease_expires_at 임대로 한 프로세스만 (uvicorn 워커 여러 개여도 중복 실행 없음)
+- MemoryJobStore   : 프로세스 메모리 (개발/테스트용)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app import crud, models
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.schemas import ItineraryCreate, ItineraryJobOut
+from app.services.catalog_service import CatalogService
+from app.services.planner_service import PlannerService
+from app.services.travel_service import TravelService
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class JobQueueFullError(Exception):
+    pass
+
+
+# ─────────────────────────────
+# 저장소
+# ─────────────────────────────
+# 이 프로세스 식별자. 여러 uvicorn 워커/서버가 같은 itinerary_jobs 테이블을 써도 작업은 임대한 프로세스만 실행한다.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _lease_deadline() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=settings.itinerary_job_lease_seconds)
+
+
+class JobStore(ABC):
+    @abstractmethod
+    def create(self, payload: dict) -> ItineraryJobOut:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[ItineraryJobOut]:
+        ...
+
+    @abstractmethod
+    def get_payload(self, job_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> None:
+        ...
+
+    @abstractmethod
+    def unfinished_ids(self) -> List[str]:
+        """queued 이거나, running 인데 임대가 끝난(실행하던 프로세스가 죽은) 작업 id (생성 순)"""
+
+    @abstractmethod
+    def claim(self, job_id: str) -> bool:
+        """
+        작업을 이 프로세스가 running 으로 가져간다. 다른 프로세스가 임대 중이거나 이미 끝났으면 False.
+        """
+
+    @abstractmethod
+    def renew(self, job_id: str) -> None:
+        """실행 중인 작업의 임대 연장"""
+
+    @abstractmethod
+    def release_owned(self) -> None:
+        """종료 시 이 프로세스가 실행하던 작업을 queued 로 되돌린다. (다음 기동 때 바로 재개)"""
+
+    @abstractmethod
+    def record_result(self, db: Session, job_id: str, itinerary_id: int) -> None:
+        """
+        저장된 일정 id 를 작업에 기록. DB 저장소는 일정 insert 와 같은 트랜잭션에 넣어서
+        일정 저장 후 상태 갱신 전에 죽어도 같은 작업이 일정을 또 만들지 않게 한다. (commit 은 호출한 쪽)
+        """
+
+
+class MemoryJobStore(JobStore):
+    def __init__(self):
+        self._jobs: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def create(self, payload: dict) -> ItineraryJobOut:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": JOB_QUEUED,
+                "payload": payload,
+                "itinerary_id": None,
+                "error": None,
+            }
+        return ItineraryJobOut(job_id=job_id, status=JOB_QUEUED)
+
+    def get(self, job_id: str) -> Optional[ItineraryJobOut]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return ItineraryJobOut(
+            job_id=job["job_id"],
+            status=job["status"],
+            itinerary_id=job["itinerary_id"],
+            error=job["error"],
+        )
+
+    def get_payload(self, job_id: str) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        return job["payload"] if job else None
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def unfinished_ids(self) -> List[str]:
+        return [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job["status"] == JOB_QUEUED
+        ]
+
+    # 프로세스 메모리라 다른 프로세스와 나눌 일이 없다.
+    def claim(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != JOB_QUEUED:
+                return False
+            job["status"] = JOB_RUNNING
+            return True
+
+    def renew(self, job_id: str) -> None:
+        pass
+
+    def release_owned(self) -> None:
+        pass
+
+    def record_result(self, db: Session, job_id: str, itinerary_id: int) -> None:
+        pass
+
+
+class DatabaseJobStore(JobStore):
+    @staticmethod
+    def _to_out(job: models.ItineraryJob) -> ItineraryJobOut:
+        return ItineraryJobOut(
+            job_id=job.id,
+            status=job.status,
+            itinerary_id=job.itinerary_id,
+            error=job.error,
+        )
+
+    def create(self, payload: dict) -> ItineraryJobOut:
+        db = SessionLocal()
+        try:
+            job = models.ItineraryJob(
+                id=uuid.uuid4().hex,
+                status=JOB_QUEUED,
+                payload=json.dumps(payload, ensure_ascii=False, default=str),
+            )
+            db.add(job)
+            db.commit()
+            return self._to_out(job)
+        finally:
+            db.close()
+
+    def get(self, job_id: str) -> Optional[ItineraryJobOut]:
+        db = SessionLocal()
+        try:
+            job = db.get(models.ItineraryJob, job_id)
+            return self._to_out(job) if job else None
+        finally:
+            db.close()
+
+    def get_payload(self, job_id: str) -> Optional[dict]:
+        db = SessionLocal()
+        try:
+            job = db.get(models.ItineraryJob, job_id)
+            return json.loads(job.payload) if job else None
+        finally:
+            db.close()
+
+    def update(self, job_id: str, **fields) -> None:
+        db = SessionLocal()
+        try:
+            db.query(models.ItineraryJob).filter(models.ItineraryJob.id == job_id).update(fields)
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _claimable():
+        Job = models.ItineraryJob
+        return and_(
+            Job.itinerary_id.is_(None),
+            or_(
+                Job.status == JOB_QUEUED,
+                and_(
+                    Job.status == JOB_RUNNING,
+                    or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < datetime.utcnow()),
+                ),
+            ),
+        )
+
+    def unfinished_ids(self) -> List[str]:
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(models.ItineraryJob.id)
+                .filter(self._claimable())
+                .order_by(models.ItineraryJob.created_at)
+                .all()
+            )
+            return [row[0] for row in rows]
+        finally:
+            db.close()
+
+    def claim(self, job_id: str) -> bool:
+        # 조건부 UPDATE 한 번이라 여러 프로세스가 동시에 시도해도 하나만 성공한다.
+        db = SessionLocal()
+        try:
+            claimed = (
+                db.query(models.ItineraryJob)
+                .filter(models.ItineraryJob.id == job_id, self._claimable())
+                .update(
+                    {"status": JOB_RUNNING, "owner": WORKER_ID, "lease_expires_at": _lease_deadline()},
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return claimed == 1
+        finally:
+            db.close()
+
+    def renew(self, job_id: str) -> None:
+        db = SessionLocal()
+        try:
+            db.query(models.ItineraryJob).filter(
+                models.ItineraryJob.id == job_id,
+                models.ItineraryJob.owner == WORKER_ID,
+                models.ItineraryJob.status == JOB_RUNNING,
+            ).update({"lease_expires_at": _lease_deadline()}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def release_owned(self) -> None:
+        db = SessionLocal()
+        try:
+            db.query(models.ItineraryJob).filter(
+                models.ItineraryJob.owner == WORKER_ID,
+                models.ItineraryJob.status == JOB_RUNNING,
+            ).update(
+                {"status": JOB_QUEUED, "owner": None, "lease_expires_at": None},
+                synchronize_session=False,
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def record_result(self, db: Session, job_id: str, itinerary_id: int) -> None:
+        db.query(models.ItineraryJob).filter(models.ItineraryJob.id == job_id).update(
+            {"status": JOB_DONE, "itinerary_id": itinerary_id}, synchronize_session=False
+        )
+
+
+# ─────────────────────────────
+# 워커 풀
+# ─────────────────────────────
+class ItineraryJobQueue:
+    def __init__(self, store: JobStore, workers: int, max_pending: int):
+        self.store = store
+        self.workers = workers
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # 큐에 넣었지만 아직 처리 안 한 작업 id (재개 스캔이 같은 작업을 여러 번 넣지 않게)
+        self._enqueued: Set[str] = set()
+
+    def _enqueue(self, job_id: str) -> bool:
+        if job_id in self._enqueued:
+            return False
+        self._enqueued.add(job_id)
+        self._queue.put_nowait(job_id)
+        return True
+
+    async def _reclaim(self) -> int:
+        """
+        claim 할 수 있는 작업(queued, 또는 임대가 끝난 running)을 큐에 넣는다. 새로 넣은 수.
+        """
+        job_ids = await asyncio.to_thread(self.store.unfinished_ids)
+        return sum(self._enqueue(job_id) for job_id in job_ids)
+
+    async def _reclaim_loop(self) -> None:
+        """
+        실행하던 프로세스가 죽은 작업(임대 만료)을 살아 있는 프로세스가 이어받도록 주기적으로 다시 스캔.
+        """
+        interval = settings.itinerary_job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                count = await self._reclaim()
+                if count:
+                    print(f"[ItineraryJobQueue] 임대 만료/미처리 작업 {count}건 재개")
+            except Exception as e:
+                print(f"[ItineraryJobQueue] 미완료 작업 스캔 실패: {e}")
+
+    async def start(self) -> None:
+        """
+        lifespan(startup)에서 호출. 미완료 작업을 다시 큐에 넣고 워커 + 재개 스캔 루프를 띄운다.
+        (다른 프로세스가 임대 중인 작업은 건너뛰고, 같은 작업을 여러 프로세스가 넣어도 claim 에서 하나만 실행)
+        """
+        self._queue = asyncio.Queue()
+        self._enqueued = set()
+        count = await self._reclaim()
+        if count:
+            print(f"[ItineraryJobQueue] 미완료 작업 {count}건 재개")
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"itinerary-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._reclaim_loop(), name="itinerary-job-reclaimer"))
+
+    async def stop(self) -> None:
+        """
+        lifespan(shutdown)에서 호출. 워커/재개 스캔을 멈추고, 실행 중이던 작업은 queued 로 되돌려서
+        다른 프로세스(또는 다음 기동)가 이어받는다.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.store.release_owned)
+
+    async def submit(self, body: ItineraryCreate) -> ItineraryJobOut:
+        if self._queue is None:
+            raise RuntimeError("ItineraryJobQueue가 시작되지 않았습니다.")
+        if self._queue.qsize() >= self.max_pending:
+            raise JobQueueFullError()
+
+        job = await asyncio.to_thread(self.store.create, body.model_dump(mode="json"))
+        self._enqueue(job.job_id)
+        return job
+
+    async def get(self, job_id: str) -> Optional[ItineraryJobOut]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._enqueued.discard(job_id)
+                self._queue.task_done()
+
+    async def _renew_lease(self, job_id: str) -> None:
+        interval = settings.itinerary_job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.store.renew, job_id)
+            except Exception as e:
+                print(f"[ItineraryJobQueue] 임대 연장 실패 job_id={job_id}: {e}")
+
+    async def _run(self, job_id: str) -> None:
+        payload = await asyncio.to_thread(self.store.get_payload, job_id)
+        if payload is None:
+            return
+        if not await asyncio.to_thread(self.store.claim, job_id):
+            # 다른 프로세스가 실행 중이거나 이미 끝난 작업
+            return
+
+        renewer = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            body = ItineraryCreate(**payload)
+            catalog_hit = await asyncio.to_thread(_lookup_catalog, body)
+            if catalog_hit is not None:
+                title, full_text = catalog_hit
+            else:
+                landmarks = await asyncio.to_thread(_load_landmarks, body.selected_landmark_ids)
+                title, full_text = await PlannerService.generate_itinerary_text_async(body, landmarks)
+            itinerary_id = await asyncio.to_thread(
+                _store_itinerary, self.store, job_id, body, title, full_text
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[ItineraryJobQueue] 작업 실패 job_id={job_id}: {e}")
+            await asyncio.to_thread(
+                self.store.update, job_id, status=JOB_FAILED, error=str(e)
+            )
+            return
+        finally:
+            renewer.cancel()
+
+        await asyncio.to_thread(
+            self.store.update, job_id, status=JOB_DONE, itinerary_id=itinerary_id
+        )
+
+
+def _lookup_catalog(body: ItineraryCreate) -> Optional[tuple[str, str]]:
+    db = SessionLocal()
+    try:
+        return CatalogService.lookup(db, body)
+    finally:
+        db.close()
+
+
+def _load_landmarks(landmark_ids: List[int]) -> List[models.Landmark]:
+    db = SessionLocal()
+    try:
+        landmarks = crud.get_landmarks_by_ids(db, landmark_ids)
+        # 세션을 닫은 뒤에도 속성을 읽을 수 있도록 분리
+        db.expunge_all()
+        return landmarks
+    finally:
+        db.close()
+
+
+def _store_itinerary(store: JobStore, job_id: str, body: ItineraryCreate, title: str, full_text: str) -> int:
+    db = SessionLocal()
+    try:
+        # 일정 insert + 작업 결과 기록을 한 트랜잭션으로 (재개돼도 일정이 두 번 생기지 않게)
+        itinerary = crud.create_itinerary(db, body, ai_title=title, ai_summary=full_text, commit=False)
+        store.record_result(db, job_id, itinerary.id)
+        db.commit()
+        db.refresh(itinerary)
+        TravelService.annotate(db, itinerary)
+        return itinerary.id
+    finally:
+        db.close()
+
+
+def _build_store() -> JobStore:
+    if settings.itinerary_job_store == "memory":
+        return MemoryJobStore()
+    return DatabaseJobStore()
+
+
+itinerary_jobs = ItineraryJobQueue(
+    store=_build_store(),
+    workers=settings.itinerary_job_workers,
+    max_pending=settings.itinerary_job_max_pending,
+)
@@ -0,0 +1,140 @@
+# backend/app/services/matrix_service.py
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.models import Landmark
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class DistanceMatrixService:
+    """
+    외부 API 없이 계산하는 랜드마크 간 거리/시간 행렬.
+
+    - NumPy 하버사인으로 N×N 직선거리를 한 번에 계산
+    - 도로 우회를 감안해 settings.matrix_detour_factor 를 곱하고,
+      이동수단별 평균 속도(settings.matrix_speed_kmh)로 시간을 추정
+    - 지역(country_code, region_code)별 거리 행렬은 메모리에 캐시
+      (랜드마크 생성/수정/삭제 시 invalidate() 호출)
+    """
+
+    # (country_code, region_code) → (landmark_ids, 거리 행렬 km)
+    _region_cache: Dict[Tuple[str, str], Tuple[List[int], np.ndarray]] = {}
+    # (country_code, region_code) → {정규화한 이름: landmark_id}
+    _region_names: Dict[Tuple[str, str], Dict[str, int]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def haversine_matrix(lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+        """
+        모든 지점 쌍의 대원 거리(km) 행렬. 반복문 없이 브로드캐스팅으로 계산.
+        """
+        lat = np.radians(np.asarray(lats, dtype=np.float64))
+        lng = np.radians(np.asarray(lngs, dtype=np.float64))
+
+        dlat = lat[:, None] - lat[None, :]
+        dlng = lng[:, None] - lng[None, :]
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlng / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    @staticmethod
+    def speed_kmh(mode: str) -> float:
+        speeds = settings.matrix_speed_kmh
+        if mode not in speeds:
+            raise ValueError(f"지원하지 않는 이동수단입니다: {mode} (가능: {', '.join(speeds)})")
+        return speeds[mode]
+
+    @staticmethod
+    def travel_matrices(
+        lats: Sequence[float],
+        lngs: Sequence[float],
+        mode: str = "walking",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        임의의 지점 목록 → (추정 도로 거리 km, 소요 시간 분) 행렬.
+        """
+        speed = DistanceMatrixService.speed_kmh(mode)
+        distance = DistanceMatrixService.haversine_matrix(lats, lngs) * settings.matrix_detour_factor
+        return distance, distance / speed * 60.0
+
+    @staticmethod
+    def _region_distance(
+        db: Session,
+        country_code: str,
+        region_code: str,
+    ) -> Tuple[List[int], np.ndarray]:
+        key = (country_code, region_code)
+        cached = DistanceMatrixService._region_cache.get(key)
+        if cached is not None:
+            return cached
+
+        landmarks: List[Landmark] = sorted(
+            crud.get_landmarks(db, country_code=country_code, region_code=region_code),
+            key=lambda lm: lm.id,
+        )
+        ids = [lm.id for lm in landmarks]
+        distance = DistanceMatrixService.haversine_matrix(
+            [lm.lat for lm in landmarks], [lm.lng for lm in landmarks]
+        ) * settings.matrix_detour_factor
+
+        names = {DistanceMatrixService.normalize_name(lm.name): lm.id for lm in landmarks}
+
+        with DistanceMatrixService._lock:
+            DistanceMatrixService._region_cache[key] = (ids, distance)
+            DistanceMatrixService._region_names[key] = names
+        return ids, distance
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        return "".join((name or "").split()).lower()
+
+    @staticmethod
+    def region_name_index(db: Session, country_code: str, region_code: str) -> Dict[str, int]:
+        """
+        지역 랜드마크 이름 → id. (LLM이 landmark_id 없이 이름만 준 장소의 좌표를 찾을 때 사용)
+        """
+        DistanceMatrixService._region_distance(db, country_code, region_code)
+        return DistanceMatrixService._region_names.get((country_code, region_code), {})
+
+    @staticmethod
+    def region_matrix(
+        db: Session,
+        country_code: str,
+        region_code: str,
+        mode: str = "walking",
+        landmark_ids: Optional[List[int]] = None,
+    ) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """
+        지역 랜드마크 전체(또는 landmark_ids 부분집합)의 (ids, 거리 km, 시간 분) 행렬.
+        """
+        speed = DistanceMatrixService.speed_kmh(mode)
+        ids, distance = DistanceMatrixService._region_distance(db, country_code, region_code)
+
+        if landmark_ids:
+            pos = {lm_id: i for i, lm_id in enumerate(ids)}
+            idx = [pos[i] for i in landmark_ids if i in pos]
+            ids = [ids[i] for i in idx]
+            distance = distance[np.ix_(idx, idx)]
+
+        return ids, distance, distance / speed * 60.0
+
+    @staticmethod
+    def invalidate(country_code: Optional[str] = None, region_code: Optional[str] = None) -> None:
+        """
+        랜드마크가 바뀌면 캐시를 비운다. (인자가 없으면 전체)
+        """
+        with DistanceMatrixService._lock:
+            if country_code is None:
+                DistanceMatrixService._region_cache.clear()
+                DistanceMatrixService._region_names.clear()
+                return
+            for key in list(DistanceMatrixService._region_cache):
+                if key[0] == country_code and (region_code is None or key[1] == region_code):
+                    del DistanceMatrixService._region_cache[key]
+                    DistanceMatrixService._region_names.pop(key, None)
@@ -0,0 +1,120 @@
+# backend/app/services/plan_stream_parser.py
+"""
+스트리밍으로 들어오는 ItineraryDetail JSON 텍스트를 조금씩 읽으면서,
+완성된 조각(overview 객체, daily_plan 의 각 day 객체)을 바로 꺼내주는 파서.
+
+전체 JSON이 끝나기를 기다리지 않고
+  - "overview": { ... }  가 닫히는 순간 → ("overview", dict)
+  - "daily_plan": [ {...}, {...} ] 의 원소가 닫히는 순간 → ("day", dict)
+이벤트를 만든다.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class _Frame:
+    __slots__ = ("kind", "path", "start", "key", "expect_key", "index")
+
+    def __init__(self, kind: str, path: tuple, start: int):
+        self.kind = kind            # "obj" / "arr"
+        self.path = path            # 최상위 기준 경로 (예: ("daily_plan", 0))
+        self.start = start          # 버퍼 안에서 여는 괄호 위치
+        self.key: Optional[str] = None
+        self.expect_key = kind == "obj"
+        self.index = 0
+
+
+class PlanStreamParser:
+    def __init__(self):
+        self._buf: List[str] = []
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._started = False
+        self._finished = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._buf)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        새 텍스트 조각을 넣고, 이번에 완성된 (event, dict) 목록을 반환.
+        """
+        self._buf.append(chunk)
+        text = self.text
+        self._buf = [text]
+
+        events: List[Tuple[str, Any]] = []
+        while self._pos < len(text) and not self._finished:
+            ch = text[self._pos]
+            event = self._step(text, ch)
+            if event is not None:
+                events.append(event)
+            self._pos += 1
+        return events
+
+    def _step(self, text: str, ch: str) -> Optional[Tuple[str, Any]]:
+        # ``` 코드블럭 등 첫 '{' 이전 텍스트는 무시
+        if not self._started:
+            if ch == "{":
+                self._started = True
+                self._stack.append(_Frame("obj", (), self._pos))
+            return None
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                frame = self._stack[-1]
+                if frame.kind == "obj" and frame.expect_key:
+                    frame.key = json.loads(text[self._string_start:self._pos + 1])
+            return None
+
+        if ch == '"':
+            self._in_string = True
+            self._string_start = self._pos
+            return None
+
+        frame = self._stack[-1]
+
+        if ch == ":" and frame.kind == "obj":
+            frame.expect_key = False
+        elif ch == ",":
+            if frame.kind == "obj":
+                frame.expect_key = True
+            else:
+                frame.index += 1
+        elif ch in "{[":
+            child_key = frame.key if frame.kind == "obj" else frame.index
+            kind = "obj" if ch == "{" else "arr"
+            self._stack.append(_Frame(kind, frame.path + (child_key,), self._pos))
+        elif ch in "}]":
+            closed = self._stack.pop()
+            if not self._stack:
+                self._finished = True
+                return None
+            if closed.kind == "obj":
+                return self._emit(closed, text)
+        return None
+
+    def _emit(self, frame: _Frame, text: str) -> Optional[Tuple[str, Any]]:
+        path = frame.path
+        if path == ("overview",):
+            event = "overview"
+        elif len(path) == 2 and path[0] == "daily_plan":
+            event = "day"
+        else:
+            return None
+
+        try:
+            return event, json.loads(text[frame.start:self._pos + 1])
+        except json.JSONDecodeError:
+            return None
@@ -1,14 +1,86 @@
 # backend/app/services/planner_service.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+import asyncio
 import json
 
-from app.schemas import ItineraryCreate
-from app.services.gemini_service import GeminiService
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.schemas import (
+    ItineraryCreate,
+    ItineraryDetail,
+    ItineraryDayPlan,
+    ItinerarySkeleton,
+)
+from app.core.metrics import registry
+from app.services.gemini_service import GeminiService, LLM_PARSE_FAILURES
+from app.services.cluster_service import ClusterService
+from app.services.plan_stream_parser import PlanStreamParser
+from app.services.route_service import RouteService
 from app.models import Landmark
 
+# 같은 조건의 일정 생성 요청이 동시에 오면 Gemini 호출을 1번만 한다.
+itinerary_flight = SingleFlight("itinerary_generation")
+
+
+def _singleflight_metrics():
+    stats = itinerary_flight.stats()
+    return [
+        ("itinerary_singleflight_leaders", "실제로 실행된 일정 생성 호출 수", {"": stats["leaders"]}),
+        ("itinerary_singleflight_followers", "진행 중인 호출 결과를 공유받은 요청 수", {"": stats["followers"]}),
+    ]
+
+
+registry.register_collector(_singleflight_metrics)
+
 
 class PlannerService:
+    PROSE_SCHEMA_DESCRIPTION = """
+반드시 아래 구조의 JSON 한 개만 생성하세요. (키 이름과 계층 구조를 정확히 지키세요.)
+
+{
+  "overview": {
+    "title": "문자열",
+    "summary": "문자열",
+    "highlights": ["문자열", "문자열"]
+  },
+  "daily_plan": [
+    {
+      "day": 1,
+      "title": "문자열",
+      "reason": "문자열",
+      "landmarks": [
+        {
+          "name": "문자열",
+          "order": 1,
+          "reason": "문자열",
+          "is_user_selected": true,
+          "landmark_id": 123
+        }
+      ]
+    }
+  ],
+  "tips": {
+    "packing": ["문자열", "문자열"],
+    "local": ["문자열", "문자열"]
+  }
+}
+
+중요한 규칙:
+- 최상위 키는 반드시 overview, daily_plan, tips 세 개만 있어야 합니다.
+- daily_plan은 배열이며, 각 원소는 day, title, reason, landmarks를 가진 객체입니다.
+- tips는 daily_plan 바깥, overview와 같은 최상위 레벨에 있어야 합니다.
+- daily_plan 배열 안에는 "tips" 같은 다른 키를 절대 넣지 마세요.
+- landmarks 배열의 각 원소는 name, order, reason, is_user_selected는 항상 포함해야 합니다.
+- landmark_id는 "선택된 랜드마크"에만 포함되는 선택적(optional) 키입니다.
+"""
+
+    STRUCTURED_SCHEMA_NOTE = """
+응답은 ItineraryDetail JSON 스키마(overview / daily_plan / tips)로 강제됩니다.
+- daily_plan[*].landmarks[*].order: 그날 방문 순서 (1부터)
+- landmark_id: "선택된 랜드마크"에만 넣고, AI 추천 장소는 비워 두세요(null).
+"""
+
     @staticmethod
     def _build_landmark_text(landmarks: List[Landmark]) -> str:
         """
@@ -28,17 +100,35 @@ class PlannerService:
             )
         return "\n".join(lines)
 
+    @staticmethod
+    def _build_day_groups_text(
+        landmarks: List[Landmark],
+        day_assignments: Dict[int, int],
+    ) -> str:
+        """
+        날짜별로 묶인 선택 랜드마크 텍스트. (가까운 것끼리 같은 날)
+        """
+        lines = []
+        for day in sorted(set(day_assignments.values())):
+            names = ", ".join(
+                f'"{lm.name}"(id: {lm.id})' for lm in landmarks if day_assignments.get(lm.id) == day
+            )
+            lines.append(f"- Day {day + 1}: {names}")
+        return "\n".join(lines)
+
     @staticmethod
     def _ensure_selected_landmarks_in_plan(
         data: Dict[str, Any],
         selected_landmarks: List[Landmark],
+        day_assignments: Optional[Dict[int, int]] = None,
     ) -> Dict[str, Any]:
         """
         daily_plan 안에 사용자가 선택한 랜드마크(id)가
         최소 1번씩은 반드시 들어가도록 강제로 보정하는 함수.
 
         - 이미 해당 landmark_id가 포함되어 있으면 그대로 둔다.
-        - 없다면 day 1 ~ N에 골고루 분배해서 landmarks 리스트에 추가한다.
+        - 없다면 day_assignments(landmark_id → 0부터 시작하는 day 인덱스)에 지정된 날에 넣고,
+          지정이 없으면 day 1 ~ N에 골고루 분배해서 landmarks 리스트에 추가한다.
         """
         if not selected_landmarks:
             return data
@@ -67,8 +157,12 @@ class PlannerService:
             if sel.id in present_ids:
                 continue
 
-            day = daily_plan[day_idx % day_count]
-            day_idx += 1
+            assigned = (day_assignments or {}).get(sel.id)
+            if assigned is not None and 0 <= assigned < day_count:
+                day = daily_plan[assigned]
+            else:
+                day = daily_plan[day_idx % day_count]
+                day_idx += 1
 
             if not isinstance(day, dict):
                 continue
@@ -107,6 +201,7 @@ class PlannerService:
     def build_prompt(
         itinerary_in: ItineraryCreate,
         landmarks: List[Landmark],
+        day_assignments: Optional[Dict[int, int]] = None,
     ) -> str:
         """
         선택한 국가/지역/테마/랜드마크 정보를 기반으로
@@ -116,6 +211,7 @@ class PlannerService:
         ✅ 랜드마크 선택 여부에 따라 두 가지 모드로 동작한다.
            - 선택된 랜드마크 O: 그 랜드마크들은 반드시 포함 + is_user_selected = true + landmark_id 포함
            - 선택된 랜드마크 X: 모델이 랜드마크를 전부 추천 + is_user_selected = false + landmark_id 필드 없음
+        ✅ day_assignments(지리적 묶음)가 있으면 선택 랜드마크를 날짜별로 나눠서 전달한다.
         """
         country = itinerary_in.country_code
         region = itinerary_in.region_code
@@ -123,48 +219,26 @@ class PlannerService:
         theme = itinerary_in.theme or "일반 여행"
 
         has_selected_landmarks = len(landmarks) > 0
-        landmark_text = PlannerService._build_landmark_text(landmarks)
+        if has_selected_landmarks and day_assignments:
+            landmark_text = PlannerService._build_day_groups_text(landmarks, day_assignments)
+            placement_rule = (
+                f"4. 선택된 랜드마크는 서로 가까운 것끼리 날짜별로 묶여 있습니다. 표시된 Day에 넣고, "
+                f"같은 날 AI 추천 장소도 그 주변에서 골라 Day 1 ~ Day {days} 동선이 짧게 이어지도록 구성하세요."
+            )
+        else:
+            landmark_text = PlannerService._build_landmark_text(landmarks)
+            placement_rule = (
+                f"4. 선택된 랜드마크와 AI 추천 랜드마크를 적절히 섞어서 "
+                f"Day 1 ~ Day {days} 전체 동선이 자연스럽게 이어지도록 구성하세요."
+            )
 
         # ✅ JSON 구조를 매우 명확하게 정의 (유효한 JSON 예시 + 설명)
-        schema_description = """
-반드시 아래 구조의 JSON 한 개만 생성하세요. (키 이름과 계층 구조를 정확히 지키세요.)
-
-{
-  "overview": {
-    "title": "문자열",
-    "summary": "문자열",
-    "highlights": ["문자열", "문자열"]
-  },
-  "daily_plan": [
-    {
-      "day": 1,
-      "title": "문자열",
-      "reason": "문자열",
-      "landmarks": [
-        {
-          "name": "문자열",
-          "order": 1,
-          "reason": "문자열",
-          "is_user_selected": true,
-          "landmark_id": 123
-        }
-      ]
-    }
-  ],
-  "tips": {
-    "packing": ["문자열", "문자열"],
-    "local": ["문자열", "문자열"]
-  }
-}
-
-중요한 규칙:
-- 최상위 키는 반드시 overview, daily_plan, tips 세 개만 있어야 합니다.
-- daily_plan은 배열이며, 각 원소는 day, title, reason, landmarks를 가진 객체입니다.
-- tips는 daily_plan 바깥, overview와 같은 최상위 레벨에 있어야 합니다.
-- daily_plan 배열 안에는 "tips" 같은 다른 키를 절대 넣지 마세요.
-- landmarks 배열의 각 원소는 name, order, reason, is_user_selected는 항상 포함해야 합니다.
-- landmark_id는 "선택된 랜드마크"에만 포함되는 선택적(optional) 키입니다.
-"""
+        #    structured output 모드에서는 스키마를 API(response_schema)로 강제하므로
+        #    긴 예시 대신 필드 의미만 짧게 전달한다.
+        if settings.gemini_structured_output:
+            schema_description = PlannerService.STRUCTURED_SCHEMA_NOTE
+        else:
+            schema_description = PlannerService.PROSE_SCHEMA_DESCRIPTION
 
         if has_selected_landmarks:
             # ✅ 사용자가 일부 랜드마크를 선택한 경우
@@ -183,7 +257,7 @@ class PlannerService:
 3. 사용자가 선택하지 않은 랜드마크(=AI가 새로 추천하는 랜드마크)는:
    - is_user_selected: 반드시 false
    - landmark_id 키를 절대 포함하지 마세요. (즉, "landmark_id": ... 를 쓰지 말 것)
-4. 선택된 랜드마크와 AI 추천 랜드마크를 적절히 섞어서 Day 1 ~ Day {days} 전체 동선이 자연스럽게 이어지도록 구성하세요.
+{placement_rule}
 5. Day 1부터 Day {days}까지 모든 날짜에 대해 2~4개의 landmarks를 채워주세요.
 """
         else:
@@ -249,22 +323,30 @@ class PlannerService:
         return text
 
     @staticmethod
-    def generate_itinerary_text(
-        itinerary_in: ItineraryCreate,
+    def _response_model():
+        """
+        structured output 모드면 ItineraryDetail 스키마를 Gemini에 강제한다.
+        """
+        return ItineraryDetail if settings.gemini_structured_output else None
+
+    @staticmethod
+    def _finalize_answer(
+        raw_answer: str,
         landmarks: List[Landmark],
+        day_assignments: Optional[Dict[int, int]] = None,
+        itinerary_in: Optional[ItineraryCreate] = None,
     ) -> tuple[str, str]:
         """
-        프롬프트를 만들고, Gemini에게 던져서
-        (제목, ItineraryDetail JSON 문자열)을 반환.
+        Gemini 원본 응답 → (제목, 보정된 ItineraryDetail JSON 문자열).
+        sync/async 생성 경로에서 공통으로 사용한다.
 
-        - title: overview.title 에서 추출
-        - full_json_text: ai_summary 컬럼에 그대로 저장할 JSON 문자열
-        """
-        prompt = PlannerService.build_prompt(itinerary_in, landmarks)
-        res = GeminiService.get_chat_response(prompt)
+        itinerary_in이 있으면 선택 랜드마크 보정 뒤 하루 방문 순서를 동선 기준으로 다시 정렬한다.
 
-        raw_answer = (res.answer or "").strip()
-        json_text = PlannerService._extract_json_text(raw_answer)
+        생성 시점에 ItineraryDetail로 한 번만 검증하고, 공백 없는 compact JSON으로 저장한다.
+        (ItineraryOut.ai_summary / CSV 같은 사람이 보는 출력은 ItineraryDetailService.summary_text 가 들여쓰기)
+        (읽는 쪽은 ItineraryDetail.model_validate_json 한 번으로 끝)
+        """
+        json_text = PlannerService._extract_json_text((raw_answer or "").strip())
 
         title = "여행 일정"
 
@@ -275,20 +357,313 @@ class PlannerService:
             data = PlannerService._ensure_selected_landmarks_in_plan(
                 data=data,
                 selected_landmarks=landmarks,
+                day_assignments=day_assignments,
             )
 
+            # ✅ 하루 방문 순서 최적화 + 하루 이동 거리 기록
+            if itinerary_in is not None and settings.itinerary_route_optimization:
+                try:
+                    data = RouteService.optimize_daily_plan(
+                        data, itinerary_in.country_code, itinerary_in.region_code
+                    )
+                except Exception as e:
+                    print(f"[PlannerService] 동선 최적화 실패, 원래 순서 유지: {e}")
+
+            # ✅ 타입 검증 (실패하면 아래 except에서 원본 텍스트를 그대로 저장)
+            detail = ItineraryDetail.model_validate(data)
+
             # ✅ overview.title 기준으로 제목 추출
-            overview = data.get("overview", {})
-            if isinstance(overview, dict):
-                title_candidate = overview.get("title")
-                if isinstance(title_candidate, str) and title_candidate.strip():
-                    title = title_candidate.strip()
+            if detail.overview.title.strip():
+                title = detail.overview.title.strip()
 
-            # ✅ 보정된 데이터를 다시 JSON 문자열로 직렬화
-            json_text = json.dumps(data, ensure_ascii=False, indent=2)
+            # ✅ 검증된 데이터를 compact JSON 문자열로 직렬화
+            json_text = detail.model_dump_json(exclude_none=True)
 
         except Exception as e:
-            print(f"[PlannerService] JSON 파싱 실패, 기본 제목 사용: {e}")
+            print(f"[PlannerService] JSON 파싱/검증 실패, 기본 제목 사용: {e}")
+            LLM_PARSE_FAILURES.inc(caller="itinerary")
 
         # title: 문자열, json_text: 나중에 그대로 파싱해서 ItineraryDetail로 씀
         return title, json_text
+
+    @staticmethod
+    async def _finalize_answer_async(
+        raw_answer: str,
+        landmarks: List[Landmark],
+        day_assignments: Optional[Dict[int, int]] = None,
+        itinerary_in: Optional[ItineraryCreate] = None,
+    ) -> tuple[str, str]:
+        """
+        async 경로용 _finalize_answer. 동선 최적화가 DB 조회 + 2-opt 를 동기로 하므로
+        이벤트 루프를 막지 않게 스레드에서 돌린다.
+        """
+        return await asyncio.to_thread(
+            PlannerService._finalize_answer, raw_answer, landmarks, day_assignments, itinerary_in
+        )
+
+    @staticmethod
+    def generate_itinerary_text(
+        itinerary_in: ItineraryCreate,
+        landmarks: List[Landmark],
+    ) -> tuple[str, str]:
+        """
+        프롬프트를 만들고, Gemini에게 던져서
+        (제목, ItineraryDetail JSON 문자열)을 반환.
+
+        - title: overview.title 에서 추출
+        - full_json_text: ai_summary 컬럼에 그대로 저장할 JSON 문자열
+        """
+        day_assignments = PlannerService._assign_landmarks_to_days(landmarks, itinerary_in.days)
+        prompt = PlannerService.build_prompt(itinerary_in, landmarks, day_assignments)
+        res = GeminiService.get_chat_response(
+            prompt, PlannerService._response_model(), caller="itinerary"
+        )
+        return PlannerService._finalize_answer(res.answer, landmarks, day_assignments, itinerary_in)
+
+    @staticmethod
+    async def generate_itinerary_text_async(
+        itinerary_in: ItineraryCreate,
+        landmarks: List[Landmark],
+    ) -> tuple[str, str]:
+        """
+        generate_itinerary_text의 async 버전 (GeminiService.get_chat_response_async 사용).
+
+        같은 조건(request_key)의 생성이 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유한다.
+        """
+        async def _generate() -> tuple[str, str]:
+            if PlannerService._use_parallel_mode(itinerary_in):
+                return await PlannerService.generate_itinerary_text_parallel_async(itinerary_in, landmarks)
+
+            day_assignments = PlannerService._assign_landmarks_to_days(landmarks, itinerary_in.days)
+            prompt = PlannerService.build_prompt(itinerary_in, landmarks, day_assignments)
+            res = await GeminiService.get_chat_response_async(
+                prompt, PlannerService._response_model(), caller="itinerary"
+            )
+            return await PlannerService._finalize_answer_async(res.answer, landmarks, day_assignments, itinerary_in)
+
+        if not settings.itinerary_singleflight_enabled:
+            return await _generate()
+        return await itinerary_flight.do(PlannerService.request_key(itinerary_in), _generate)
+
+    @staticmethod
+    def request_key(itinerary_in: ItineraryCreate, include_start_date: bool = False) -> str:
+        """
+        생성 결과에 영향을 주는 필드만 정규화해서 만든 키.
+        (start_date는 프롬프트에 쓰이지 않으므로 기본적으로 제외)
+        """
+        key = {
+            "country_code": itinerary_in.country_code.upper(),
+            "region_code": itinerary_in.region_code.lower(),
+            "days": itinerary_in.days,
+            "theme": (itinerary_in.theme or "").strip().casefold(),
+            "selected_landmark_ids": sorted(set(itinerary_in.selected_landmark_ids)),
+        }
+        if include_start_date:
+            key["start_date"] = itinerary_in.start_date.isoformat()
+        return json.dumps(key, sort_keys=True, ensure_ascii=False)
+
+    @staticmethod
+    async def stream_itinerary_events_async(
+        itinerary_in: ItineraryCreate,
+        landmarks: List[Landmark],
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        스트리밍 생성: 모델 출력이 들어오는 대로 완성된 조각을 이벤트로 yield.
+
+        - ("overview", dict) : overview 객체가 완성된 순간
+        - ("day", dict)      : daily_plan 원소 하나가 완성된 순간 (보정 전 원본)
+        - ("complete", (title, json_text)) : 마지막 1회, _finalize_answer로 보정된 결과
+        """
+        day_assignments = PlannerService._assign_landmarks_to_days(landmarks, itinerary_in.days)
+        prompt = PlannerService.build_prompt(itinerary_in, landmarks, day_assignments)
+        parser = PlanStreamParser()
+
+        async for chunk in GeminiService.stream_chat_response_async(
+            prompt, PlannerService._response_model(), caller="itinerary_stream"
+        ):
+            for event in parser.feed(chunk):
+                yield event
+
+        yield "complete", await PlannerService._finalize_answer_async(
+            parser.text, landmarks, day_assignments, itinerary_in
+        )
+
+    # ─────────────────────────────
+    # 일자별 병렬 생성 모드
+    # ─────────────────────────────
+    @staticmethod
+    def _use_parallel_mode(itinerary_in: ItineraryCreate) -> bool:
+        return (
+            settings.itinerary_generation_mode == "parallel"
+            and itinerary_in.days >= settings.itinerary_parallel_min_days
+        )
+
+    @staticmethod
+    def _assign_landmarks_to_days(landmarks: List[Landmark], days: int) -> Dict[int, int]:
+        """
+        선택 랜드마크를 날짜에 배정 (landmark_id → 0부터 시작하는 day 인덱스).
+        위경도 기준으로 가까운 것끼리 같은 날에 묶는다. (ClusterService)
+        """
+        return ClusterService.cluster(landmarks, days)
+
+    @staticmethod
+    def build_skeleton_prompt(
+        itinerary_in: ItineraryCreate,
+        landmarks: List[Landmark],
+        day_assignments: Dict[int, int],
+    ) -> str:
+        """
+        병렬 모드 1단계: overview + tips + 날짜별 제목/주제(focus)만 짧게 받는 프롬프트.
+        """
+        theme = itinerary_in.theme or "일반 여행"
+        days = itinerary_in.days
+
+        assigned_lines = []
+        for lm in landmarks:
+            assigned_lines.append(f'- Day {day_assignments[lm.id] + 1}: "{lm.name}" (id: {lm.id})')
+        assigned_text = "\n".join(assigned_lines) or "(선택된 랜드마크 없음)"
+
+        return f"""
+당신은 여행 일정 플래너입니다.
+아래 조건의 {days}일 여행에 대해 전체 개요와 날짜별 주제만 한국어로 정해 주세요.
+(날짜별 세부 장소는 나중에 따로 채웁니다.)
+
+[여행 조건]
+- 국가 코드: {itinerary_in.country_code}
+- 지역 코드: {itinerary_in.region_code}
+- 여행 일수: {days}일
+- 테마: {theme}
+
+[날짜별로 이미 배정된 사용자 선택 랜드마크]
+{assigned_text}
+
+[규칙]
+1. days 배열에는 day 1부터 {days}까지 정확히 {days}개를 넣으세요.
+2. 각 날짜의 focus에는 그날 둘러볼 동네/권역과 주제를 한 문장으로 적으세요. 날짜끼리 겹치지 않게 하세요.
+3. 배정된 선택 랜드마크가 있는 날은 그 랜드마크 주변 권역을 focus로 잡으세요.
+4. overview(title, summary, highlights)와 tips(packing, local)도 함께 작성하세요.
+"""
+
+    @staticmethod
+    def build_day_prompt(
+        itinerary_in: ItineraryCreate,
+        skeleton: ItinerarySkeleton,
+        day: int,
+        day_landmarks: List[Landmark],
+    ) -> str:
+        """
+        병렬 모드 2단계: 하루치 ItineraryDayPlan 하나만 만드는 짧은 프롬프트.
+        """
+        theme = itinerary_in.theme or "일반 여행"
+        plan = next((d for d in skeleton.days if d.day == day), None)
+        day_title = plan.title if plan else f"Day {day}"
+        day_focus = plan.focus if plan else ""
+        other_days = "\n".join(
+            f"- Day {d.day}: {d.focus}" for d in skeleton.days if d.day != day
+        ) or "(없음)"
+
+        if day_landmarks:
+            selected_text = "\n".join(f'- id: {lm.id}, name: "{lm.name}"' for lm in day_landmarks)
+            selected_rule = (
+                "위 선택 랜드마크는 반드시 포함하고 is_user_selected=true, landmark_id=해당 id로 넣으세요. "
+                "나머지 추천 장소는 is_user_selected=false, landmark_id는 비워 두세요."
+            )
+        else:
+            selected_text = "(없음)"
+            selected_rule = "모든 장소는 AI 추천입니다. is_user_selected=false, landmark_id는 비워 두세요."
+
+        return f"""
+당신은 여행 일정 플래너입니다.
+'{skeleton.overview.title}' 여행 중 Day {day} 하루 일정만 한국어로 작성해 주세요.
+
+[여행 조건]
+- 국가 코드: {itinerary_in.country_code}
+- 지역 코드: {itinerary_in.region_code}
+- 테마: {theme}
+
+[Day {day}]
+- 제목: {day_title}
+- 주제/권역: {day_focus}
+
+[다른 날짜 주제 - 장소가 겹치지 않게 참고]
+{other_days}
+
+[이 날 꼭 넣어야 하는 사용자 선택 랜드마크]
+{selected_text}
+
+[규칙]
+1. day 값은 {day}, title은 위 제목을 사용하세요.
+2. landmarks는 2~4개, order는 방문 순서(1부터)이며 동선이 자연스럽게 이어지게 배치하세요.
+3. {selected_rule}
+"""
+
+    @staticmethod
+    def _parse_model(raw_answer: str, model_cls):
+        try:
+            json_text = PlannerService._extract_json_text((raw_answer or "").strip())
+            return model_cls.model_validate_json(json_text)
+        except Exception as e:
+            print(f"[PlannerService] {model_cls.__name__} 파싱 실패: {e}")
+            LLM_PARSE_FAILURES.inc(caller=model_cls.__name__)
+            return None
+
+    @staticmethod
+    async def generate_itinerary_text_parallel_async(
+        itinerary_in: ItineraryCreate,
+        landmarks: List[Landmark],
+    ) -> tuple[str, str]:
+        """
+        병렬 생성 모드.
+
+        1) 선택 랜드마크를 날짜에 배정하고, 짧은 호출 1번으로 overview/tips/날짜별 주제를 받는다.
+        2) 날짜별 ItineraryDayPlan을 작은 프롬프트로 동시에(asyncio.gather) 생성한다.
+        3) 합쳐서 ItineraryDetail로 만들고, 같은 배정 기준으로 선택 랜드마크 누락을 보정한다.
+
+        전체 지연 ≈ 뼈대 호출 + 가장 느린 하루. 뼈대 생성에 실패하면 기존 1회 생성으로 대체.
+        """
+        days = itinerary_in.days
+        day_assignments = PlannerService._assign_landmarks_to_days(landmarks, days)
+
+        skeleton_prompt = PlannerService.build_skeleton_prompt(itinerary_in, landmarks, day_assignments)
+        skeleton_res = await GeminiService.get_chat_response_async(
+            skeleton_prompt, ItinerarySkeleton, caller="itinerary_skeleton"
+        )
+        skeleton = PlannerService._parse_model(skeleton_res.answer, ItinerarySkeleton)
+
+        if skeleton is None:
+            prompt = PlannerService.build_prompt(itinerary_in, landmarks, day_assignments)
+            res = await GeminiService.get_chat_response_async(
+                prompt, PlannerService._response_model(), caller="itinerary"
+            )
+            return await PlannerService._finalize_answer_async(res.answer, landmarks, day_assignments, itinerary_in)
+
+        async def _day(day: int) -> Dict[str, Any]:
+            day_landmarks = [lm for lm in landmarks if day_assignments[lm.id] == day - 1]
+            prompt = PlannerService.build_day_prompt(itinerary_in, skeleton, day, day_landmarks)
+            res = await GeminiService.get_chat_response_async(
+                prompt, ItineraryDayPlan, caller="itinerary_day"
+            )
+            plan = PlannerService._parse_model(res.answer, ItineraryDayPlan)
+            if plan is None:
+                # 하루 생성이 실패해도 나머지는 살린다. (선택 랜드마크는 보정 단계에서 채워짐)
+                skel_day = next((d for d in skeleton.days if d.day == day), None)
+                return {
+                    "day": day,
+                    "title": skel_day.title if skel_day else f"Day {day}",
+                    "reason": skel_day.focus if skel_day else "",
+                    "landmarks": [],
+                }
+            data = plan.model_dump(exclude_none=True)
+            data["day"] = day
+            return data
+
+        daily_plan = await asyncio.gather(*[_day(d) for d in range(1, days + 1)])
+
+        merged = {
+            "overview": skeleton.overview.model_dump(),
+            "daily_plan": list(daily_plan),
+            "tips": skeleton.tips.model_dump(),
+        }
+        return await PlannerService._finalize_answer_async(
+            json.dumps(merged, ensure_ascii=False), landmarks, day_assignments, itinerary_in
+        )
@@ -0,0 +1,330 @@
+# backend/app/services/road_graph.py
+"""
+로컬 도로망 최단 경로 (외부 OSRM 없이 거리/시간 계산).
+
+- RoadGraph  : 노드 좌표 + CSR 인접 배열(indptr / indices / length_m)로 압축한 도로 그래프.
+               정방향/역방향 CSR을 함께 들고 있어서 일방통행도 양방향 A*로 처리한다.
+- LocalRouter: REGION_DATA 지역별 그래프(data/roads/{country}_{region}.npz)를 지연 로드하고,
+               좌표 → 가장 가까운 노드로 스냅한 뒤 구간별 최단 거리를 계산한다.
+
+그래프 만들기 (OSM XML 추출본, .pbf는 `osmium cat tokyo.osm.pbf -o tokyo.osm` 로 변환):
+    python -m app.services.road_graph --country JP --region tokyo --osm tokyo.osm
+"""
+import argparse
+import heapq
+import math
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.matrix_service import EARTH_RADIUS_KM
+
+# backend/ 기준 경로
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+ROAD_DIR = BASE_DIR / "data" / "roads"
+
+# 자동차/도보로 다닐 수 있는 도로 종류만 사용
+HIGHWAY_TYPES = {
+    "motorway", "trunk", "primary", "secondary", "tertiary", "unclassified", "residential",
+    "motorway_link", "trunk_link", "primary_link", "secondary_link", "tertiary_link",
+    "living_street", "service", "road",
+}
+
+
+def _haversine_m(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * 1000 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _csr(n: int, src: np.ndarray, dst: np.ndarray, weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(indptr, src + 1, 1)
+    return np.cumsum(indptr), dst[order].astype(np.int32), weight[order].astype(np.float32)
+
+
+class RoadGraph:
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lng: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        length_m: np.ndarray,
+        rev_indptr: np.ndarray,
+        rev_indices: np.ndarray,
+        rev_length_m: np.ndarray,
+    ):
+        self.lat = lat
+        self.lng = lng
+        self.indptr, self.indices, self.length_m = indptr, indices, length_m
+        self.rev_indptr, self.rev_indices, self.rev_length_m = rev_indptr, rev_indices, rev_length_m
+        self.bbox = (float(lat.min()), float(lng.min()), float(lat.max()), float(lng.max()))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.lat)
+
+    @classmethod
+    def from_edges(
+        cls,
+        lat: np.ndarray,
+        lng: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray,
+        length_m: Optional[np.ndarray] = None,
+    ) -> "RoadGraph":
+        """
+        방향 간선 목록(src → dst)으로 그래프 생성. 양방향 도로는 간선 2개로 넣는다.
+        length_m을 생략하면 노드 좌표로 직선 길이를 계산한다.
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if length_m is None:
+            length_m = _haversine_m(lat[src], lng[src], lat[dst], lng[dst])
+        length_m = np.asarray(length_m, dtype=np.float64)
+
+        n = len(lat)
+        fwd = _csr(n, src, dst, length_m)
+        rev = _csr(n, dst, src, length_m)
+        return cls(lat, lng, *fwd, *rev)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            lat=self.lat, lng=self.lng,
+            indptr=self.indptr, indices=self.indices, length_m=self.length_m,
+            rev_indptr=self.rev_indptr, rev_indices=self.rev_indices, rev_length_m=self.rev_length_m,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RoadGraph":
+        with np.load(path) as f:
+            return cls(
+                f["lat"], f["lng"],
+                f["indptr"], f["indices"], f["length_m"],
+                f["rev_indptr"], f["rev_indices"], f["rev_length_m"],
+            )
+
+    def contains(self, lat: float, lng: float, margin_deg: float = 0.05) -> bool:
+        lat_min, lng_min, lat_max, lng_max = self.bbox
+        return (
+            lat_min - margin_deg <= lat <= lat_max + margin_deg
+            and lng_min - margin_deg <= lng <= lng_max + margin_deg
+        )
+
+    def nearest_node(self, lat: float, lng: float) -> Tuple[int, float]:
+        """
+        (노드 번호, 스냅 거리 m). 평면 근사로 후보를 고르고 거리는 하버사인으로 계산.
+        """
+        scale = math.cos(math.radians(lat))
+        d2 = (self.lat - lat) ** 2 + ((self.lng - lng) * scale) ** 2
+        node = int(np.argmin(d2))
+        return node, float(_haversine_m(lat, lng, self.lat[node], self.lng[node]))
+
+    def _straight_m(self, a: int, b: int) -> float:
+        lat1, lng1 = math.radians(self.lat[a]), math.radians(self.lng[a])
+        lat2, lng2 = math.radians(self.lat[b]), math.radians(self.lng[b])
+        h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * 1000 * math.asin(min(1.0, math.sqrt(h)))
+
+    def shortest_distance(self, source: int, target: int) -> float:
+        """
+        양방향 A* (평균 포텐셜). 도달할 수 없으면 inf.
+
+        p(v) = (h(v, target) - h(source, v)) / 2 를 정방향에, -p(v)를 역방향에 쓰면
+        두 방향 모두 음수 없는 간선 가중치가 되어 일반 양방향 Dijkstra 종료 조건을 그대로 쓸 수 있다.
+        (h = 직선거리 × 0.999, float32 반올림 오차에도 consistent 하도록)
+        """
+        if source == target:
+            return 0.0
+
+        potentials: Dict[int, float] = {}
+
+        def p(v: int) -> float:
+            value = potentials.get(v)
+            if value is None:
+                value = 0.4995 * (self._straight_m(v, target) - self._straight_m(source, v))
+                potentials[v] = value
+            return value
+
+        # 거리는 모두 포텐셜을 반영한 값으로 관리 (sign: 정방향 +1, 역방향 -1)
+        dist = ({source: 0.0}, {target: 0.0})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        done = (set(), set())
+        graphs = (
+            (self.indptr, self.indices, self.length_m, 1.0),
+            (self.rev_indptr, self.rev_indices, self.rev_length_m, -1.0),
+        )
+        best = math.inf
+
+        while heaps[0] and heaps[1]:
+            # 두 탐색의 최소 키 합이 현재 최단 후보 이상이면 종료
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[side])
+            if u in done[side]:
+                continue
+            done[side].add(u)
+
+            indptr, indices, weights, sign = graphs[side]
+            mine, other = dist[side], dist[1 - side]
+            pu = sign * p(u)
+            for e in range(indptr[u], indptr[u + 1]):
+                v = int(indices[e])
+                nd = d + float(weights[e]) + sign * p(v) - pu
+                if nd < mine.get(v, math.inf):
+                    mine[v] = nd
+                    heapq.heappush(heaps[side], (nd, v))
+                if v in other:
+                    best = min(best, nd + other[v])
+
+        if math.isinf(best):
+            return best
+        # 포텐셜 보정 되돌리기: 실제 거리 = best - p(target) + p(source)
+        return best - p(target) + p(source)
+
+
+class LocalRouter:
+    """
+    DistanceService의 local 백엔드. 지역별 그래프를 한 번만 로드해서 재사용한다.
+    """
+
+    _graphs: Dict[str, Optional[RoadGraph]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def graph_path(country_code: str, region_code: str) -> Path:
+        return ROAD_DIR / f"{country_code}_{region_code}.npz"
+
+    @staticmethod
+    def _load_all() -> Dict[str, Optional[RoadGraph]]:
+        # 라우터 패키지 → distance_service → road_graph 순환 import를 피하려고 여기서 가져온다.
+        from app.routers.region_router import REGION_DATA
+
+        if LocalRouter._graphs:
+            return LocalRouter._graphs
+        with LocalRouter._lock:
+            if LocalRouter._graphs:
+                return LocalRouter._graphs
+            graphs: Dict[str, Optional[RoadGraph]] = {}
+            for country_code, regions in REGION_DATA.items():
+                for region in regions:
+                    path = LocalRouter.graph_path(country_code, region.code)
+                    key = f"{country_code}_{region.code}"
+                    graphs[key] = RoadGraph.load(path) if path.exists() else None
+                    if graphs[key] is not None:
+                        print(f"[LocalRouter] {key} 도로 그래프 로드: 노드 {graphs[key].node_count}개")
+            LocalRouter._graphs = graphs
+        return LocalRouter._graphs
+
+    @staticmethod
+    def register(key: str, graph: RoadGraph) -> None:
+        """
+        파일 대신 메모리에서 만든 그래프를 등록. (스크립트/테스트용)
+        """
+        LocalRouter._load_all()
+        LocalRouter._graphs[key] = graph
+
+    @staticmethod
+    def graph_for(lat: float, lng: float) -> Optional[RoadGraph]:
+        for graph in LocalRouter._load_all().values():
+            if graph is not None and graph.contains(lat, lng):
+                return graph
+        return None
+
+    @staticmethod
+    def speed_mps() -> float:
+        speeds = settings.matrix_speed_kmh
+        return speeds.get(settings.osrm_profile, speeds.get("driving", 25.0)) / 3.6
+
+    @staticmethod
+    def route(points: List[Tuple[float, float]]) -> Optional[dict]:
+        """
+        (lat, lng) 목록 → OSRM route 응답과 같은 모양의 dict
+        {"distance": m, "duration": s, "legs": [{"distance", "duration"}, ...]}.
+        그래프가 없거나 이어지지 않는 구간이 있으면 None.
+        """
+        graph = LocalRouter.graph_for(*points[0])
+        if graph is None or not all(graph.contains(lat, lng) for lat, lng in points):
+            return None
+
+        snapped = [graph.nearest_node(lat, lng) for lat, lng in points]
+        speed = LocalRouter.speed_mps()
+        legs = []
+        for (a, snap_a), (b, snap_b) in zip(snapped, snapped[1:]):
+            road = graph.shortest_distance(a, b)
+            if math.isinf(road):
+                return None
+            meters = road + snap_a + snap_b
+            legs.append({"distance": meters, "duration": meters / speed})
+
+        return {
+            "distance": sum(leg["distance"] for leg in legs),
+            "duration": sum(leg["duration"] for leg in legs),
+            "legs": legs,
+        }
+
+
+def build_from_osm_xml(osm_path: Path) -> RoadGraph:
+    """
+    OSM XML 추출본 → RoadGraph. highway 태그가 있는 way만 쓰고, oneway를 반영한다.
+    """
+    node_coords: Dict[int, Tuple[float, float]] = {}
+    edges: List[Tuple[int, int]] = []
+
+    for _, elem in ET.iterparse(str(osm_path), events=("end",)):
+        if elem.tag == "node":
+            node_coords[int(elem.get("id"))] = (float(elem.get("lat")), float(elem.get("lon")))
+            elem.clear()
+        elif elem.tag == "way":
+            tags = {t.get("k"): t.get("v") for t in elem.findall("tag")}
+            if tags.get("highway") in HIGHWAY_TYPES:
+                refs = [int(nd.get("ref")) for nd in elem.findall("nd")]
+                oneway = tags.get("oneway")
+                if tags.get("junction") == "roundabout" and oneway is None:
+                    oneway = "yes"
+                if oneway == "-1":
+                    refs.reverse()
+                for a, b in zip(refs, refs[1:]):
+                    edges.append((a, b))
+                    if oneway not in ("yes", "true", "1", "-1"):
+                        edges.append((b, a))
+            elem.clear()
+
+    used = sorted({n for edge in edges for n in edge if n in node_coords})
+    index = {osm_id: i for i, osm_id in enumerate(used)}
+    edges = [(index[a], index[b]) for a, b in edges if a in index and b in index]
+
+    lat = np.array([node_coords[n][0] for n in used])
+    lng = np.array([node_coords[n][1] for n in used])
+    src = np.array([a for a, _ in edges], dtype=np.int64)
+    dst = np.array([b for _, b in edges], dtype=np.int64)
+    return RoadGraph.from_edges(lat, lng, src, dst)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="OSM 추출본으로 지역 도로 그래프 생성")
+    parser.add_argument("--country", required=True, help="JP/TH/UK")
+    parser.add_argument("--region", required=True, help="tokyo / bangkok / london ...")
+    parser.add_argument("--osm", required=True, help="OSM XML 파일 경로")
+    args = parser.parse_args(argv)
+
+    graph = build_from_osm_xml(Path(args.osm))
+    path = LocalRouter.graph_path(args.country, args.region)
+    graph.save(path)
+    print(f"[road_graph] 저장: {path} (노드 {graph.node_count}개, 간선 {len(graph.indices)}개)")
+
+
+if __name__ == "__main__":
+    main()
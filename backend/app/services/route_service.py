@@ -0,0 +1,183 @@
+# backend/app/services/route_service.py
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.db.session import SessionLocal
+from app.models import Itinerary
+from app.schemas import ItineraryDayPlan, RouteWaypoint
+from app.services.itinerary_detail_service import ItineraryDetailService
+from app.services.matrix_service import DistanceMatrixService
+
+
+class RouteService:
+    """
+    생성된 일정의 하루 방문 순서를 짧은 동선으로 다시 정렬한다.
+
+    - 좌표는 landmarks 테이블에서 찾는다. (landmark_id, 없으면 이름 일치)
+    - 거리 행렬은 DistanceMatrixService의 지역 캐시를 그대로 사용
+    - 최근접 이웃으로 초기 경로를 만들고 2-opt로 교차 구간을 풀어준다. (열린 경로, 출발점 자유)
+    - 좌표를 못 찾은 AI 추천 장소는 원래 자리(슬롯)를 그대로 유지한다.
+    """
+
+    @staticmethod
+    def path_length(path: List[int], dist: np.ndarray) -> float:
+        return float(sum(dist[a, b] for a, b in zip(path, path[1:])))
+
+    @staticmethod
+    def nearest_neighbour(dist: np.ndarray, start: int) -> List[int]:
+        n = len(dist)
+        path = [start]
+        visited = np.zeros(n, dtype=bool)
+        visited[start] = True
+        for _ in range(n - 1):
+            row = np.where(visited, np.inf, dist[path[-1]])
+            nxt = int(np.argmin(row))
+            path.append(nxt)
+            visited[nxt] = True
+        return path
+
+    @staticmethod
+    def two_opt(path: List[int], dist: np.ndarray) -> List[int]:
+        """
+        열린 경로용 2-opt: path[i..k] 구간을 뒤집어서 짧아지면 반영, 개선이 없을 때까지 반복.
+        """
+        path = list(path)
+        n = len(path)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(0, n - 1):
+                for k in range(i + 1, n):
+                    a = path[i - 1] if i > 0 else None
+                    b, c = path[i], path[k]
+                    d = path[k + 1] if k + 1 < n else None
+                    before = (dist[a, b] if a is not None else 0.0) + (dist[c, d] if d is not None else 0.0)
+                    after = (dist[a, c] if a is not None else 0.0) + (dist[b, d] if d is not None else 0.0)
+                    if after + 1e-9 < before:
+                        path[i:k + 1] = reversed(path[i:k + 1])
+                        improved = True
+        return path
+
+    @staticmethod
+    def solve(dist: np.ndarray) -> List[int]:
+        """
+        모든 출발점에서 최근접 이웃 → 2-opt 를 돌려 가장 짧은 방문 순서를 고른다.
+        (하루 장소 수가 적어서 전체가 1ms 안팎)
+        """
+        n = len(dist)
+        if n <= 2:
+            return list(range(n))
+
+        best: Optional[List[int]] = None
+        best_len = float("inf")
+        for start in range(n):
+            path = RouteService.two_opt(RouteService.nearest_neighbour(dist, start), dist)
+            length = RouteService.path_length(path, dist)
+            if length < best_len:
+                best, best_len = path, length
+        return best
+
+    @staticmethod
+    def _resolve_id(stop: Dict[str, Any], name_index: Dict[str, int]) -> Optional[int]:
+        lm_id = stop.get("landmark_id")
+        if isinstance(lm_id, int):
+            return lm_id
+        return name_index.get(DistanceMatrixService.normalize_name(stop.get("name", "")))
+
+    @staticmethod
+    def optimize_daily_plan(
+        data: Dict[str, Any],
+        country_code: str,
+        region_code: str,
+        db: Optional[Session] = None,
+    ) -> Dict[str, Any]:
+        """
+        daily_plan[*].landmarks 순서를 최적화하고 order(1부터)를 다시 매긴 뒤,
+        하루 총 이동 거리(travel_distance_km, 좌표를 아는 장소끼리)를 기록한다.
+        """
+        daily_plan = data.get("daily_plan")
+        if not isinstance(daily_plan, list) or not daily_plan:
+            return data
+
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            name_index = DistanceMatrixService.region_name_index(db, country_code, region_code)
+
+            for day in daily_plan:
+                if not isinstance(day, dict) or not isinstance(day.get("landmarks"), list):
+                    continue
+                stops = [s for s in day["landmarks"] if isinstance(s, dict)]
+                stops.sort(key=lambda s: s.get("order", 0) if isinstance(s.get("order"), int) else 0)
+
+                # 좌표를 아는 장소의 (슬롯 위치, landmark_id)
+                slots = []
+                for pos, stop in enumerate(stops):
+                    lm_id = RouteService._resolve_id(stop, name_index)
+                    if lm_id is not None:
+                        slots.append((pos, lm_id))
+
+                ids, dist, _ = DistanceMatrixService.region_matrix(
+                    db, country_code, region_code, landmark_ids=[lm_id for _, lm_id in slots]
+                ) if slots else ([], np.zeros((0, 0)), None)
+                row_of = {lm_id: i for i, lm_id in enumerate(ids)}
+                slots = [(pos, lm_id) for pos, lm_id in slots if lm_id in row_of]
+
+                if len(slots) >= 2:
+                    rows = [row_of[lm_id] for _, lm_id in slots]
+                    sub = dist[np.ix_(rows, rows)]
+                    path = RouteService.solve(sub)
+
+                    reordered = list(stops)
+                    positions = [pos for pos, _ in slots]
+                    for pos, idx in zip(positions, path):
+                        reordered[pos] = stops[positions[idx]]
+                    stops = reordered
+                    day["travel_distance_km"] = round(RouteService.path_length(path, sub), 2)
+                elif slots:
+                    day["travel_distance_km"] = 0.0
+
+                for order, stop in enumerate(stops, start=1):
+                    stop["order"] = order
+                day["landmarks"] = stops
+        finally:
+            if own_session:
+                db.close()
+
+        return data
+
+    @staticmethod
+    def plan_waypoints(
+        db: Session,
+        country_code: str,
+        region_code: str,
+        plan: ItineraryDayPlan,
+    ) -> List[RouteWaypoint]:
+        """
+        하루 일정의 방문 순서대로, 좌표를 찾을 수 있는 장소만 waypoint로 변환.
+        """
+        name_index = DistanceMatrixService.region_name_index(db, country_code, region_code)
+        stops = sorted(plan.landmarks, key=lambda s: s.order)
+        ids = [RouteService._resolve_id(s.model_dump(), name_index) for s in stops]
+        rows = {lm.id: lm for lm in crud.get_landmarks_by_ids(db, [i for i in ids if i is not None])}
+
+        return [
+            RouteWaypoint(lat=rows[lm_id].lat, lon=rows[lm_id].lng, name=stop.name, landmark_id=lm_id)
+            for stop, lm_id in zip(stops, ids)
+            if lm_id in rows
+        ]
+
+    @staticmethod
+    def day_waypoints(db: Session, itinerary: Itinerary, day: int) -> List[RouteWaypoint]:
+        """
+        저장된 일정의 day일차 waypoint 목록.
+        """
+        detail = ItineraryDetailService.load(itinerary)
+        plan = next((d for d in detail.daily_plan if d.day == day), None)
+        if plan is None:
+            return []
+        return RouteService.plan_waypoints(db, itinerary.country_code, itinerary.region_code, plan)
@@ -0,0 +1,186 @@
+# backend/app/services/spatial_service.py
+
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models import JapanRestaurant, Landmark
+from app.services.matrix_service import EARTH_RADIUS_KM
+
+Cell = Tuple[int, int]
+
+
+class GridIndex:
+    """
+    위경도 격자(cell_deg 간격) 기반 메모리 공간 인덱스.
+
+    - 셀 → {id: (lat, lng)} 이라 추가/수정/삭제가 O(1)
+    - 반경 검색은 bbox에 걸리는 셀만 모은 뒤 NumPy 하버사인으로 한 번에 거리 계산
+    """
+
+    def __init__(self, cell_deg: float = 0.01):
+        self.cell_deg = cell_deg
+        self._cells: Dict[Cell, Dict[int, Tuple[float, float]]] = {}
+        self._where: Dict[int, Cell] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def _cell(self, lat: float, lng: float) -> Cell:
+        return int(math.floor(lat / self.cell_deg)), int(math.floor(lng / self.cell_deg))
+
+    def upsert(self, item_id: int, lat: Optional[float], lng: Optional[float]) -> None:
+        with self._lock:
+            self._remove(item_id)
+            if lat is None or lng is None:
+                return
+            cell = self._cell(lat, lng)
+            self._cells.setdefault(cell, {})[item_id] = (lat, lng)
+            self._where[item_id] = cell
+
+    def remove(self, item_id: int) -> None:
+        with self._lock:
+            self._remove(item_id)
+
+    def _remove(self, item_id: int) -> None:
+        cell = self._where.pop(item_id, None)
+        if cell is None:
+            return
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(item_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cells.clear()
+            self._where.clear()
+
+    def nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        limit: int = 20,
+        exclude_id: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        (lat, lng)에서 radius_km 안의 항목을 가까운 순으로 [(id, 거리 km), ...].
+        """
+        dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        dlng = min(180.0, dlat / cos_lat)
+
+        lat_lo, lng_lo = self._cell(lat - dlat, lng - dlng)
+        lat_hi, lng_hi = self._cell(lat + dlat, lng + dlng)
+
+        ids: List[int] = []
+        coords: List[Tuple[float, float]] = []
+        with self._lock:
+            for ci in range(lat_lo, lat_hi + 1):
+                for cj in range(lng_lo, lng_hi + 1):
+                    bucket = self._cells.get((ci, cj))
+                    if bucket:
+                        ids.extend(bucket.keys())
+                        coords.extend(bucket.values())
+
+        if not ids:
+            return []
+
+        pts = np.radians(np.asarray(coords, dtype=np.float64))
+        lat0, lng0 = math.radians(lat), math.radians(lng)
+        a = (
+            np.sin((pts[:, 0] - lat0) / 2) ** 2
+            + math.cos(lat0) * np.cos(pts[:, 0]) * np.sin((pts[:, 1] - lng0) / 2) ** 2
+        )
+        dist = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+        inside = np.nonzero(dist <= radius_km)[0]
+        if exclude_id is not None:
+            inside = inside[[ids[i] != exclude_id for i in inside]] if len(inside) else inside
+        if len(inside) > limit:
+            inside = inside[np.argpartition(dist[inside], limit - 1)[:limit]]
+        inside = inside[np.argsort(dist[inside], kind="stable")]
+        return [(ids[i], float(dist[i])) for i in inside]
+
+
+class SpatialService:
+    """
+    랜드마크 / 일본 맛집 위치 인덱스. (첫 조회 때 DB에서 한 번 적재)
+    랜드마크 CRUD 라우트에서 upsert_landmark / remove_landmark 로 바로 반영한다.
+    """
+
+    landmarks = GridIndex()
+    restaurants = GridIndex()
+    _loaded = False
+    _load_lock = threading.Lock()
+
+    @staticmethod
+    def ensure_loaded(db: Session) -> None:
+        if SpatialService._loaded:
+            return
+        with SpatialService._load_lock:
+            if SpatialService._loaded:
+                return
+            SpatialService.landmarks.clear()
+            SpatialService.restaurants.clear()
+            for lm_id, lat, lng in db.query(Landmark.id, Landmark.lat, Landmark.lng):
+                SpatialService.landmarks.upsert(lm_id, lat, lng)
+            for rs_id, lat, lng in db.query(JapanRestaurant.id, JapanRestaurant.lat, JapanRestaurant.lng):
+                SpatialService.restaurants.upsert(rs_id, lat, lng)
+            SpatialService._loaded = True
+            print(
+                f"[SpatialService] 인덱스 적재: 랜드마크 {len(SpatialService.landmarks)}개, "
+                f"맛집 {len(SpatialService.restaurants)}개"
+            )
+
+    @staticmethod
+    def reset() -> None:
+        """
+        다음 조회 때 DB에서 다시 적재. (CSV 일괄 적재 후 등)
+        """
+        SpatialService._loaded = False
+
+    @staticmethod
+    def upsert_landmark(lm: Landmark) -> None:
+        if SpatialService._loaded:
+            SpatialService.landmarks.upsert(lm.id, lm.lat, lm.lng)
+
+    @staticmethod
+    def remove_landmark(landmark_id: int) -> None:
+        if SpatialService._loaded:
+            SpatialService.landmarks.remove(landmark_id)
+
+    @staticmethod
+    def nearby_landmarks(
+        db: Session,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        limit: int = 20,
+        exclude_id: Optional[int] = None,
+    ) -> List[Tuple[Landmark, float]]:
+        SpatialService.ensure_loaded(db)
+        hits = SpatialService.landmarks.nearby(lat, lng, radius_km, limit, exclude_id)
+        rows = {lm.id: lm for lm in crud.get_landmarks_by_ids(db, [i for i, _ in hits])}
+        return [(rows[i], d) for i, d in hits if i in rows]
+
+    @staticmethod
+    def nearby_restaurants(
+        db: Session,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        limit: int = 20,
+    ) -> List[Tuple[JapanRestaurant, float]]:
+        SpatialService.ensure_loaded(db)
+        hits = SpatialService.restaurants.nearby(lat, lng, radius_km, limit)
+        ids = [i for i, _ in hits]
+        rows = {r.id: r for r in db.query(JapanRestaurant).filter(JapanRestaurant.id.in_(ids))} if ids else {}
+        return [(rows[i], d) for i, d in hits if i in rows]
@@ -0,0 +1,162 @@
+# backend/app/services/travel_service.py
+
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.models import Itinerary
+from app.schemas import (
+    DayTravel,
+    ItineraryDayPlan,
+    ItineraryDetail,
+    ItineraryTravelOut,
+    RouteWaypoint,
+    TravelLeg,
+)
+from app.services.distance_service import DistanceService, DistanceServiceError
+from app.services.itinerary_detail_service import ItineraryDetailService
+from app.services.matrix_service import DistanceMatrixService
+from app.services.route_service import RouteService
+
+
+class TravelService:
+    """
+    일정의 구간별/일자별 이동 거리·시간을 한 번 계산해서 itinerary_travel 테이블에 저장.
+
+    - settings.itinerary_travel_source
+        - "estimate": 오프라인 거리 행렬(직선 × 우회 계수 / 평균 속도)로 즉시 계산
+        - "route"   : DistanceService.get_route (하루당 요청 1번, 캐시 사용), 실패한 날은 estimate
+                      생성 API 에서는 계산하지 않고 리포트 첫 조회 때 계산 (백그라운드 작업은 생성 직후)
+        - "off"     : 계산하지 않음
+    - 좌표를 아는 장소(landmarks 테이블과 매칭되는 장소)끼리의 구간만 계산한다.
+    """
+
+    @staticmethod
+    def _legs(waypoints: List[RouteWaypoint], distances: List[float], durations: List[float]) -> List[TravelLeg]:
+        return [
+            TravelLeg(
+                from_name=a.name or "",
+                to_name=b.name or "",
+                from_landmark_id=a.landmark_id,
+                to_landmark_id=b.landmark_id,
+                distance_km=round(dist, 2),
+                duration_min=round(dur, 1),
+            )
+            for a, b, dist, dur in zip(waypoints, waypoints[1:], distances, durations)
+        ]
+
+    @staticmethod
+    def _estimate(waypoints: List[RouteWaypoint]) -> List[TravelLeg]:
+        distance, duration = DistanceMatrixService.travel_matrices(
+            [w.lat for w in waypoints], [w.lon for w in waypoints], mode=settings.itinerary_travel_mode
+        )
+        n = len(waypoints)
+        return TravelService._legs(
+            waypoints,
+            [float(distance[i, i + 1]) for i in range(n - 1)],
+            [float(duration[i, i + 1]) for i in range(n - 1)],
+        )
+
+    @staticmethod
+    def _day_travel(
+        db: Session,
+        country_code: str,
+        region_code: str,
+        plan: ItineraryDayPlan,
+        use_route: bool,
+    ) -> tuple[DayTravel, bool]:
+        """
+        (하루 이동 정보, DistanceService 결과를 썼는지)
+        """
+        waypoints = RouteService.plan_waypoints(db, country_code, region_code, plan)
+        legs: List[TravelLeg] = []
+        routed = False
+
+        if len(waypoints) >= 2:
+            if use_route:
+                try:
+                    route = DistanceService.get_route(waypoints)
+                    legs = TravelService._legs(
+                        waypoints,
+                        [leg.distance_km for leg in route.legs],
+                        [leg.duration_min for leg in route.legs],
+                    )
+                    routed = True
+                except DistanceServiceError as e:
+                    print(f"[TravelService] Day {plan.day} 경로 조회 실패, 추정값 사용: {e}")
+            if not routed:
+                legs = TravelService._estimate(waypoints)
+
+        return DayTravel(
+            day=plan.day,
+            legs=legs,
+            total_distance_km=round(sum(leg.distance_km for leg in legs), 2),
+            total_duration_min=round(sum(leg.duration_min for leg in legs), 1),
+        ), routed
+
+    @staticmethod
+    def compute(
+        db: Session,
+        country_code: str,
+        region_code: str,
+        detail: ItineraryDetail,
+    ) -> Optional[ItineraryTravelOut]:
+        source = settings.itinerary_travel_source
+        if source == "off":
+            return None
+
+        use_route = source == "route"
+        days: List[DayTravel] = []
+        all_routed = use_route
+        for plan in detail.daily_plan:
+            day, routed = TravelService._day_travel(db, country_code, region_code, plan, use_route)
+            days.append(day)
+            all_routed = all_routed and (routed or not day.legs)
+
+        return ItineraryTravelOut(
+            source="route" if all_routed else "estimate",
+            mode=settings.osrm_profile if all_routed else settings.itinerary_travel_mode,
+            days=days,
+        )
+
+    @staticmethod
+    def annotate(db: Session, itinerary: Itinerary) -> Optional[ItineraryTravelOut]:
+        """
+        저장된 일정의 이동 정보를 계산해서 저장. (생성 직후 / 예전 일정은 리포트 첫 조회 때)
+        실패해도 일정 저장/조회는 계속되도록 None 반환.
+        """
+        try:
+            detail = ItineraryDetailService.load(itinerary)
+            travel = TravelService.compute(db, itinerary.country_code, itinerary.region_code, detail)
+            if travel is None:
+                return None
+            crud.save_itinerary_travel(db, itinerary.id, travel.source, travel.model_dump_json())
+            return travel
+        except Exception as e:
+            print(f"[TravelService] 이동 정보 계산 실패 (itinerary_id={itinerary.id}): {e}")
+            return None
+
+    @staticmethod
+    def annotate_on_create(db: Session, itinerary: Itinerary) -> None:
+        """
+        생성 요청 경로(응답 전)에서 호출. estimate 는 바로 계산해 두고,
+        route 는 OSRM 호출(재시도 포함)이 생성 응답을 늦추므로 리포트 첫 조회(load) 때로 미룬다.
+        """
+        if settings.itinerary_travel_source == "route":
+            return
+        TravelService.annotate(db, itinerary)
+
+    @staticmethod
+    def load(db: Session, itinerary: Itinerary) -> Optional[ItineraryTravelOut]:
+        """
+        저장된 이동 정보. 없으면 지금 계산해서 저장한다.
+        """
+        row = crud.get_itinerary_travel(db, itinerary.id)
+        if row is not None:
+            try:
+                return ItineraryTravelOut.model_validate_json(row.summary)
+            except Exception as e:
+                print(f"[TravelService] 저장된 이동 정보 파싱 실패, 다시 계산: {e}")
+        return TravelService.annotate(db, itinerary)
@@ -0,0 +1,80 @@
+# backend/app/services/weather_prewarmer.py
+
+import asyncio
+from typing import List, Optional
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models import Landmark
+from app.services.weather_service import WeatherService
+
+
+def _prewarm_points() -> List[tuple[float, float]]:
+    """
+    갱신 대상 좌표: REGION_DATA 지역 중심 (+ 설정 시 랜드마크 좌표).
+    """
+    # app.routers → weather_router 순환 import 방지
+    from app.routers.region_router import REGION_DATA
+
+    points = [(r.lat, r.lon) for regions in REGION_DATA.values() for r in regions]
+
+    if settings.weather_prewarm_landmarks:
+        db = SessionLocal()
+        try:
+            points.extend(
+                (lat, lng)
+                for lat, lng in db.query(Landmark.lat, Landmark.lng)
+                if lat is not None and lng is not None
+            )
+        finally:
+            db.close()
+    return points
+
+
+def _run_once() -> int:
+    return WeatherService.prewarm(_prewarm_points())
+
+
+class WeatherPrewarmer:
+    """
+    지역 예보 창을 주기적으로 다시 받아 캐시에 채워두는 백그라운드 작업.
+
+    - 간격(weather_prewarm_interval_seconds)을 예보 TTL보다 짧게 둬서 만료 전에 덮어쓴다.
+      → /weather/forecast, 일정 리포트는 지역 좌표에 대해 캐시만 보고 응답
+    - 좌표는 격자로 합친 뒤 weather_batch_size 개씩 묶어서 요청 (지역 전체가 요청 1번)
+    """
+
+    def __init__(self, interval_seconds: int):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        lifespan(startup)에서 호출.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="weather-prewarmer")
+
+    async def stop(self) -> None:
+        """
+        lifespan(shutdown)에서 호출.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                cells = await asyncio.to_thread(_run_once)
+                print(f"[WeatherPrewarmer] 예보 갱신: 격자 {cells}개")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[WeatherPrewarmer] 예보 갱신 실패: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+weather_prewarmer = WeatherPrewarmer(interval_seconds=settings.weather_prewarm_interval_seconds)
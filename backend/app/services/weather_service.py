@@ -1,18 +1,298 @@
 # backend/app/services/weather_service.py
 
-import requests
+import asyncio
 from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
 
+from app.core.cache import TieredCache
+from app.core.config import settings
+from app.core.http_client import http_clients
+from app.core.metrics import registry
+from app.core.swr import Revalidator
 from app.schemas import (
     WeatherResponse,
     WeatherDaily,
     WeatherForecastResponse,
 )
 
+# 격자로 반올림한 (lat, lon)
+Cell = tuple[float, float]
+
+
+# (격자로 반올림한 좌표 + 예보 창 또는 날짜 범위) → Open-Meteo 응답 캐시 (메모리 LRU + SQLite)
+weather_cache = TieredCache(
+    namespace="weather",
+    ttl_seconds=settings.weather_forecast_ttl_seconds,
+    max_memory_entries=settings.weather_cache_memory_size,
+    db_path=settings.weather_cache_db_path,
+    max_db_entries=settings.weather_cache_db_max_entries,
+    stale_seconds=settings.weather_stale_seconds if settings.swr_enabled else 0,
+)
+
+# 만료된 예보는 바로 응답하고 뒤에서 갱신, 자주 보는 격자는 만료 전에 갱신
+weather_revalidator = Revalidator("weather")
+
+WEATHER_REQUESTS = registry.counter(
+    "weather_requests_total", "날씨 조회 수 (kind: current/forecast, result: ok/error/cache_hit/stale_hit)", ("kind", "result")
+)
+
+
+def _cache_metrics():
+    stats = weather_cache.stats()
+    labels = '{namespace="weather"}'
+    return [
+        ("weather_cache_hits", "날씨 캐시 hit 수 (메모리+SQLite)",
+         {labels: stats["memory_hits"] + stats["db_hits"]}),
+        ("weather_cache_misses", "날씨 캐시 miss 수", {labels: stats["misses"]}),
+        ("weather_cache_hit_ratio", "날씨 캐시 hit 비율", {labels: stats["hit_ratio"]}),
+    ]
+
+
+registry.register_collector(_cache_metrics)
+
+
+# 공유 HTTP 클라이언트 (재시도 + 서킷 브레이커, lifespan 에서 start/stop)
+weather_client = http_clients.register(
+    "open-meteo",
+    max_connections=settings.weather_pool_size,
+    connect_timeout=settings.weather_connect_timeout_seconds,
+    read_timeout=settings.weather_read_timeout_seconds,
+)
+
 
 class WeatherService:
+    """
+    Open-Meteo 날씨 조회.
+
+    - 좌표를 settings.weather_grid_deg 격자로 반올림해서 요청/캐시 → 같은 지역 사용자는 캐시를 공유
+    - TTL은 Open-Meteo 갱신 주기에 맞춤 (현재 날씨 15분, 일별 예보 1시간)
+    - 일별 예보는 격자별로 예보 창(어제~16일 뒤) 전체를 캐시하고 요청 기간만 잘라서 응답
+    - 여러 좌표는 콤마로 묶어 요청 1번 (get_forecast_batch, 프리워머)
+    - 호출은 공유 클라이언트(weather_client): 타임아웃 + 재시도 + 서킷 브레이커
+    - 라우터는 *_async 를 쓰고, 스레드에서 도는 동기 코드는 동기 버전을 쓴다. (캐시/파싱은 공유)
+    - 만료 직후에는 stale 값을 바로 주고 뒤에서 갱신 (app/core/swr.py)
+    - 실패한 응답은 캐시하지 않는다.
+    """
+
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
+    @staticmethod
+    def quantize(value: float) -> float:
+        grid = settings.weather_grid_deg
+        return round(round(value / grid) * grid, 4)
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> Cell:
+        return WeatherService.quantize(lat), WeatherService.quantize(lon)
+
+    # ─────────────────────────────
+    # 현재 날씨
+    # ─────────────────────────────
+    @staticmethod
+    def _current_params(cell: Cell) -> Dict[str, Any]:
+        return {"latitude": cell[0], "longitude": cell[1], "current_weather": "true"}
+
+    @staticmethod
+    def _refresh_current(cell: Cell) -> None:
+        data = weather_client.get_json(WeatherService.BASE_URL, WeatherService._current_params(cell))
+        WeatherService._store_current(cell, data)
+
+    @staticmethod
+    def _cached_current(cell: Cell) -> Optional[Dict[str, Any]]:
+        key = f"current:{cell[0]},{cell[1]}"
+        entry = weather_cache.get_entry(key)
+        if entry is None:
+            return None
+        current, expires_at = entry
+        stale = weather_revalidator.observe(
+            key, expires_at, settings.weather_current_ttl_seconds, lambda: WeatherService._refresh_current(cell)
+        )
+        WEATHER_REQUESTS.inc(kind="current", result="stale_hit" if stale else "cache_hit")
+        return current
+
+    @staticmethod
+    def _store_current(cell: Cell, data: Dict[str, Any]) -> Dict[str, Any]:
+        current = data.get("current_weather", {})
+        weather_cache.set(
+            f"current:{cell[0]},{cell[1]}", current, ttl_seconds=settings.weather_current_ttl_seconds
+        )
+        WEATHER_REQUESTS.inc(kind="current", result="ok")
+        return current
+
+    @staticmethod
+    def _current(lat: float, lon: float) -> Dict[str, Any]:
+        """
+        격자 좌표의 current_weather (캐시 우선).
+        """
+        cell = WeatherService._cell(lat, lon)
+        cached = WeatherService._cached_current(cell)
+        if cached is not None:
+            return cached
+        data = weather_client.get_json(WeatherService.BASE_URL, WeatherService._current_params(cell))
+        return WeatherService._store_current(cell, data)
+
+    @staticmethod
+    async def _current_async(lat: float, lon: float) -> Dict[str, Any]:
+        # 캐시(SQLite 단 + 락)는 스레드에서 (이벤트 루프를 막지 않게)
+        cell = WeatherService._cell(lat, lon)
+        cached = await asyncio.to_thread(WeatherService._cached_current, cell)
+        if cached is not None:
+            return cached
+        data = await weather_client.aget_json(WeatherService.BASE_URL, WeatherService._current_params(cell))
+        return await asyncio.to_thread(WeatherService._store_current, cell, data)
+
+    # ─────────────────────────────
+    # 일별 예보
+    # ─────────────────────────────
+    @staticmethod
+    def window_range(today: Optional[date] = None) -> tuple[date, date]:
+        """
+        예보 창: 어제 ~ 오늘 + (weather_window_days - 1).
+        (서버 날짜와 현지 날짜가 하루 어긋나는 지역도 덮도록 하루 앞까지 포함)
+        """
+        today = today or date.today()
+        return today - timedelta(days=1), today + timedelta(days=settings.weather_window_days - 1)
+
+    @staticmethod
+    def _daily_scope(start_date: date, end_date: date) -> tuple[date, date, str]:
+        """
+        (실제로 받을 시작일, 종료일, 캐시 키 범위 부분)
+
+        - 요청 범위가 예보 창 안이면 창 전체를 받아 캐시 → 같은 지역의 어떤 기간 요청이든 같은 항목을 쓴다.
+          (프리워머가 채워두는 것도 이 항목)
+        - 창 밖(과거/먼 미래)은 요청 범위 그대로 캐시
+        """
+        win_start, win_end = WeatherService.window_range()
+        if win_start <= start_date and end_date <= win_end:
+            return win_start, win_end, f"window:{win_start.isoformat()}"
+        return start_date, end_date, f"{start_date.isoformat()}:{end_date.isoformat()}"
+
+    @staticmethod
+    def _daily_params(cells: List[Cell], start_date: date, end_date: date) -> Dict[str, Any]:
+        # Open-Meteo는 좌표를 콤마로 이어 받는다.
+        return {
+            "latitude": ",".join(str(qlat) for qlat, _ in cells),
+            "longitude": ",".join(str(qlon) for _, qlon in cells),
+            "timezone": "auto",
+            "daily": "weathercode,temperature_2m_max,temperature_2m_min",
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }
+
+    @staticmethod
+    def _refresh_daily(cell: Cell, fetch_start: date, fetch_end: date, scope: str) -> None:
+        data = weather_client.get_json(
+            WeatherService.BASE_URL, WeatherService._daily_params([cell], fetch_start, fetch_end)
+        )
+        WeatherService._store_daily({}, [cell], scope, data)
+
+    @staticmethod
+    def _lookup_daily(
+        cells: List[Cell],
+        fetch_start: date,
+        fetch_end: date,
+        scope: str,
+        force: bool,
+    ) -> tuple[Dict[Cell, Dict[str, List[Any]]], List[List[Cell]]]:
+        """
+        (캐시에 있는 격자 → daily 블록, 받아야 할 격자를 weather_batch_size 개씩 나눈 묶음)
+
+        - 만료됐지만 보관 기간(weather_stale_seconds) 안인 블록은 그대로 쓰고 뒤에서 갱신 (weather_revalidator)
+        - force=True 면 캐시를 무시한다. (프리워머)
+        """
+        blocks: Dict[Cell, Dict[str, List[Any]]] = {}
+        missing: List[Cell] = []
+        for cell in dict.fromkeys(cells):
+            key = f"forecast:{cell[0]},{cell[1]}:{scope}"
+            entry = None if force else weather_cache.get_entry(key)
+            if entry is None:
+                missing.append(cell)
+                continue
+
+            daily, expires_at = entry
+            stale = weather_revalidator.observe(
+                key, expires_at, settings.weather_forecast_ttl_seconds,
+                lambda cell=cell: WeatherService._refresh_daily(cell, fetch_start, fetch_end, scope),
+            )
+            WEATHER_REQUESTS.inc(kind="forecast", result="stale_hit" if stale else "cache_hit")
+            blocks[cell] = daily
+
+        size = max(1, settings.weather_batch_size)
+        return blocks, [missing[i:i + size] for i in range(0, len(missing), size)]
+
+    @staticmethod
+    def _store_daily(
+        blocks: Dict[Cell, Dict[str, List[Any]]],
+        chunk: List[Cell],
+        scope: str,
+        data: Any,
+    ) -> None:
+        """
+        묶음 요청 응답(좌표 2개 이상이면 리스트)을 격자별로 캐시에 넣고 blocks 에 채운다.
+        """
+        results = data if isinstance(data, list) else [data]
+        if len(results) != len(chunk):
+            raise ValueError(f"Open-Meteo 응답 수({len(results)})가 요청 좌표 수({len(chunk)})와 다릅니다.")
+        for cell, result in zip(chunk, results):
+            daily = result.get("daily", {})
+            weather_cache.set(
+                f"forecast:{cell[0]},{cell[1]}:{scope}", daily,
+                ttl_seconds=settings.weather_forecast_ttl_seconds,
+            )
+            blocks[cell] = daily
+            WEATHER_REQUESTS.inc(kind="forecast", result="ok")
+
+    @staticmethod
+    def _daily_error(e: Exception) -> None:
+        print(f"Weather Forecast API Error: {e}")
+        WEATHER_REQUESTS.inc(kind="forecast", result="error")
+
+    @staticmethod
+    def _daily_blocks(
+        cells: List[Cell],
+        start_date: date,
+        end_date: date,
+        force: bool = False,
+    ) -> Dict[Cell, Dict[str, List[Any]]]:
+        """
+        격자 좌표별 daily 블록 (캐시 우선, miss 는 묶어서 요청). 실패한 묶음의 좌표는 결과에서 빠진다.
+        """
+        fetch_start, fetch_end, scope = WeatherService._daily_scope(start_date, end_date)
+        blocks, chunks = WeatherService._lookup_daily(cells, fetch_start, fetch_end, scope, force)
+        for chunk in chunks:
+            try:
+                data = weather_client.get_json(
+                    WeatherService.BASE_URL, WeatherService._daily_params(chunk, fetch_start, fetch_end)
+                )
+                WeatherService._store_daily(blocks, chunk, scope, data)
+            except Exception as e:
+                WeatherService._daily_error(e)
+        return blocks
+
+    @staticmethod
+    async def _daily_blocks_async(
+        cells: List[Cell],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[Cell, Dict[str, List[Any]]]:
+        fetch_start, fetch_end, scope = WeatherService._daily_scope(start_date, end_date)
+        # 캐시(SQLite 단 + 락)는 스레드에서 (이벤트 루프를 막지 않게)
+        blocks, chunks = await asyncio.to_thread(
+            WeatherService._lookup_daily, cells, fetch_start, fetch_end, scope, False
+        )
+
+        async def fetch(chunk: List[Cell]) -> None:
+            try:
+                data = await weather_client.aget_json(
+                    WeatherService.BASE_URL, WeatherService._daily_params(chunk, fetch_start, fetch_end)
+                )
+                await asyncio.to_thread(WeatherService._store_daily, blocks, chunk, scope, data)
+            except Exception as e:
+                WeatherService._daily_error(e)
+
+        await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return blocks
+
     @staticmethod
     def _code_to_status_icon(code: int) -> tuple[str, str]:
         """
@@ -31,118 +311,163 @@ class WeatherService:
         else:
             return "악천후", "stormy"
 
+    @staticmethod
+    def _to_weather(current: Dict[str, Any]) -> WeatherResponse:
+        temp = current.get("temperature", 0.0)
+        code = current.get("weathercode", 0)
+
+        # 공통 날씨 코드 -> 상태/아이콘 변환
+        status, icon_type = WeatherService._code_to_status_icon(code)
+
+        description_map = {
+            "sunny": "날씨가 아주 좋습니다! ☀️",
+            "cloudy": "구름이 좀 있지만 활동하기 괜찮아요. ☁️",
+            "foggy": "앞이 잘 안 보여요. 조심하세요. 🌫️",
+            "rainy": "우산을 챙기세요. ☔",
+            "snowy": "눈이 옵니다. 따뜻하게 입으세요. ☃️",
+            "stormy": "날씨가 좋지 않습니다. 실내에 계세요. ⛈️",
+        }
+        description = description_map.get(icon_type, "날씨 정보를 확인했습니다.")
+
+        return WeatherResponse(
+            temperature=temp,
+            status=status,
+            description=description,
+            icon_type=icon_type,
+        )
+
+    @staticmethod
+    def _weather_error(e: Exception) -> WeatherResponse:
+        print(f"Weather API Error: {e}")
+        WEATHER_REQUESTS.inc(kind="current", result="error")
+        return WeatherResponse(
+            temperature=0.0,
+            status="Error",
+            description="날씨 정보를 가져올 수 없습니다.",
+            icon_type="error",
+        )
+
     @staticmethod
     def get_current_weather(lat: float, lon: float) -> WeatherResponse:
         """
         위도/경도 기준 현재 날씨만 가져오는 간단 버전
         """
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current_weather": "true",
-        }
-
         try:
-            response = requests.get(WeatherService.BASE_URL, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            current = data.get("current_weather", {})
-
-            temp = current.get("temperature", 0.0)
-            code = current.get("weathercode", 0)
-
-            # 공통 날씨 코드 -> 상태/아이콘 변환
-            status, icon_type = WeatherService._code_to_status_icon(code)
-
-            description_map = {
-                "sunny": "날씨가 아주 좋습니다! ☀️",
-                "cloudy": "구름이 좀 있지만 활동하기 괜찮아요. ☁️",
-                "foggy": "앞이 잘 안 보여요. 조심하세요. 🌫️",
-                "rainy": "우산을 챙기세요. ☔",
-                "snowy": "눈이 옵니다. 따뜻하게 입으세요. ☃️",
-                "stormy": "날씨가 좋지 않습니다. 실내에 계세요. ⛈️",
-            }
-            description = description_map.get(icon_type, "날씨 정보를 확인했습니다.")
-
-            return WeatherResponse(
-                temperature=temp,
-                status=status,
-                description=description,
-                icon_type=icon_type,
-            )
+            return WeatherService._to_weather(WeatherService._current(lat, lon))
+        except Exception as e:
+            return WeatherService._weather_error(e)
 
+    @staticmethod
+    async def get_current_weather_async(lat: float, lon: float) -> WeatherResponse:
+        try:
+            return WeatherService._to_weather(await WeatherService._current_async(lat, lon))
         except Exception as e:
-            print(f"Weather API Error: {e}")
-            return WeatherResponse(
-                temperature=0.0,
-                status="Error",
-                description="날씨 정보를 가져올 수 없습니다.",
-                icon_type="error",
-            )
+            return WeatherService._weather_error(e)
 
     @staticmethod
-    def get_forecast(
+    def _to_forecast(
         lat: float,
         lon: float,
         start_date: date,
-        days: int,
+        end_date: date,
+        daily: Optional[Dict[str, List[Any]]],
     ) -> WeatherForecastResponse:
-        end_date = start_date + timedelta(days=days - 1)
+        """
+        daily 블록에서 [start_date, end_date] 구간만 잘라 응답으로. (블록이 없으면 빈 응답)
+        """
+        items: list[WeatherDaily] = []
+        daily = daily or {}
 
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "timezone": "auto",
-            "daily": "weathercode,temperature_2m_max,temperature_2m_min",
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-        }
+        dates = daily.get("time", [])
+        max_temps = daily.get("temperature_2m_max", [])
+        min_temps = daily.get("temperature_2m_min", [])
+        codes = daily.get("weathercode", [])
 
-        try:
-            resp = requests.get(WeatherService.BASE_URL, params=params)
-            resp.raise_for_status()
-
-            data = resp.json()
-            daily = data.get("daily", {})
-
-            dates = daily.get("time", [])
-            max_temps = daily.get("temperature_2m_max", [])
-            min_temps = daily.get("temperature_2m_min", [])
-            codes = daily.get("weathercode", [])
-
-            items: list[WeatherDaily] = []
-
-            for d, tmax, tmin, code in zip(dates, max_temps, min_temps, codes):
-                status, icon = WeatherService._code_to_status_icon(int(code))
-
-                items.append(
-                    WeatherDaily(
-                        date=date.fromisoformat(d),
-                        temperature_max=float(tmax),
-                        temperature_min=float(tmin),
-                        status=status,
-                        icon_type=icon,
-                    )
-                )
+        for d, tmax, tmin, code in zip(dates, max_temps, min_temps, codes):
+            day = date.fromisoformat(d)
+            # 예보 창 끝쪽은 값이 비어(null) 오는 날이 있다.
+            if not (start_date <= day <= end_date) or None in (tmax, tmin, code):
+                continue
+            status, icon = WeatherService._code_to_status_icon(int(code))
 
-            return WeatherForecastResponse(
-                lat=lat,
-                lon=lon,
-                start_date=start_date,
-                end_date=end_date.isoformat(),  # ✅ 문자열로 넣기
-                days=len(items),
-                daily=items,
+            items.append(
+                WeatherDaily(
+                    date=day,
+                    temperature_max=float(tmax),
+                    temperature_min=float(tmin),
+                    status=status,
+                    icon_type=icon,
+                )
             )
 
-        except Exception as e:
-            print(f"Weather Forecast API Error: {e}")
-            # ✅ 실패해도 end_date 채워주기
-            return WeatherForecastResponse(
-                lat=lat,
-                lon=lon,
-                start_date=start_date,
-                end_date=end_date.isoformat(),
-                days=0,
-                daily=[],
-            )
\ No newline at end of file
+        return WeatherForecastResponse(
+            lat=lat,
+            lon=lon,
+            start_date=start_date,
+            end_date=end_date.isoformat(),  # ✅ 실패해도 end_date 채워주기
+            days=len(items),
+            daily=items,
+        )
+
+    @staticmethod
+    def get_forecast_batch(
+        points: List[tuple[float, float]],
+        start_date: date,
+        days: int,
+    ) -> List[WeatherForecastResponse]:
+        """
+        여러 (lat, lon) 의 같은 기간 예보. 입력 순서대로 반환.
+        격자가 같은 좌표는 한 번만 조회하고, 캐시에 없는 격자만 묶어서 요청한다.
+        """
+        end_date = start_date + timedelta(days=days - 1)
+        cells = [WeatherService._cell(lat, lon) for lat, lon in points]
+        blocks = WeatherService._daily_blocks(cells, start_date, end_date)
+
+        return [
+            WeatherService._to_forecast(lat, lon, start_date, end_date, blocks.get(cell))
+            for (lat, lon), cell in zip(points, cells)
+        ]
+
+    @staticmethod
+    async def get_forecast_batch_async(
+        points: List[tuple[float, float]],
+        start_date: date,
+        days: int,
+    ) -> List[WeatherForecastResponse]:
+        end_date = start_date + timedelta(days=days - 1)
+        cells = [WeatherService._cell(lat, lon) for lat, lon in points]
+        blocks = await WeatherService._daily_blocks_async(cells, start_date, end_date)
+
+        return [
+            WeatherService._to_forecast(lat, lon, start_date, end_date, blocks.get(cell))
+            for (lat, lon), cell in zip(points, cells)
+        ]
+
+    @staticmethod
+    def get_forecast(
+        lat: float,
+        lon: float,
+        start_date: date,
+        days: int,
+    ) -> WeatherForecastResponse:
+        return WeatherService.get_forecast_batch([(lat, lon)], start_date, days)[0]
+
+    @staticmethod
+    async def get_forecast_async(
+        lat: float,
+        lon: float,
+        start_date: date,
+        days: int,
+    ) -> WeatherForecastResponse:
+        return (await WeatherService.get_forecast_batch_async([(lat, lon)], start_date, days))[0]
+
+    @staticmethod
+    def prewarm(points: List[tuple[float, float]]) -> int:
+        """
+        좌표들의 예보 창을 캐시를 무시하고 새로 받아 채운다. 갱신된 격자 수를 반환.
+        """
+        cells = list(dict.fromkeys(WeatherService._cell(lat, lon) for lat, lon in points))
+        if not cells:
+            return 0
+        win_start, win_end = WeatherService.window_range()
+        return len(WeatherService._daily_blocks(cells, win_start, win_end, force=True))
@@ -0,0 +1,18 @@
+# backend/tests/conftest.py
+"""
+단위 테스트 공통 설정.
+
+app.core.config.Settings 는 DATABASE_URL 이 필수라서 app 을 import 하기 전에 임시 값을 넣는다.
+캐시 SQLite 파일은 만들지 않도록 메모리만 사용.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/cloudycc_test.db")
+os.environ.setdefault("LLM_CACHE_DB_PATH", "")
+os.environ.setdefault("WEATHER_CACHE_DB_PATH", "")
+os.environ.setdefault("DISTANCE_CACHE_DB_PATH", "")
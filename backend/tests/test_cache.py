@@ -0,0 +1,70 @@
+# backend/tests/test_cache.py
+import time
+
+from app.core.cache import TieredCache
+
+
+def test_memory_hit_and_miss():
+    cache = TieredCache("t", ttl_seconds=60)
+    assert cache.get("a") is None
+    cache.set("a", {"v": 1})
+    assert cache.get("a") == {"v": 1}
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["sets"]) == (1, 1, 1)
+
+
+def test_expired_entry_is_not_returned():
+    cache = TieredCache("t", ttl_seconds=60)
+    cache.set("a", 1, ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.get_entry("a") is None
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = TieredCache("t", ttl_seconds=60, max_memory_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")          # a 가 최근 사용
+    cache.set("c", 3)       # b 가 밀려남
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_tier_survives_new_instance(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite3")
+    TieredCache("t", ttl_seconds=60, db_path=db_path).set("a", [1, 2])
+
+    reopened = TieredCache("t", ttl_seconds=60, db_path=db_path)
+    assert reopened.get("a") == [1, 2]
+    assert reopened.stats()["db_hits"] == 1
+    # 디스크에서 찾은 값은 메모리로 올라온다.
+    assert reopened.get("a") == [1, 2]
+    assert reopened.stats()["memory_hits"] == 1
+
+
+def test_namespaces_do_not_collide(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite3")
+    TieredCache("x", ttl_seconds=60, db_path=db_path).set("k", "x")
+    TieredCache("y", ttl_seconds=60, db_path=db_path).set("k", "y")
+    assert TieredCache("x", ttl_seconds=60, db_path=db_path).get("k") == "x"
+
+
+def test_stale_window_served_by_get_entry_only(tmp_path):
+    cache = TieredCache("t", ttl_seconds=60, db_path=str(tmp_path / "c.sqlite3"), stale_seconds=60)
+    cache.set("a", 1, ttl_seconds=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    value, expires_at = cache.get_entry("a")
+    assert value == 1 and expires_at <= time.time()
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_entry_dropped_after_stale_window():
+    cache = TieredCache("t", ttl_seconds=60, stale_seconds=0.01)
+    cache.set("a", 1, ttl_seconds=0.01)
+    time.sleep(0.03)
+    assert cache.get_entry("a") is None
@@ -0,0 +1,41 @@
+# backend/tests/test_cluster_service.py
+import math
+from types import SimpleNamespace
+
+from app.services.cluster_service import ClusterService
+
+
+def _lm(id, lat, lng):
+    return SimpleNamespace(id=id, lat=lat, lng=lng)
+
+
+# 서쪽 묶음 3개 / 동쪽 묶음 3개 (도쿄 근처, 약 20km 떨어짐)
+WEST = [_lm(1, 35.68, 139.50), _lm(2, 35.69, 139.51), _lm(3, 35.67, 139.52)]
+EAST = [_lm(4, 35.68, 139.75), _lm(5, 35.69, 139.76), _lm(6, 35.70, 139.74)]
+
+
+def test_groups_nearby_landmarks_and_orders_west_to_east():
+    days = ClusterService.cluster(EAST + WEST, 2)
+    assert {days[lm.id] for lm in WEST} == {0}
+    assert {days[lm.id] for lm in EAST} == {1}
+
+
+def test_capacity_is_balanced():
+    landmarks = WEST + EAST + [_lm(7, 35.68, 139.505)]
+    days = ClusterService.cluster(landmarks, 2)
+    counts = [list(days.values()).count(d) for d in range(2)]
+    assert max(counts) <= math.ceil(len(landmarks) / 2)
+
+
+def test_deterministic_regardless_of_input_order():
+    assert ClusterService.cluster(WEST + EAST, 3) == ClusterService.cluster(list(reversed(WEST + EAST)), 3)
+
+
+def test_more_days_than_landmarks():
+    days = ClusterService.cluster(WEST[:2], 4)
+    assert sorted(days.values()) == [0, 1]
+
+
+def test_trivial_inputs():
+    assert ClusterService.cluster([], 3) == {}
+    assert ClusterService.cluster(WEST, 1) == {1: 0, 2: 0, 3: 0}
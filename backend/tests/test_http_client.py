@@ -0,0 +1,133 @@
+# backend/tests/test_http_client.py
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.core.http_client import CircuitBreaker, UpstreamClient, UpstreamError
+
+
+def _client(handler, failure_threshold=2, reset_seconds=0.05, retries=0) -> UpstreamClient:
+    client = UpstreamClient(
+        name="test",
+        max_connections=4,
+        connect_timeout=1,
+        read_timeout=1,
+        retries=retries,
+        backoff_seconds=0,
+        breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_seconds=reset_seconds),
+    )
+    client._async = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._sync = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _json_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"ok": True})
+
+
+def _open_then_half_open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(breaker.reset_seconds + 0.01)
+    assert breaker.state == "half_open"
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    _open_then_half_open(breaker)
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 호출 진행 중
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=0.05)
+    _open_then_half_open(breaker)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_retries_server_errors_then_succeeds():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503) if len(calls) < 3 else httpx.Response(200, json={"n": len(calls)})
+
+    client = _client(handler, retries=2)
+    assert client.get_json("http://upstream/") == {"n": 3}
+    assert client.breaker.state == "closed"
+
+
+def test_client_error_is_not_a_breaker_failure():
+    client = _client(lambda request: httpx.Response(404), failure_threshold=1)
+    with pytest.raises(UpstreamError):
+        client.get_json("http://upstream/")
+    assert client.breaker.state == "closed"
+
+
+def test_cancelled_probe_releases_half_open_without_failure():
+    """
+    회귀: half-open 시험 호출이 취소되면 _probing 이 남아서 allow() 가 영원히 False 였다.
+    취소는 upstream 실패가 아니므로 breaker 를 다시 열지도 않는다.
+    """
+    async def slow(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    client = _client(slow, failure_threshold=1)
+    _open_then_half_open(client.breaker)
+
+    async def run():
+        task = asyncio.ensure_future(client.aget_json("http://upstream/"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert client.breaker.state == "half_open"
+    assert client.breaker.allow()
+
+
+def test_cancellations_do_not_open_closed_breaker():
+    async def slow(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    client = _client(slow, failure_threshold=2)
+
+    async def run():
+        for _ in range(5):
+            task = asyncio.ensure_future(client.aget_json("http://upstream/"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert client.breaker.state == "closed"
+
+
+def test_decode_error_counts_as_failure_and_releases_probe():
+    client = _client(lambda request: httpx.Response(200, content=b"not json"), failure_threshold=1)
+    _open_then_half_open(client.breaker)
+    with pytest.raises(json.JSONDecodeError):
+        client.get_json("http://upstream/")
+    assert client.breaker.state == "open"
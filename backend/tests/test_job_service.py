@@ -0,0 +1,85 @@
+# backend/tests/test_job_service.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.services.job_service import (
+    JOB_QUEUED,
+    JOB_RUNNING,
+    DatabaseJobStore,
+    ItineraryJobQueue,
+    JobStore,
+)
+
+
+@pytest.fixture
+def store():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    db.query(models.ItineraryJob).delete()
+    db.commit()
+    db.close()
+    return DatabaseJobStore()
+
+
+def _set(job_id: str, **fields) -> None:
+    db = SessionLocal()
+    db.query(models.ItineraryJob).filter(models.ItineraryJob.id == job_id).update(fields)
+    db.commit()
+    db.close()
+
+
+def test_job_store_is_abstract():
+    with pytest.raises(TypeError):
+        JobStore()
+
+
+def test_claim_is_exclusive(store):
+    job = store.create({"days": 1})
+    assert store.claim(job.job_id)
+    assert not store.claim(job.job_id)
+    assert store.get(job.job_id).status == JOB_RUNNING
+    assert store.unfinished_ids() == []
+
+
+def test_expired_lease_of_dead_owner_is_reclaimable(store):
+    live = store.create({"days": 1})
+    dead = store.create({"days": 2})
+    _set(live.job_id, status=JOB_RUNNING, owner="other", lease_expires_at=datetime.utcnow() + timedelta(minutes=5))
+    _set(dead.job_id, status=JOB_RUNNING, owner="other", lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+
+    assert store.unfinished_ids() == [dead.job_id]
+    assert not store.claim(live.job_id)
+    assert store.claim(dead.job_id)
+
+
+def test_job_with_itinerary_is_never_claimed_again(store):
+    job = store.create({"days": 1})
+    _set(job.job_id, status=JOB_QUEUED, itinerary_id=123)
+    assert not store.claim(job.job_id)
+
+
+def test_release_owned_requeues_running_jobs(store):
+    job = store.create({"days": 1})
+    assert store.claim(job.job_id)
+    store.release_owned()
+    assert store.get(job.job_id).status == JOB_QUEUED
+    assert store.unfinished_ids() == [job.job_id]
+
+
+def test_reclaim_enqueues_each_job_once(store):
+    queue = ItineraryJobQueue(store=store, workers=0, max_pending=10)
+    job = store.create({"days": 1})
+
+    async def run():
+        queue._queue = asyncio.Queue()
+        first = await queue._reclaim()
+        second = await queue._reclaim()
+        return first, second, queue._queue.qsize()
+
+    assert asyncio.run(run()) == (1, 0, 1)
+    assert job.job_id in queue._enqueued
@@ -0,0 +1,55 @@
+# backend/tests/test_plan_stream_parser.py
+import json
+
+import pytest
+
+from app.services.plan_stream_parser import PlanStreamParser
+
+PLAN = {
+    "overview": {"title": "도쿄 {2일}", "summary": "따옴표 \"와\" 괄호 ] } 포함", "highlights": ["a", "b"]},
+    "daily_plan": [
+        {"day": 1, "title": "Day 1", "reason": "r", "landmarks": [{"name": "x", "order": 1}]},
+        {"day": 2, "title": "Day 2 \\ 백슬래시", "reason": "r", "landmarks": []},
+    ],
+    "tips": {"packing": ["우산"], "local": []},
+}
+
+
+def _feed(text: str, size: int):
+    parser = PlanStreamParser()
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return parser, events
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 10_000])
+def test_events_independent_of_chunking(size):
+    text = json.dumps(PLAN, ensure_ascii=False, indent=2)
+    parser, events = _feed(text, size)
+
+    assert events == [
+        ("overview", PLAN["overview"]),
+        ("day", PLAN["daily_plan"][0]),
+        ("day", PLAN["daily_plan"][1]),
+    ]
+    assert parser.text == text
+
+
+def test_ignores_code_fence_before_json():
+    text = "```json\n" + json.dumps(PLAN, ensure_ascii=False) + "\n```"
+    _, events = _feed(text, 5)
+    assert [e for e, _ in events] == ["overview", "day", "day"]
+
+
+def test_nested_objects_inside_day_are_not_emitted():
+    _, events = _feed(json.dumps(PLAN), 4)
+    # landmarks 안의 객체나 tips 는 이벤트가 아니다.
+    assert len(events) == 3
+
+
+def test_incomplete_stream_emits_only_finished_parts():
+    text = json.dumps(PLAN)
+    cut = text.index('"day": 2')
+    _, events = _feed(text[:cut], 3)
+    assert [e for e, _ in events] == ["overview", "day"]
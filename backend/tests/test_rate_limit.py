@@ -0,0 +1,42 @@
+# backend/tests/test_rate_limit.py
+import asyncio
+import time
+
+from app.core.rate_limit import TokenBucket
+
+
+def test_burst_up_to_capacity_is_immediate():
+    bucket = TokenBucket(rate_per_sec=1, capacity=3)
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) < 0.05
+
+
+def test_acquire_waits_for_refill():
+    bucket = TokenBucket(rate_per_sec=20, capacity=1)
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    # 첫 토큰은 바로, 나머지 4개는 1/20 초씩
+    elapsed = asyncio.run(run())
+    assert 0.18 <= elapsed < 0.5
+
+
+def test_concurrent_acquires_respect_rate():
+    bucket = TokenBucket(rate_per_sec=50, capacity=1)
+
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.09
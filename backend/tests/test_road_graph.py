@@ -0,0 +1,81 @@
+# backend/tests/test_road_graph.py
+import heapq
+import math
+
+import numpy as np
+
+from app.services.road_graph import RoadGraph, _haversine_m
+
+
+def _random_graph(rng, n: int = 60, m: int = 150):
+    # 서울 시내 크기(약 10km) 안의 노드, 간선 길이는 직선거리 이상 (실제 도로처럼)
+    lat = 37.5 + rng.random(n) * 0.1
+    lng = 127.0 + rng.random(n) * 0.1
+    src = rng.integers(0, n, m)
+    dst = rng.integers(0, n, m)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    length = _haversine_m(lat[src], lng[src], lat[dst], lng[dst]) * (1.0 + rng.random(len(src)) * 0.5)
+    return lat, lng, src, dst, length
+
+
+def _dijkstra(graph: RoadGraph, source: int, target: int) -> float:
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == target:
+            return d
+        if d > dist[u]:
+            continue
+        for e in range(graph.indptr[u], graph.indptr[u + 1]):
+            v = int(graph.indices[e])
+            nd = d + float(graph.length_m[e])
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return math.inf
+
+
+def test_matches_dijkstra_on_random_queries():
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        graph = RoadGraph.from_edges(*_random_graph(rng))
+        for _ in range(200):
+            s, t = (int(x) for x in rng.integers(0, graph.node_count, 2))
+            expected = _dijkstra(graph, s, t)
+            actual = graph.shortest_distance(s, t)
+            if math.isinf(expected):
+                assert math.isinf(actual)
+            else:
+                assert math.isclose(actual, expected, rel_tol=1e-6, abs_tol=1e-3)
+
+
+def test_direction_and_unreachable():
+    # 0 → 1 → 2 일방통행, 3 은 고립
+    lat = [37.50, 37.51, 37.52, 37.60]
+    lng = [127.00, 127.00, 127.00, 127.10]
+    graph = RoadGraph.from_edges(lat, lng, [0, 1], [1, 2])
+
+    forward = graph.shortest_distance(0, 2)
+    assert math.isclose(forward, _haversine_m(37.50, 127.00, 37.52, 127.00), rel_tol=1e-5)
+    assert math.isinf(graph.shortest_distance(2, 0))
+    assert math.isinf(graph.shortest_distance(0, 3))
+    assert graph.shortest_distance(1, 1) == 0.0
+
+
+def test_save_load_and_nearest_node(tmp_path):
+    rng = np.random.default_rng(1)
+    graph = RoadGraph.from_edges(*_random_graph(rng, n=20, m=60))
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+    loaded = RoadGraph.load(path)
+
+    assert loaded.node_count == graph.node_count
+    assert loaded.shortest_distance(0, 5) == graph.shortest_distance(0, 5)
+
+    node, snap_m = loaded.nearest_node(float(graph.lat[7]), float(graph.lng[7]) + 1e-6)
+    assert node == 7
+    assert snap_m < 1.0
+    assert loaded.contains(float(graph.lat[7]), float(graph.lng[7]))
+    assert not loaded.contains(35.0, 129.0)
@@ -0,0 +1,48 @@
+# backend/tests/test_route_service.py
+import itertools
+
+import numpy as np
+
+from app.services.route_service import RouteService
+
+
+def _euclidean(points) -> np.ndarray:
+    points = np.asarray(points, dtype=float)
+    return np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+
+
+def _brute_force(dist: np.ndarray) -> float:
+    return min(RouteService.path_length(list(p), dist) for p in itertools.permutations(range(len(dist))))
+
+
+def test_points_on_a_line_are_visited_in_order():
+    xs = [5, 1, 4, 0, 3, 2]
+    dist = _euclidean([[x, 0] for x in xs])
+    path = RouteService.solve(dist)
+    assert [xs[i] for i in path] in ([0, 1, 2, 3, 4, 5], [5, 4, 3, 2, 1, 0])
+
+
+def test_two_opt_removes_crossing():
+    # 0 → 2 → 1 → 3 은 교차, 0 → 1 → 2 → 3 이 최적
+    dist = _euclidean([[0, 0], [1, 0], [1, 1], [0, 1]])
+    path = RouteService.two_opt([0, 2, 1, 3], dist)
+    assert RouteService.path_length(path, dist) == 3.0
+
+
+def test_solve_on_random_instances():
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        dist = _euclidean(rng.random((7, 2)))
+        path = RouteService.solve(dist)
+
+        assert sorted(path) == list(range(7))
+        length = RouteService.path_length(path, dist)
+        nn_best = min(RouteService.path_length(RouteService.nearest_neighbour(dist, s), dist) for s in range(7))
+        assert length <= nn_best + 1e-9
+        # 모든 출발점 NN + 2-opt 라 작은 입력에서는 최적에 가깝다.
+        assert length <= _brute_force(dist) * 1.05
+
+
+def test_small_inputs_keep_order():
+    assert RouteService.solve(np.zeros((0, 0))) == []
+    assert RouteService.solve(_euclidean([[0, 0], [1, 1]])) == [0, 1]
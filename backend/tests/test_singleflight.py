@@ -0,0 +1,70 @@
+# backend/tests/test_singleflight.py
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("t")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"name": "t", "inflight": 0, "leaders": 1, "followers": 4}
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight("t")
+
+    async def run():
+        return await asyncio.gather(
+            flight.do("a", lambda: asyncio.sleep(0.01, result="a")),
+            flight.do("b", lambda: asyncio.sleep(0.01, result="b")),
+        )
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert flight.leaders == 2
+
+
+def test_exception_is_shared_and_key_is_released():
+    flight = SingleFlight("t")
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        results = await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+        # 끝난 뒤에는 새 호출이 다시 실행된다.
+        again = await flight.do("k", lambda: asyncio.sleep(0, result="ok"))
+        return results, again
+
+    results, again = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert again == "ok"
+    assert flight.leaders == 2
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight("t")
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.05, result="done")))
+        second = asyncio.ensure_future(flight.do("k", lambda: asyncio.sleep(0.05, result="other")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"